@@ -3,9 +3,10 @@
 Add VIN Scanner missing translations to EN, ES, PT-BR
 """
 
-import json
 import sys
-from pathlib import Path
+
+from i18n_tools.benchmark import load_budgets
+from i18n_tools.patch_engine import PatchSet, apply_patch_sets, print_result
 
 # Translation data for all 102 missing keys
 TRANSLATIONS = {
@@ -381,54 +382,8 @@ TRANSLATIONS = {
 }
 
 
-def add_translations_to_json(file_path: Path, lang: str) -> bool:
-    """Add VIN Scanner translations to JSON file."""
-    try:
-        # Read existing JSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        print(f"[OK] Loaded {file_path.name} ({len(json.dumps(data))} bytes)")
-
-        # Get translations for this language
-        new_translations = TRANSLATIONS[lang]
-
-        # Track changes
-        added_keys = 0
-        updated_keys = 0
-
-        # Add each section
-        for section, keys in new_translations.items():
-            if section not in data:
-                data[section] = {}
-                print(f"  + Created new section: {section}")
-
-            # Add/update keys
-            for key, value in keys.items():
-                full_key = f"{section}.{key}"
-                if key not in data[section]:
-                    added_keys += 1
-                    print(f"  + Added: {full_key}")
-                elif data[section][key] != value:
-                    updated_keys += 1
-                    print(f"  ~ Updated: {full_key}")
-
-                data[section][key] = value
-
-        # Write back to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        print(f"[OK] Saved {file_path.name}")
-        print(f"  Added: {added_keys} keys")
-        print(f"  Updated: {updated_keys} keys")
-        print()
-
-        return True
-
-    except Exception as e:
-        print(f"[ERROR] Processing {file_path.name}: {e}")
-        return False
+# Same data as a patch set, so it can be queued alongside other features
+PATCH_SET = PatchSet(name="vin-scanner", translations=TRANSLATIONS)
 
 
 def main():
@@ -438,26 +393,21 @@ def main():
     print("=" * 60)
     print()
 
-    base_dir = Path(__file__).parent.parent / "public" / "translations"
-
-    files = {
-        "en": base_dir / "en.json",
-        "es": base_dir / "es.json",
-        "pt-BR": base_dir / "pt-BR.json"
-    }
+    # Monolithic and split namespace files for every language, one process per file
+    results = apply_patch_sets([PATCH_SET], namespaces=True, jobs=0, guard=True, snapshot=True,
+                               budgets=load_budgets())
 
-    success_count = 0
+    for result in results:
+        print(f"Processing {result.display_name}...")
+        print_result(result)
 
-    for lang, file_path in files.items():
-        print(f"Processing {lang.upper()} translations...")
-        if add_translations_to_json(file_path, lang):
-            success_count += 1
+    success_count = sum(1 for result in results if result.ok)
 
     print("=" * 60)
-    print(f"COMPLETE: {success_count}/3 files updated successfully")
+    print(f"COMPLETE: {success_count}/{len(results)} files updated successfully")
     print("=" * 60)
 
-    if success_count == 3:
+    if success_count == len(results):
         print()
         print("[SUCCESS] All VIN Scanner translations added!")
         print("  - 5 sections added per language")
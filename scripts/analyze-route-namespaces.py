@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Analyze which translation namespaces each route needs
+
+Walks the <Route> tree in src/App.tsx, follows imports through src/pages,
+src/components and src/hooks, and resolves t('ns.key') lookups to
+namespaces. Writes public/translations/_compiled/routes.json:
+
+  {"shell": [...], "routes": {"/sales": {"namespaces": [...], ...}}}
+
+With --bundles it also writes one merged bundle per route and language
+(en/routes/sales.<hash>.json) so a route can load in a single request.
+
+Usage:
+  python scripts/analyze-route-namespaces.py
+  python scripts/analyze-route-namespaces.py --route /detail-hub/*
+  python scripts/analyze-route-namespaces.py --bundles
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.compiler import COMPILED_DIR, load_sources
+from i18n_tools.fallback import resolve_fallbacks
+from i18n_tools.route_analyzer import (
+    ROUTES_MANIFEST_NAME,
+    analyze_routes,
+    emit_route_bundles,
+    remove_stale_bundles,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Per-route translation namespace analyzer")
+    parser.add_argument("--out", type=Path, default=COMPILED_DIR, help="Output directory")
+    parser.add_argument("--route", help="Only print the namespaces for this route")
+    parser.add_argument("--bundles", action="store_true", help="Also emit merged per-route bundles")
+    parser.add_argument("--no-precompress", action="store_true", help="Skip .gz/.br bundle siblings")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    print("=" * 60)
+    print("Route Namespace Analysis")
+    print("=" * 60)
+    print()
+
+    manifest = analyze_routes()
+
+    if args.route:
+        entry = manifest["routes"].get(args.route)
+        if entry is None:
+            print(f"[ERROR] Unknown route: {args.route}")
+            print(f"  Known routes: {', '.join(manifest['routes'])}")
+            return 1
+        print(f"{args.route}: {len(entry['namespaces'])} namespaces")
+        for namespace in entry["namespaces"]:
+            print(f"  - {namespace}")
+        return 0
+
+    if args.bundles:
+        # Same build source as compile-translations.py: gaps filled from English
+        sources, _ = resolve_fallbacks(load_sources(LANGUAGES))
+        manifest["bundles"] = emit_route_bundles(manifest, sources, args.out, not args.no_precompress)
+        for name in remove_stale_bundles(manifest["bundles"], args.out):
+            print(f"  - Removed stale bundle: {name}")
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    out_path = args.out / ROUTES_MANIFEST_NAME
+    out_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    print(f"Shell (every route): {len(manifest['shell'])} namespaces")
+    for route, entry in manifest["routes"].items():
+        flag = f"  [{entry['unresolved']} dynamic keys]" if entry["unresolved"] else ""
+        print(f"  {route:<32} {len(entry['namespaces']):>3} namespaces{flag}")
+
+    print()
+    print("=" * 60)
+    print(f"COMPLETE: {len(manifest['routes'])} routes written to {out_path}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
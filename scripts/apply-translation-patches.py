@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Apply every queued translation patch set in one pass per language
+
+Patch sets live in scripts/translation-patches/*.json (see the README there).
+Each language file is loaded once, all pending patch sets are merged in name
+order, and the file is only rewritten if its content actually changed - so
+applying 20 patch sets costs about the same as applying one.
+
+Usage:
+  python scripts/apply-translation-patches.py                 # whole queue
+  python scripts/apply-translation-patches.py a.json b.json   # specific sets
+  python scripts/apply-translation-patches.py --dry-run
+  python scripts/apply-translation-patches.py --splice        # in-place section splice
+  python scripts/apply-translation-patches.py --namespaces --jobs 0   # + split files, all cores
+  python scripts/apply-translation-patches.py --check-usage   # warn about keys no source file uses
+  python scripts/apply-translation-patches.py --check-duplicates   # warn about values that already exist
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from i18n_tools.benchmark import load_budgets
+from i18n_tools.key_index import load_index, unused_patch_keys
+from i18n_tools.parity import ParityError
+from i18n_tools.patch_engine import (
+    PATCH_QUEUE_DIR,
+    PatchSet,
+    apply_patch_sets,
+    load_patch_queue,
+    print_result,
+)
+from i18n_tools.search_index import duplicate_patch_values, load_search_index
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Apply queued translation patch sets")
+    parser.add_argument("patches", nargs="*", type=Path,
+                        help="Patch set files (default: every *.json in the queue)")
+    parser.add_argument("--dry-run", action="store_true", help="Merge and report without writing")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only patch this language (repeatable)")
+    parser.add_argument("--splice", action="store_true",
+                        help="Rewrite only the touched sections in place (minimal diffs)")
+    parser.add_argument("--namespaces", action="store_true",
+                        help="Also patch the split public/translations/{lng}/{ns}.json files")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for (language, namespace) units (0 = one per CPU)")
+    parser.add_argument("--no-guard", action="store_true",
+                        help="Skip the cross-language parity/placeholder check of patched keys")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="Do not record the files in the snapshot store (translation-snapshots.py)")
+    parser.add_argument("--no-budgets", action="store_true",
+                        help="Do not enforce scripts/translation-budgets.json")
+    parser.add_argument("--check-usage", action="store_true",
+                        help="Warn about patched keys that no source file looks up (uses the key index)")
+    parser.add_argument("--check-duplicates", action="store_true",
+                        help="Warn about new values that (nearly) duplicate existing ones (uses the search index)")
+    parser.add_argument("--quiet", action="store_true", help="Only print per-file totals")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    print("=" * 60)
+    print("Translation Patch Queue")
+    print("=" * 60)
+    print()
+
+    if args.patches:
+        patch_sets = [PatchSet.from_file(path) for path in args.patches]
+    else:
+        patch_sets = load_patch_queue()
+
+    if not patch_sets:
+        print(f"[OK] Nothing to apply ({PATCH_QUEUE_DIR} is empty)")
+        return 0
+
+    print(f"Applying {len(patch_sets)} patch set(s):")
+    for patch_set in patch_sets:
+        print(f"  - {patch_set.name}")
+    print()
+
+    if args.check_usage:
+        index, _ = load_index()
+        for name, keys in unused_patch_keys(index, patch_sets).items():
+            print(f"[WARN] {name}: {len(keys)} key(s) not used in src/")
+            for key in keys:
+                print(f"  ? {key}")
+        print()
+
+    if args.check_duplicates:
+        search_index, _ = load_search_index()
+        for name, entries in duplicate_patch_values(search_index, patch_sets).items():
+            print(f"[WARN] {name}: {len(entries)} value(s) already exist")
+            for lang, key, value, matches in entries:
+                print(f"  ? {lang} {key} = {value!r}")
+                for match in matches[:3]:
+                    print(f"      ~ {match.key} = {match.value!r} ({match.similarity:.2f})")
+        print()
+
+    try:
+        results = apply_patch_sets(patch_sets, languages=args.languages, dry_run=args.dry_run,
+                                   splice=args.splice, namespaces=args.namespaces, jobs=args.jobs,
+                                   guard=not args.no_guard, snapshot=not args.no_snapshot,
+                                   budgets=None if args.no_budgets else load_budgets())
+    except ParityError as e:
+        print(f"[ERROR] {e} - nothing written (use --no-guard to override)")
+        for issue in e.issues:
+            print(f"  ! {issue}")
+        return 1
+
+    for result in results:
+        print(f"Processing {result.display_name}...")
+        print_result(result, verbose=not args.quiet)
+
+    failed = [r for r in results if not r.ok]
+    written = [r for r in results if r.written]
+
+    print("=" * 60)
+    print(f"COMPLETE: {len(written)} written, {len(results) - len(written) - len(failed)} unchanged, "
+          f"{len(failed)} failed{' (dry run)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
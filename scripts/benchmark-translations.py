@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark translation payloads and enforce size/parse budgets
+
+For each language, measures the monolithic {lng}.json and every split
+{lng}/{ns}.json file: raw, gzip (and brotli) bytes, parse time and key count.
+Each run is appended to .cache/i18n/benchmark-history.jsonl and compared with
+the previous one; any file over scripts/translation-budgets.json fails the run.
+
+Usage:
+  python scripts/benchmark-translations.py
+  python scripts/benchmark-translations.py --lang es --top 20
+  python scripts/benchmark-translations.py --no-record
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from i18n_tools.benchmark import (
+    BUDGETS_PATH,
+    brotli,
+    check_budgets,
+    load_budgets,
+    load_history,
+    record_history,
+    run_benchmark,
+)
+from i18n_tools.common import LANGUAGES
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translation payload benchmark")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only benchmark this language (repeatable)")
+    parser.add_argument("--repeats", type=int, default=5, help="Parse runs per file (best is kept)")
+    parser.add_argument("--top", type=int, default=5, help="Largest namespaces to list per language")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH, help="Budgets file")
+    parser.add_argument("--no-record", action="store_true", help="Do not append to the history")
+    return parser.parse_args()
+
+
+def _fmt(measurement) -> str:
+    br = f", {measurement.br / 1024:.1f} KB br" if measurement.br is not None else ""
+    return (f"{measurement.bytes / 1024:>7.1f} KB, {measurement.gzip / 1024:.1f} KB gzip{br}, "
+            f"{measurement.parse_ms:.2f} ms parse, {measurement.keys} keys")
+
+
+def _delta(current: int, previous) -> str:
+    if previous is None or previous == current:
+        return ""
+    return f"  ({current - previous:+d} bytes)"
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    languages = args.languages or list(LANGUAGES)
+
+    print("=" * 60)
+    print("Translation Payload Benchmark")
+    print("=" * 60)
+    print()
+
+    if brotli is None:
+        print("[WARN] brotli module not installed - brotli sizes skipped")
+        print()
+
+    history = load_history()
+    previous = history[-1]["languages"] if history else {}
+    results = run_benchmark(languages, repeats=args.repeats)
+
+    for lang, entry in results.items():
+        before = previous.get(lang, {})
+        print(f"{lang}:")
+        if entry["monolithic"] is not None:
+            old = (before.get("monolithic") or {}).get("bytes")
+            print(f"  monolithic  {_fmt(entry['monolithic'])}{_delta(entry['monolithic'].bytes, old)}")
+        split_total = entry["split_total"]
+        old = (before.get("split_total") or {}).get("bytes")
+        print(f"  split ({len(entry['namespaces'])})  {_fmt(split_total)}{_delta(split_total.bytes, old)}")
+        largest = sorted(entry["namespaces"].items(), key=lambda item: item[1].bytes, reverse=True)
+        for namespace, measurement in largest[:args.top]:
+            old = before.get("namespaces", {}).get(namespace, {}).get("bytes")
+            print(f"    {namespace:<28} {_fmt(measurement)}{_delta(measurement.bytes, old)}")
+        print()
+
+    if not args.no_record:
+        record_history(results)
+
+    violations = check_budgets(results, load_budgets(args.budgets))
+    for violation in violations:
+        print(f"[ERROR] {violation}")
+
+    print("=" * 60)
+    print(f"COMPLETE: {len(violations)} budget violation(s)"
+          + ("" if args.no_record else f", run {len(history) + 1} recorded"))
+    print("=" * 60)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Publish translation delta patches between app versions
+
+For each language, diffs an older translation version against the current
+one and writes a small delta file that upgrades a client's cached copy:
+
+  public/translations/_compiled/deltas/es/1.3.93..1.4.0.json
+  public/translations/_compiled/deltas/index.json   {lang: {to: {from: entry}}}
+
+A version is a git revision, a translations directory, or 'worktree'. Labels
+default to the package.json version at that ref (what APP_VERSION uses);
+pass LABEL=REF to override.
+
+Usage:
+  python scripts/build-translation-deltas.py --from HEAD~5
+  python scripts/build-translation-deltas.py --from 1.3.93=v1.3.93 --from 1.3.92=v1.3.92
+  python scripts/build-translation-deltas.py --from 1.3.93=old/translations --to 1.4.0=worktree
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.compiler import COMPILED_DIR, SOURCES
+from i18n_tools.deltas import WORKTREE, publish_deltas, version_label
+
+
+def parse_version(spec: str):
+    """'LABEL=REF' or just 'REF' (label read from package.json at that ref)."""
+    label, sep, ref = spec.partition("=")
+    if not sep:
+        return version_label(spec), spec
+    return label, ref
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build translation delta patches")
+    parser.add_argument("--from", dest="from_versions", action="append", required=True,
+                        help="Older version, LABEL=REF or REF (repeatable)")
+    parser.add_argument("--to", dest="to_version", default=WORKTREE,
+                        help="Target version, LABEL=REF or REF (default: worktree)")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only build this language (repeatable)")
+    parser.add_argument("--source", choices=SOURCES, default="merged", help="Translation source")
+    parser.add_argument("--out", type=Path, default=COMPILED_DIR, help="Output directory")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    languages = args.languages or list(LANGUAGES)
+
+    print("=" * 60)
+    print("Translation Delta Patches")
+    print("=" * 60)
+    print()
+
+    try:
+        from_versions = [parse_version(spec) for spec in args.from_versions]
+        to_version = parse_version(args.to_version)
+        index = publish_deltas(from_versions, to_version, languages, args.source, args.out)
+    except subprocess.CalledProcessError as e:
+        print(f"[ERROR] git {' '.join(e.cmd[1:3])} failed: {e.stderr.decode('utf-8', 'replace').strip()}")
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    to_label = to_version[0]
+    for lang in languages:
+        for from_label, _ in from_versions:
+            entry = index["languages"][lang][to_label][from_label]
+            saved = 100 - entry["bytes"] * 100 / entry["full_bytes"] if entry["full_bytes"] else 0
+            print(f"[OK] {entry['file']}: {entry['sets']} set, {entry['deletes']} deleted, "
+                  f"{entry['bytes']} bytes ({saved:.1f}% smaller than a full reload)")
+
+    print()
+    print("=" * 60)
+    print(f"COMPLETE: deltas to {to_label} written to {args.out}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
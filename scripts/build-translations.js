@@ -0,0 +1,31 @@
+/**
+ * Prebuild step: compile the translation bundles (scripts/compile-translations.py)
+ * into public/translations/_compiled/ so Vite copies them into dist/.
+ *
+ * Python is optional for the build: without it the step is skipped and the app
+ * keeps loading the raw /translations/{lng}/{ns}.json files. A compile that
+ * runs and fails does fail the build.
+ */
+
+import { spawnSync } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+const COMPILER = path.join(__dirname, 'compile-translations.py');
+const PYTHONS = process.platform === 'win32' ? ['py', 'python', 'python3'] : ['python3', 'python'];
+
+for (const python of PYTHONS) {
+  const result = spawnSync(python, [COMPILER, ...process.argv.slice(2)], { stdio: 'inherit' });
+  if (result.error) {
+    continue; // not installed under this name
+  }
+  if (result.status !== 0) {
+    console.error(`❌ Translation compile failed (exit ${result.status})`);
+  }
+  process.exit(result.status ?? 1);
+}
+
+console.warn('⚠️ Python not found - skipping compiled translation bundles (raw translation files will be used)');
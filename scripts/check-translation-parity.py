@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Check EN/ES/PT-BR translation parity and interpolation placeholders
+
+Compares every language with English - the monolithic {lng}.json files and
+all split {lng}/{ns}.json files - and reports missing keys, extra keys and
+values whose {{placeholders}} differ from the English value.
+
+Usage:
+  python scripts/check-translation-parity.py
+  python scripts/check-translation-parity.py --split-only --keys
+  python scripts/check-translation-parity.py --lang es --warn-only
+"""
+
+import argparse
+import sys
+import time
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.parity import REFERENCE_LANGUAGE, check_parity
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translation parity and placeholder checker")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only check this language against English (repeatable)")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--monolithic-only", action="store_true", help="Only check {lng}.json")
+    scope.add_argument("--split-only", action="store_true", help="Only check {lng}/{ns}.json")
+    parser.add_argument("--keys", action="store_true", help="List every offending key")
+    parser.add_argument("--warn-only", action="store_true", help="Always exit 0")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    languages = [REFERENCE_LANGUAGE] + [lang for lang in (args.languages or LANGUAGES) if lang != REFERENCE_LANGUAGE]
+
+    print("=" * 60)
+    print("Translation Parity Check")
+    print("=" * 60)
+    print()
+
+    started = time.perf_counter()
+    results = check_parity(languages, monolithic=not args.split_only, split=not args.monolithic_only)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    failing = [result for result in results if not result.ok]
+    for result in failing:
+        print(f"[WARN] {result.name}: {len(result.missing)} missing, {len(result.extra)} extra, "
+              f"{len(result.placeholders)} placeholder mismatches")
+        if args.keys:
+            for key in result.missing:
+                print(f"  - Missing: {key}")
+            for key in result.extra:
+                print(f"  + Extra: {key}")
+            for key, expected, found in result.placeholders:
+                print(f"  ~ Placeholders: {key} {sorted(found)} (en: {sorted(expected)})")
+
+    print()
+    print("=" * 60)
+    print(f"COMPLETE: {len(results)} files checked, {len(failing)} with issues "
+          f"({sum(r.issues for r in results)} total) in {elapsed:.0f} ms")
+    print("=" * 60)
+    return 0 if args.warn_only or not failing else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
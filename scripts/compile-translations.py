@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Compile translations into cache-friendly namespace bundles
+
+Reads the split public/translations/{lng}/*.json files (plus any keys that
+only exist in the monolithic {lng}.json files) and writes minified,
+content-hashed namespace files with .gz/.br siblings and a manifest to
+public/translations/_compiled/. Unchanged namespaces keep their file name
+between releases, so clients can cache them indefinitely.
+
+Keys missing in es/pt-BR are filled from English at build time (listed in
+_compiled/fallback-report.json), so clients never need to fetch English as
+a runtime fallback.
+
+Usage:
+  python scripts/compile-translations.py
+  python scripts/compile-translations.py --sync-split   # also refresh {lng}/{ns}.json
+  python scripts/compile-translations.py --no-fallbacks # keep es/pt-BR gaps
+  python scripts/compile-translations.py --source monolithic
+  python scripts/compile-translations.py --jobs 0 --lang es
+  python scripts/compile-translations.py --prune        # strip keys no source file uses
+  python scripts/compile-translations.py --string-table --report-savings
+  python scripts/compile-translations.py --interpolations --strict
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.compiler import COMPILED_DIR, SOURCES, brotli, compile_translations, load_sources
+from i18n_tools.fallback import FALLBACK_CHAINS, resolve_fallbacks, write_fallback_report
+from i18n_tools.interpolation import validate as validate_placeholders
+from i18n_tools.key_index import load_index
+from i18n_tools.pruner import prune_sources
+from i18n_tools.string_table import measure_savings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compile translation namespace bundles")
+    parser.add_argument("--out", type=Path, default=COMPILED_DIR, help="Output directory")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only compile this language (repeatable)")
+    parser.add_argument("--source", choices=SOURCES, default="merged",
+                        help="merged: split files + monolithic-only keys (default)")
+    parser.add_argument("--sync-split", action="store_true",
+                        help="Rewrite public/translations/{lng}/{ns}.json from the build source")
+    parser.add_argument("--no-precompress", action="store_true", help="Skip .gz/.br siblings")
+    parser.add_argument("--keep-stale", action="store_true",
+                        help="Keep hashed files that are no longer in the manifest")
+    parser.add_argument("--no-fallbacks", action="store_true",
+                        help="Do not fill keys missing in es/pt-BR from English")
+    parser.add_argument("--prune", action="store_true",
+                        help="Drop keys unreachable from src/ (see prune-translation-keys.py)")
+    parser.add_argument("--string-table", action="store_true",
+                        help="Intern repeated values into a per-language _strings table")
+    parser.add_argument("--report-savings", action="store_true",
+                        help="Print per-namespace bytes saved by the string table")
+    parser.add_argument("--interpolations", action="store_true",
+                        help="Emit pre-tokenized {{placeholder}} strings and plural groups per language")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail the build when placeholders differ between languages")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU)")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    languages = args.languages or list(LANGUAGES)
+
+    print("=" * 60)
+    print("Translation Build")
+    print("=" * 60)
+    print()
+
+    if brotli is None and not args.no_precompress:
+        print("[WARN] brotli module not installed - writing .gz siblings only")
+        print()
+
+    fallbacks = {}
+    try:
+        sources = load_sources(languages, source=args.source)
+        if args.sync_split and not args.no_fallbacks:
+            # The split files must keep holding real translations, not English copies
+            print("[WARN] --sync-split: skipping fallback resolution")
+            print()
+        elif not args.no_fallbacks:
+            sources, fallback_reports = resolve_fallbacks(sources, source=args.source)
+            fallbacks = {lang: FALLBACK_CHAINS[lang] for lang in fallback_reports}
+            for lang, report in fallback_reports.items():
+                filled = sum(len(keys) for keys in report.values())
+                print(f"[OK] {lang}: {filled} keys filled from fallback in {len(report)} namespaces")
+            print(f"  Report: {write_fallback_report(fallback_reports, args.out)}")
+            print()
+
+        if args.prune:
+            if args.sync_split:
+                print("[ERROR] --prune cannot be combined with --sync-split (sources stay intact)")
+                return 1
+            index, _ = load_index()
+            sources, reports = prune_sources(sources, index, languages)
+            for lang in languages:
+                dead = sum(r.dead for r in reports[lang])
+                dead_bytes = sum(r.dead_bytes for r in reports[lang])
+                print(f"[OK] {lang}: pruned {dead} dead keys ({dead_bytes / 1024:.1f} KB)")
+            print()
+
+        if args.interpolations:
+            issues = validate_placeholders(sources)
+            for issue in issues:
+                print(f"[{'ERROR' if args.strict else 'WARN'}] Placeholder mismatch: {issue}")
+            if issues:
+                print()
+            if issues and args.strict:
+                return 1
+
+        summary = compile_translations(
+            languages=languages,
+            out_dir=args.out,
+            precompress=not args.no_precompress,
+            sync_split=args.sync_split,
+            prune_stale=not args.keep_stale,
+            jobs=args.jobs,
+            source=args.source,
+            sources=sources,
+            string_table=args.string_table,
+            interpolations=args.interpolations,
+            fallbacks=fallbacks,
+        )
+    except Exception as e:
+        print(f"[ERROR] Build failed: {e}")
+        return 1
+
+    manifest = summary["manifest"]
+    for lang in languages:
+        entries = manifest["languages"][lang]
+        raw = sum(entry["bytes"] for entry in entries.values())
+        gz = sum(entry.get("gzip", 0) for entry in entries.values())
+        print(f"[OK] {lang}: {len(entries)} namespaces, {raw / 1024:.1f} KB minified"
+              + (f", {gz / 1024:.1f} KB gzip" if gz else ""))
+        for namespace in summary["synced"].get(lang, []):
+            print(f"  ~ Synced split file: {lang}/{namespace}.json")
+
+    if args.report_savings:
+        print()
+        for lang in languages:
+            savings, table_bytes = measure_savings(sources[lang])
+            plain = sum(s.plain for s in savings)
+            compact = sum(s.compact for s in savings)
+            print(f"{lang}: string table {table_bytes / 1024:.1f} KB, namespaces {plain / 1024:.1f} -> "
+                  f"{compact / 1024:.1f} KB, net saving {(plain - compact - table_bytes) / 1024:.1f} KB")
+            for entry in sorted(savings, key=lambda s: s.saved, reverse=True):
+                if entry.saved > 0:
+                    print(f"  {entry.namespace:<32} {entry.plain:>7} -> {entry.compact:>7} bytes "
+                          f"({entry.saved * 100 / entry.plain:.1f}% saved)")
+
+    for name in summary["removed"]:
+        print(f"  - Removed stale: {name}")
+
+    print()
+    print("=" * 60)
+    status = "updated" if summary["manifest_written"] else "unchanged"
+    print(f"COMPLETE: manifest {status} ({args.out})")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
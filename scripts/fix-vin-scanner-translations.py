@@ -4,9 +4,10 @@ Fix VIN Scanner Hub missing translations
 Adds 28 missing keys that VinScannerHub.tsx component requires
 """
 
-import json
 import sys
-from pathlib import Path
+
+from i18n_tools.benchmark import load_budgets
+from i18n_tools.patch_engine import PatchSet, apply_patch_sets, print_result
 
 # Exact translation keys that VinScannerHub.tsx uses
 MISSING_KEYS = {
@@ -106,58 +107,8 @@ MISSING_KEYS = {
 }
 
 
-def fix_translations(file_path: Path, lang: str) -> bool:
-    """Add missing VIN Scanner Hub translations to JSON file."""
-    try:
-        # Read existing JSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        print(f"[OK] Loaded {file_path.name}")
-
-        # Ensure vin_scanner_hub section exists
-        if 'vin_scanner_hub' not in data:
-            data['vin_scanner_hub'] = {}
-            print(f"  + Created vin_scanner_hub section")
-
-        # Get missing keys for this language
-        missing_keys = MISSING_KEYS[lang]
-
-        # Track changes
-        added_keys = 0
-        updated_keys = 0
-
-        # Add/update missing keys
-        for key, value in missing_keys.items():
-            full_key = f"vin_scanner_hub.{key}"
-            if key not in data['vin_scanner_hub']:
-                added_keys += 1
-                print(f"  + Added: {full_key}")
-            elif data['vin_scanner_hub'][key] != value:
-                updated_keys += 1
-                print(f"  ~ Updated: {full_key}")
-
-            data['vin_scanner_hub'][key] = value
-
-        # Sort keys alphabetically within vin_scanner_hub
-        data['vin_scanner_hub'] = dict(sorted(data['vin_scanner_hub'].items()))
-
-        # Write back to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        print(f"[OK] Saved {file_path.name}")
-        print(f"  Added: {added_keys} keys")
-        print(f"  Updated: {updated_keys} keys")
-        print()
-
-        return True
-
-    except Exception as e:
-        print(f"[ERROR] Processing {file_path.name}: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+# Keys are kept sorted alphabetically within vin_scanner_hub
+PATCH_SET = PatchSet.for_section("vin-scanner-hub-fix", "vin_scanner_hub", MISSING_KEYS, sort=True)
 
 
 def main():
@@ -167,26 +118,22 @@ def main():
     print("=" * 60)
     print()
 
-    base_dir = Path(__file__).parent.parent / "public" / "translations"
-
-    files = {
-        "en": base_dir / "en.json",
-        "es": base_dir / "es.json",
-        "pt-BR": base_dir / "pt-BR.json"
-    }
+    # Only vin_scanner_hub changes, so splice it in place instead of rewriting the
+    # monolithic files; the split namespace files are patched in parallel
+    results = apply_patch_sets([PATCH_SET], splice=True, namespaces=True, jobs=0,
+                               guard=True, snapshot=True, budgets=load_budgets())
 
-    success_count = 0
+    for result in results:
+        print(f"Processing {result.display_name}...")
+        print_result(result)
 
-    for lang, file_path in files.items():
-        print(f"Processing {lang.upper()} translations...")
-        if fix_translations(file_path, lang):
-            success_count += 1
+    success_count = sum(1 for result in results if result.ok)
 
     print("=" * 60)
-    print(f"COMPLETE: {success_count}/3 files updated successfully")
+    print(f"COMPLETE: {success_count}/{len(results)} files updated successfully")
     print("=" * 60)
 
-    if success_count == 3:
+    if success_count == len(results):
         print()
         print("[SUCCESS] All missing VIN Scanner Hub translations added!")
         print("  - 28 missing keys added per language")
@@ -0,0 +1,20 @@
+"""
+Shared Python tooling for the translation files in public/translations.
+
+The standalone scripts in scripts/*.py import from this package so every
+translation update goes through the same load/merge/write path instead of
+each feature script re-implementing it.
+"""
+
+from .common import LANGUAGES, TRANSLATIONS_DIR, monolithic_path, namespace_dir
+from .patch_engine import PatchSet, apply_patch_sets, load_patch_queue
+
+__all__ = [
+    "LANGUAGES",
+    "TRANSLATIONS_DIR",
+    "PatchSet",
+    "apply_patch_sets",
+    "load_patch_queue",
+    "monolithic_path",
+    "namespace_dir",
+]
@@ -0,0 +1,194 @@
+"""
+Translation payload benchmarks and budgets.
+
+Measures, per language, the monolithic file and every split namespace file:
+raw bytes, gzip (and brotli when installed) bytes, JSON parse time and leaf
+key count. Runs are appended to .cache/i18n/benchmark-history.jsonl so sizes
+can be compared over time, and scripts/translation-budgets.json sets the
+limits the benchmark CLI enforces (the patch engine checks the size limits
+only).
+
+Parse time is the best of several json.loads() runs. It is a proxy for the
+browser's JSON.parse - good for spotting regressions, not absolute numbers.
+"""
+
+import gzip
+import json
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .common import (
+    CACHE_DIR,
+    LANGUAGES,
+    REPO_ROOT,
+    TRANSLATIONS_DIR,
+    count_leaves,
+    monolithic_path,
+    namespace_dir,
+    read_json,
+)
+
+try:
+    import brotli
+except ImportError:  # Optional - brotli sizes are skipped without it
+    brotli = None
+
+HISTORY_PATH = CACHE_DIR / "benchmark-history.jsonl"
+BUDGETS_PATH = Path(__file__).resolve().parent.parent / "translation-budgets.json"
+PARSE_REPEATS = 5
+
+
+@dataclass
+class Measurement:
+    name: str
+    bytes: int
+    gzip: int
+    br: Optional[int]
+    parse_ms: float
+    keys: int
+
+
+def parse_time_ms(text: str, repeats: int = PARSE_REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        json.loads(text)
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 3)
+
+
+def measure_bytes(name: str, data: bytes, repeats: int = PARSE_REPEATS) -> Measurement:
+    text = data.decode("utf-8-sig")
+    value = json.loads(text)
+    return Measurement(
+        name=name,
+        bytes=len(data),
+        gzip=len(gzip.compress(data, compresslevel=9, mtime=0)),
+        br=len(brotli.compress(data, quality=11)) if brotli is not None else None,
+        parse_ms=parse_time_ms(text, repeats),
+        keys=count_leaves(value) if isinstance(value, dict) else 1,
+    )
+
+
+def _total(name: str, measurements: Sequence[Measurement]) -> Measurement:
+    return Measurement(
+        name=name,
+        bytes=sum(m.bytes for m in measurements),
+        gzip=sum(m.gzip for m in measurements),
+        br=sum(m.br for m in measurements) if brotli is not None else None,
+        parse_ms=round(sum(m.parse_ms for m in measurements), 3),
+        keys=sum(m.keys for m in measurements),
+    )
+
+
+def run_benchmark(languages: Sequence[str] = LANGUAGES, base_dir: Path = TRANSLATIONS_DIR,
+                  repeats: int = PARSE_REPEATS) -> Dict[str, dict]:
+    """``{lang: {"monolithic": Measurement, "namespaces": {ns: Measurement}, "split_total": Measurement}}``."""
+    results = {}
+    for lang in languages:
+        entry = {"monolithic": None, "namespaces": {}}
+        path = monolithic_path(lang, base_dir)
+        if path.exists():
+            entry["monolithic"] = measure_bytes(f"{lang}.json", path.read_bytes(), repeats)
+        for file_path in sorted(namespace_dir(lang, base_dir).glob("*.json")):
+            entry["namespaces"][file_path.stem] = measure_bytes(
+                f"{lang}/{file_path.name}", file_path.read_bytes(), repeats)
+        entry["split_total"] = _total(f"{lang}/*.json", list(entry["namespaces"].values()))
+        results[lang] = entry
+    return results
+
+
+# -- history ---------------------------------------------------------------
+
+def _git_head() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                             capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.decode("utf-8").strip()
+
+
+def record_history(results: Dict[str, dict], history_path: Path = HISTORY_PATH) -> dict:
+    record = {
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_head(),
+        "languages": {
+            lang: {
+                "monolithic": asdict(entry["monolithic"]) if entry["monolithic"] else None,
+                "split_total": asdict(entry["split_total"]),
+                "namespaces": {ns: asdict(m) for ns, m in entry["namespaces"].items()},
+            }
+            for lang, entry in results.items()
+        },
+    }
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return record
+
+
+def load_history(history_path: Path = HISTORY_PATH) -> List[dict]:
+    if not history_path.exists():
+        return []
+    with open(history_path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# -- budgets ---------------------------------------------------------------
+
+def load_budgets(budgets_path: Path = BUDGETS_PATH) -> dict:
+    return read_json(budgets_path) if budgets_path.exists() else {}
+
+
+def budget_for(budgets: dict, namespace: Optional[str]) -> dict:
+    """Limits for a namespace file (or the monolithic file when ``namespace`` is None)."""
+    if namespace is None:
+        return budgets.get("monolithic", {})
+    limits = dict(budgets.get("namespace", {}))
+    limits.update(budgets.get("namespaces", {}).get(namespace, {}))
+    return limits
+
+
+def check_measurement(measurement: Measurement, limits: dict) -> List[str]:
+    violations = []
+    for field_name, limit_name, unit in (("bytes", "max_bytes", "bytes"), ("gzip", "max_gzip", "bytes gzip"),
+                                         ("parse_ms", "max_parse_ms", "ms parse")):
+        limit = limits.get(limit_name)
+        value = getattr(measurement, field_name)
+        if limit is not None and value > limit:
+            violations.append(f"{measurement.name}: {value} {unit} exceeds budget of {limit}")
+    return violations
+
+
+def check_budgets(results: Dict[str, dict], budgets: dict) -> List[str]:
+    violations = []
+    for entry in results.values():
+        if entry["monolithic"] is not None:
+            violations.extend(check_measurement(entry["monolithic"], budget_for(budgets, None)))
+        for namespace, measurement in entry["namespaces"].items():
+            violations.extend(check_measurement(measurement, budget_for(budgets, namespace)))
+    return violations
+
+
+def check_file_budget(name: str, data: bytes, budgets: dict, namespace: Optional[str]) -> List[str]:
+    """
+    Size budgets for bytes about to be written (used by the patch engine).
+
+    Only the deterministic limits apply here: a wall-clock ``max_parse_ms``
+    would reject correct patches on a loaded machine, so parse time is left
+    to the benchmark CLI.
+    """
+    limits = budget_for(budgets, namespace)
+    violations = []
+    if limits.get("max_bytes") is not None and len(data) > limits["max_bytes"]:
+        violations.append(f"{name}: {len(data)} bytes exceeds budget of {limits['max_bytes']}")
+    if limits.get("max_gzip") is not None:
+        size = len(gzip.compress(data, compresslevel=9, mtime=0))
+        if size > limits["max_gzip"]:
+            violations.append(f"{name}: {size} bytes gzip exceeds budget of {limits['max_gzip']}")
+    return violations
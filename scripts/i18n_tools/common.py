@@ -0,0 +1,79 @@
+"""
+Paths and JSON helpers shared by the translation tooling.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+TRANSLATIONS_DIR = REPO_ROOT / "public" / "translations"
+
+# Local, git-ignored working directory for indexes and other derived state
+CACHE_DIR = REPO_ROOT / ".cache" / "i18n"
+
+LANGUAGES = ("en", "es", "pt-BR")
+
+
+def monolithic_path(lang: str, base_dir: Path = TRANSLATIONS_DIR) -> Path:
+    """Path of the monolithic translation file for a language."""
+    return base_dir / f"{lang}.json"
+
+
+def namespace_dir(lang: str, base_dir: Path = TRANSLATIONS_DIR) -> Path:
+    """Directory holding the split namespace files for a language."""
+    return base_dir / lang
+
+
+def read_json(file_path: Path):
+    """Load a JSON file, tolerating the BOM some Windows editors leave behind."""
+    with open(file_path, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def serialize(data) -> str:
+    """Serialize translations the way the patch scripts always have."""
+    return json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
+
+def canonical_hash(data) -> str:
+    """Hash of the content only - independent of key order and whitespace."""
+    canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def write_bytes_atomic(file_path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so a crash never leaves half a JSON file."""
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def write_text_atomic(file_path: Path, text: str) -> None:
+    write_bytes_atomic(file_path, text.encode("utf-8"))
+
+
+def load_namespace_files(lang: str, base_dir: Path = TRANSLATIONS_DIR) -> dict:
+    """Split namespace files for a language as ``{namespace: value}``."""
+    lang_dir = namespace_dir(lang, base_dir)
+    if not lang_dir.is_dir():
+        return {}
+    return {file_path.stem: read_json(file_path) for file_path in sorted(lang_dir.glob("*.json"))}
+
+
+def fill_missing(target: dict, source: dict) -> int:
+    """Copy keys from ``source`` that ``target`` lacks (recursively); returns how many leaves were added."""
+    added = 0
+    for key, value in source.items():
+        if key not in target:
+            target[key] = value
+            added += count_leaves(value) if isinstance(value, dict) else 1
+        elif isinstance(target[key], dict) and isinstance(value, dict):
+            added += fill_missing(target[key], value)
+    return added
+
+
+def count_leaves(data: dict) -> int:
+    return sum(count_leaves(v) if isinstance(v, dict) else 1 for v in data.values())
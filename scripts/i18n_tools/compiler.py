@@ -0,0 +1,269 @@
+"""
+Translation build compiler.
+
+Compiles the translation sources into minified per-namespace files with
+content-hashed names, plus .gz/.br siblings and a manifest::
+
+    public/translations/_compiled/
+        manifest.json
+        en/common.3f9c2a1b7d.json
+        en/common.3f9c2a1b7d.json.gz
+        en/common.3f9c2a1b7d.json.br   (only when the brotli module is installed)
+
+A namespace whose content did not change keeps the same file name across
+releases, so the loader and service worker can cache it indefinitely. The
+manifest carries no timestamps, so an unchanged source compiles to a
+byte-identical build.
+
+With ``string_table`` each language also gets an ``_strings.<hash>.json``
+array of shared values and the namespace files reference it by index (see
+string_table.py); the manifest lists it under ``string_tables[lang]``.
+With ``interpolations`` each language gets an ``_interpolations.<hash>.json``
+of pre-tokenized strings and plural groups (see interpolation.py), listed
+under ``interpolations[lang]``. Languages compiled with their fallback chain
+already filled in (see fallback.py) are listed under ``fallbacks[lang]``, so
+the loader does not also fetch the fallback language at runtime.
+
+The split {lng}/{ns}.json files are what the app serves today and have
+drifted ahead of the monolithic files, so the default "merged" source takes
+the split files and fills in any keys that only exist in the monolithic file.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .common import (
+    LANGUAGES,
+    TRANSLATIONS_DIR,
+    canonical_hash,
+    fill_missing,
+    load_namespace_files,
+    monolithic_path,
+    namespace_dir,
+    read_json,
+    serialize,
+    write_bytes_atomic,
+    write_text_atomic,
+)
+from .interpolation import INTERPOLATIONS_NAMESPACE, compile_interpolations
+from .string_table import STRING_TABLE_NAMESPACE, encode_sections
+
+try:
+    import brotli
+except ImportError:  # Optional - .br siblings are skipped without it
+    brotli = None
+
+COMPILED_DIR = TRANSLATIONS_DIR / "_compiled"
+# Manifest sections holding one extra per-language file each ({lang: entry})
+AUXILIARY_ENTRIES = ("string_tables", "interpolations")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+HASH_LENGTH = 10
+
+
+def minify(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def _write_if_missing(file_path: Path, data: bytes) -> None:
+    # Hashed names are immutable: an existing file already has these bytes
+    if not file_path.exists():
+        write_bytes_atomic(file_path, data)
+
+
+def emit_namespace(lang: str, namespace: str, value, out_dir: Path = COMPILED_DIR,
+                   precompress: bool = True) -> dict:
+    """Write one minified, content-hashed namespace file and return its manifest entry."""
+    data = minify(value)
+    digest = content_hash(data)
+    relative = f"{lang}/{namespace}.{digest}.json"
+    file_path = out_dir / relative
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entry = {"file": relative, "hash": digest, "bytes": len(data)}
+    _write_if_missing(file_path, data)
+
+    if precompress:
+        # mtime=0 keeps the gzip output byte-identical between builds
+        gz = gzip.compress(data, compresslevel=9, mtime=0)
+        _write_if_missing(file_path.with_name(file_path.name + ".gz"), gz)
+        entry["gzip"] = len(gz)
+        if brotli is not None:
+            br = brotli.compress(data, quality=11)
+            _write_if_missing(file_path.with_name(file_path.name + ".br"), br)
+            entry["br"] = len(br)
+
+    return entry
+
+
+SOURCES = ("merged", "split", "monolithic")
+
+
+def load_source(lang: str, base_dir: Path = TRANSLATIONS_DIR, source: str = "merged") -> Dict[str, dict]:
+    """Build source for one language as ``{namespace: value}``."""
+    if source == "monolithic":
+        return read_json(monolithic_path(lang, base_dir))
+
+    sections = load_namespace_files(lang, base_dir)
+    if source == "merged":
+        monolithic = read_json(monolithic_path(lang, base_dir))
+        for namespace, value in monolithic.items():
+            if namespace not in sections:
+                sections[namespace] = value
+            elif isinstance(value, dict):
+                fill_missing(sections[namespace], value)
+    return sections
+
+
+def load_sources(languages: Sequence[str] = LANGUAGES, base_dir: Path = TRANSLATIONS_DIR,
+                 source: str = "merged") -> Dict[str, Dict[str, dict]]:
+    """Build source per language: ``{lang: {namespace: value}}``."""
+    return {lang: load_source(lang, base_dir, source) for lang in languages}
+
+
+def compile_language(lang: str, sections: Dict[str, dict], out_dir: Path = COMPILED_DIR,
+                     precompress: bool = True, string_table: bool = False):
+    """
+    Emit every namespace of one language. Returns ``({namespace: entry}, table entry)``;
+    the table entry is None unless ``string_table`` is set.
+    """
+    table_entry = None
+    if string_table:
+        table, sections = encode_sections(sections)
+        table_entry = emit_namespace(lang, STRING_TABLE_NAMESPACE, table, out_dir, precompress)
+    entries = {
+        namespace: emit_namespace(lang, namespace, sections[namespace], out_dir, precompress)
+        for namespace in sorted(sections)
+    }
+    return entries, table_entry
+
+
+def sync_split_files(lang: str, sections: Dict[str, dict], base_dir: Path = TRANSLATIONS_DIR) -> List[str]:
+    """
+    Regenerate the readable public/translations/{lng}/{ns}.json files from the
+    build source, writing only the ones whose content changed.
+    """
+    written = []
+    target_dir = namespace_dir(lang, base_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for namespace in sorted(sections):
+        file_path = target_dir / f"{namespace}.json"
+        if file_path.exists() and canonical_hash(read_json(file_path)) == canonical_hash(sections[namespace]):
+            continue
+        write_text_atomic(file_path, serialize(sections[namespace]))
+        written.append(namespace)
+    return written
+
+
+def read_manifest(out_dir: Path = COMPILED_DIR) -> dict:
+    manifest_path = out_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        return read_json(manifest_path)
+    return {"format": MANIFEST_FORMAT, "languages": {}}
+
+
+def write_manifest(manifest: dict, out_dir: Path = COMPILED_DIR) -> bool:
+    """Write the manifest if it changed; returns whether it was written."""
+    manifest_path = out_dir / MANIFEST_NAME
+    text = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    if manifest_path.exists() and manifest_path.read_text(encoding="utf-8") == text:
+        return False
+    out_dir.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(manifest_path, text)
+    return True
+
+
+def remove_stale(manifest: dict, out_dir: Path = COMPILED_DIR) -> List[str]:
+    """Delete hashed files (and their .gz/.br siblings) no longer referenced by the manifest."""
+    live = {entry["file"] for namespaces in manifest["languages"].values() for entry in namespaces.values()}
+    for name in AUXILIARY_ENTRIES:
+        live |= {entry["file"] for entry in manifest.get(name, {}).values()}
+    removed = []
+    for lang in manifest["languages"]:
+        lang_dir = out_dir / lang
+        if not lang_dir.is_dir():
+            continue
+        for file_path in lang_dir.iterdir():
+            if file_path.is_dir():
+                continue
+            base = file_path.name
+            for suffix in (".gz", ".br"):
+                if base.endswith(suffix):
+                    base = base[:-len(suffix)]
+            if f"{lang}/{base}" not in live:
+                file_path.unlink()
+                removed.append(f"{lang}/{file_path.name}")
+    return sorted(removed)
+
+
+def _compile_one(lang: str, sections: Dict[str, dict], out_dir: Path, precompress: bool,
+                 sync_split: bool, base_dir: Path, string_table: bool, interpolations: bool):
+    synced = sync_split_files(lang, sections, base_dir) if sync_split else []
+    auxiliary = {}
+    if interpolations:
+        auxiliary["interpolations"] = emit_namespace(
+            lang, INTERPOLATIONS_NAMESPACE, compile_interpolations(sections), out_dir, precompress)
+    entries, auxiliary["string_tables"] = compile_language(lang, sections, out_dir, precompress, string_table)
+    return entries, auxiliary, synced
+
+
+def compile_translations(languages: Sequence[str] = LANGUAGES, base_dir: Path = TRANSLATIONS_DIR,
+                         out_dir: Path = COMPILED_DIR, precompress: bool = True,
+                         sync_split: bool = False, prune_stale: bool = True, jobs: int = 1,
+                         source: str = "merged",
+                         sources: Optional[Dict[str, Dict[str, dict]]] = None,
+                         string_table: bool = False, interpolations: bool = False,
+                         fallbacks: Optional[Dict[str, Sequence[str]]] = None) -> dict:
+    """
+    Compile every language and write the manifest.
+
+    ``fallbacks`` maps each language whose ``sources`` were resolved against
+    its fallback chain to that chain; it is recorded in the manifest.
+
+    Returns a summary with the manifest, the split files that were re-synced
+    and the stale build files that were removed.
+    """
+    if sources is None:
+        sources = load_sources(languages, base_dir, source)
+
+    work = [(lang, sources[lang], out_dir, precompress, sync_split, base_dir, string_table, interpolations)
+            for lang in languages]
+    if jobs == 1 or len(work) <= 1:
+        outputs = [_compile_one(*args) for args in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            outputs = list(pool.map(_compile_one, *zip(*work)))
+
+    manifest = read_manifest(out_dir)
+    manifest["format"] = MANIFEST_FORMAT
+    synced = {}
+    for lang, (entries, auxiliary, synced_namespaces) in zip(languages, outputs):
+        manifest["languages"][lang] = entries
+        # A language listed under string_tables has index-encoded namespace files
+        for name in AUXILIARY_ENTRIES:
+            if auxiliary.get(name) is not None:
+                manifest.setdefault(name, {})[lang] = auxiliary[name]
+            else:
+                manifest.get(name, {}).pop(lang, None)
+        if fallbacks and lang in fallbacks:
+            manifest.setdefault("fallbacks", {})[lang] = list(fallbacks[lang])
+        else:
+            manifest.get("fallbacks", {}).pop(lang, None)
+        if synced_namespaces:
+            synced[lang] = synced_namespaces
+
+    return {
+        "manifest": manifest,
+        "manifest_written": write_manifest(manifest, out_dir),
+        "synced": synced,
+        "removed": remove_stale(manifest, out_dir) if prune_stale else [],
+    }
@@ -0,0 +1,218 @@
+"""
+Versioned translation delta patches.
+
+TRANSLATION_CACHE_KEY in src/lib/i18n.ts embeds APP_VERSION, so every release
+throws away each client's cached translations even when only a handful of
+keys changed. A delta is the structural diff between two versions of one
+language::
+
+    {"format": 1, "lang": "es", "from": "1.3.93", "to": "1.4.0",
+     "from_hash": "...", "to_hash": "...",
+     "set": [[["vin_scanner_hub", "scan"], "Escanear"], ...],
+     "delete": [["quick_scan", "legacy_title"], ...]}
+
+Paths are arrays of segments (keys may contain dots). A client holding
+``from`` applies ``delete`` then ``set`` and ends up with ``to``; the hashes
+are canonical_hash() values of the whole language before and after.
+
+Versions can be read from git revisions (without touching the worktree) or
+from a translations directory laid out like public/translations.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .common import (
+    LANGUAGES,
+    REPO_ROOT,
+    TRANSLATIONS_DIR,
+    canonical_hash,
+    fill_missing,
+    read_json,
+    write_text_atomic,
+)
+from .compiler import COMPILED_DIR, load_source, minify
+
+DELTA_FORMAT = 1
+DELTAS_DIR_NAME = "deltas"
+DELTA_INDEX_NAME = "index.json"
+WORKTREE = "worktree"
+
+KeyPath = Tuple[str, ...]
+
+
+def diff(old, new, prefix: KeyPath = ()) -> Tuple[List[Tuple[KeyPath, object]], List[KeyPath]]:
+    """
+    Structural diff: ``(sets, deletes)`` turning ``old`` into ``new``.
+
+    Recurses into objects present on both sides; anything else that differs
+    (changed leaf, type change, new subtree) becomes a single set.
+    """
+    sets, deletes = [], []
+    for key, value in new.items():
+        path = prefix + (key,)
+        if key not in old:
+            sets.append((path, value))
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            child_sets, child_deletes = diff(old[key], value, path)
+            sets.extend(child_sets)
+            deletes.extend(child_deletes)
+        elif old[key] != value:
+            sets.append((path, value))
+    for key in old:
+        if key not in new:
+            deletes.append(prefix + (key,))
+    return sets, deletes
+
+
+def apply_delta(data: dict, delta: dict) -> dict:
+    """Apply a delta in place (the same steps the loader runs) and return ``data``."""
+    for path in delta["delete"]:
+        parent = data
+        for key in path[:-1]:
+            parent = parent.get(key)
+            if not isinstance(parent, dict):
+                break
+        else:
+            parent.pop(path[-1], None)
+    for path, value in delta["set"]:
+        parent = data
+        for key in path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                parent[key] = {}
+            parent = parent[key]
+        parent[path[-1]] = value
+    return data
+
+
+def build_delta(lang: str, from_version: str, old: dict, to_version: str, new: dict) -> dict:
+    sets, deletes = diff(old, new)
+    return {
+        "format": DELTA_FORMAT,
+        "lang": lang,
+        "from": from_version,
+        "to": to_version,
+        "from_hash": canonical_hash(old),
+        "to_hash": canonical_hash(new),
+        "set": [[list(path), value] for path, value in sets],
+        "delete": [list(path) for path in deletes],
+    }
+
+
+# -- version sources -------------------------------------------------------
+
+def _git(*args: str, input_data: Optional[bytes] = None) -> bytes:
+    return subprocess.run(
+        ["git", *args], cwd=REPO_ROOT, input=input_data, capture_output=True, check=True,
+    ).stdout
+
+
+def _git_blobs(rev: str, paths: Sequence[str]) -> Dict[str, bytes]:
+    """Read many files at ``rev`` with one ``git cat-file --batch`` call."""
+    request = "".join(f"{rev}:{path}\n" for path in paths).encode("utf-8")
+    out = _git("cat-file", "--batch", input_data=request)
+    blobs, pos = {}, 0
+    for path in paths:
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        pos = header_end + 1
+        if header[-1] == b"missing":
+            continue
+        size = int(header[2])
+        blobs[path] = out[pos:pos + size]
+        pos += size + 1
+    return blobs
+
+
+def _decode(blob: bytes):
+    return json.loads(blob.decode("utf-8-sig"))
+
+
+def load_revision(rev: str, lang: str, source: str = "merged") -> dict:
+    """A language's translations as of git revision ``rev`` (same semantics as compiler.load_source)."""
+    base = TRANSLATIONS_DIR.relative_to(REPO_ROOT).as_posix()
+    monolithic = f"{base}/{lang}.json"
+    split = []
+    if source != "monolithic":
+        listing = _git("ls-tree", "-r", "--name-only", rev, f"{base}/{lang}/").decode("utf-8")
+        split = [path for path in listing.splitlines() if path.endswith(".json")]
+
+    blobs = _git_blobs(rev, [monolithic] + split)
+    if source == "monolithic":
+        return _decode(blobs[monolithic]) if monolithic in blobs else {}
+
+    sections = {Path(path).stem: _decode(blobs[path]) for path in split if path in blobs}
+    if source == "merged" and monolithic in blobs:
+        for namespace, value in _decode(blobs[monolithic]).items():
+            if namespace not in sections:
+                sections[namespace] = value
+            elif isinstance(value, dict):
+                fill_missing(sections[namespace], value)
+    return sections
+
+
+def load_version(ref: str, lang: str, source: str = "merged") -> dict:
+    """``ref`` is 'worktree', a translations directory, or any git revision."""
+    if ref == WORKTREE:
+        return load_source(lang, TRANSLATIONS_DIR, source)
+    if Path(ref).is_dir():
+        return load_source(lang, Path(ref), source)
+    return load_revision(ref, lang, source)
+
+
+def version_label(ref: str) -> str:
+    """The package.json version at ``ref`` - what APP_VERSION is built from."""
+    if ref == WORKTREE or Path(ref).is_dir():
+        return read_json(REPO_ROOT / "package.json")["version"]
+    return _decode(_git("show", f"{ref}:package.json"))["version"]
+
+
+# -- publishing ------------------------------------------------------------
+
+def delta_relative_path(lang: str, from_version: str, to_version: str) -> str:
+    return f"{DELTAS_DIR_NAME}/{lang}/{from_version}..{to_version}.json"
+
+
+def read_delta_index(out_dir: Path = COMPILED_DIR) -> dict:
+    index_path = out_dir / DELTAS_DIR_NAME / DELTA_INDEX_NAME
+    if index_path.exists():
+        return read_json(index_path)
+    return {"format": DELTA_FORMAT, "languages": {}}
+
+
+def publish_deltas(from_refs: Sequence[Tuple[str, str]], to_ref: Tuple[str, str],
+                   languages: Sequence[str] = LANGUAGES, source: str = "merged",
+                   out_dir: Path = COMPILED_DIR) -> dict:
+    """
+    Write one delta per (from version, language) to ``to_ref`` and update
+    deltas/index.json, which maps ``{lang: {to: {from: entry}}}``.
+
+    ``from_refs`` and ``to_ref`` are ``(label, ref)`` pairs. Returns the index.
+    """
+    to_label, to_source_ref = to_ref
+    index = read_delta_index(out_dir)
+    for lang in languages:
+        new = load_version(to_source_ref, lang, source)
+        targets = index["languages"].setdefault(lang, {}).setdefault(to_label, {})
+        for from_label, from_source_ref in from_refs:
+            delta = build_delta(lang, from_label, load_version(from_source_ref, lang, source), to_label, new)
+            data = minify(delta)
+            relative = delta_relative_path(lang, from_label, to_label)
+            file_path = out_dir / relative
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(file_path, data.decode("utf-8"))
+            targets[from_label] = {
+                "file": relative,
+                "bytes": len(data),
+                "full_bytes": len(minify(new)),
+                "sets": len(delta["set"]),
+                "deletes": len(delta["delete"]),
+                "to_hash": delta["to_hash"],
+            }
+
+    index_path = out_dir / DELTAS_DIR_NAME / DELTA_INDEX_NAME
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(index_path, json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+    return index
@@ -0,0 +1,95 @@
+"""
+Build-time locale fallback resolution.
+
+src/lib/i18n.ts uses fallbackLng 'en': a key missing in es or pt-BR is looked
+up in English at runtime, which means English has to be downloaded too. This
+resolves the chain at build time instead - every compiled es/pt-BR namespace
+gets the keys it lacks copied from English, and each filled key is recorded
+in a report so translators can see what still needs translating.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .common import TRANSLATIONS_DIR, read_json, write_text_atomic
+from .compiler import COMPILED_DIR, load_source
+
+# Mirrors fallbackLng in src/lib/i18n.ts (first entry wins)
+FALLBACK_CHAINS = {
+    "es": ("en",),
+    "pt-BR": ("en",),
+}
+FALLBACK_REPORT_NAME = "fallback-report.json"
+
+
+def _fill(target: dict, source: dict, prefix: str, filled: List[str]) -> None:
+    for key, value in source.items():
+        path = f"{prefix}{key}"
+        if key not in target:
+            target[key] = copy.deepcopy(value)
+            filled.append(path)
+        elif isinstance(target[key], dict) and isinstance(value, dict):
+            _fill(target[key], value, f"{path}.", filled)
+
+
+def resolve_language(sections: Dict[str, dict], fallbacks: List[Dict[str, dict]]) -> Tuple[Dict[str, dict], Dict[str, List[str]]]:
+    """
+    Fill ``sections`` from each fallback language in order, without modifying
+    the inputs. Returns the resolved sections and ``{namespace: [filled keys]}``
+    (a namespace missing entirely is reported as ``["*"]``).
+    """
+    resolved = copy.deepcopy(sections)
+    report: Dict[str, List[str]] = {}
+    for fallback in fallbacks:
+        for namespace, value in fallback.items():
+            if namespace not in resolved:
+                resolved[namespace] = copy.deepcopy(value)
+                report[namespace] = ["*"]
+            elif isinstance(resolved[namespace], dict) and isinstance(value, dict):
+                filled = []
+                _fill(resolved[namespace], value, "", filled)
+                if filled and report.get(namespace) != ["*"]:
+                    report.setdefault(namespace, []).extend(filled)
+    return resolved, dict(sorted(report.items()))
+
+
+def resolve_fallbacks(sources: Dict[str, Dict[str, dict]], base_dir: Path = TRANSLATIONS_DIR,
+                      source: str = "merged") -> Tuple[Dict[str, Dict[str, dict]], Dict[str, Dict[str, List[str]]]]:
+    """
+    Resolve every language in ``{lang: {namespace: value}}`` against its chain.
+    Fallback languages that are not in ``sources`` are loaded from ``base_dir``.
+    """
+    resolved, reports = {}, {}
+    loaded = dict(sources)
+    for lang, sections in sources.items():
+        chain = FALLBACK_CHAINS.get(lang, ())
+        if not chain:
+            resolved[lang] = sections
+            continue
+        for fallback in chain:
+            if fallback not in loaded:
+                loaded[fallback] = load_source(fallback, base_dir, source)
+        resolved[lang], reports[lang] = resolve_language(sections, [loaded[f] for f in chain])
+    return resolved, reports
+
+
+def write_fallback_report(reports: Dict[str, Dict[str, List[str]]], out_dir: Path = COMPILED_DIR) -> Path:
+    """
+    Write the filled-key report next to the manifest, keeping entries for
+    languages not compiled this run; only rewritten when it changed.
+    """
+    report_path = out_dir / FALLBACK_REPORT_NAME
+    languages = read_json(report_path).get("languages", {}) if report_path.exists() else {}
+    for lang, report in reports.items():
+        languages[lang] = {"filled": sum(len(keys) for keys in report.values()), "namespaces": report}
+    payload = {
+        "chains": {lang: list(chain) for lang, chain in FALLBACK_CHAINS.items()},
+        "languages": dict(sorted(languages.items())),
+    }
+    text = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+    if not report_path.exists() or report_path.read_text(encoding="utf-8") != text:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(report_path, text)
+    return report_path
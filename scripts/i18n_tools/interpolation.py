@@ -0,0 +1,110 @@
+"""
+Interpolation precompiler.
+
+i18next scans every value for ``{{...}}`` with a regex on each t() call. This
+pre-tokenizes, per language, every value that interpolates into a segment
+list the app can render by concatenation::
+
+    "VIN auto-corrected ({{count}} changes)"
+        -> ["VIN auto-corrected (", ["count"], " changes)"]
+
+A placeholder segment is ``[name]``, ``[name, format]`` (``{{date, short}}``)
+or ``[name, format, 1]`` for unescaped ``{{- name}}``. Plural groups
+(``x_one``/``x_other``, legacy ``x``/``x_plural``) are listed with the key of
+each plural category so the renderer can pick one with Intl.PluralRules.
+
+Placeholders are validated across languages at the same time: every
+language must interpolate the same names as English for the same key, read
+with the same ``placeholders``/``flatten`` helpers as the parity checker.
+"""
+
+from typing import Dict, List
+
+from .parity import REFERENCE_LANGUAGE, flatten, placeholders
+
+INTERPOLATIONS_NAMESPACE = "_interpolations"
+INTERPOLATIONS_FORMAT = 1
+
+PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+
+def tokenize(value: str) -> list:
+    """Segment list for a value; plain strings come back as ``[value]``."""
+    segments = []
+    pos = text = 0
+    while True:
+        start = value.find("{{", pos)
+        end = value.find("}}", start + 2) if start != -1 else -1
+        if end == -1:
+            break
+        # "{{{name}}}" interpolates "name" between literal braces
+        start = value.rfind("{{", start, end)
+        pos = end + 2
+        body = value[start + 2:end].strip()
+        unescaped = body.startswith("-")
+        name, _, format_name = body.lstrip("-").partition(",")
+        name, format_name = name.strip(), format_name.strip() or None
+        if not name or "{" in name or "}" in name:
+            continue
+        if start > text:
+            segments.append(value[text:start])
+        placeholder = [name]
+        if format_name or unescaped:
+            placeholder.append(format_name)
+        if unescaped:
+            placeholder.append(1)
+        segments.append(placeholder)
+        text = pos
+    if text < len(value):
+        segments.append(value[text:])
+    return segments
+
+
+def _plural_groups(keys: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+    """``{base key: {category: key}}`` for v4 suffixes and the legacy x/x_plural pair."""
+    groups: Dict[str, Dict[str, str]] = {}
+    for key in keys:
+        base, _, suffix = key.rpartition("_")
+        if suffix in PLURAL_CATEGORIES and base:
+            groups.setdefault(base, {})[suffix] = key
+        elif suffix == "plural" and base in keys:
+            groups.setdefault(base, {}).update({"one": base, "other": key})
+    # A lone "_one" (e.g. "validation_at_least_one") is not a plural group
+    return {base: dict(sorted(g.items())) for base, g in sorted(groups.items()) if "other" in g}
+
+
+def _flatten(sections: Dict[str, dict]) -> Dict[str, str]:
+    """``{"ns.dotted.key": value}`` for the string leaves of the object namespaces."""
+    flat = flatten({namespace: value for namespace, value in sections.items() if isinstance(value, dict)})
+    return {key: value for key, value in zip(flat.keys, flat.values) if isinstance(value, str)}
+
+
+def compile_interpolations(sections: Dict[str, dict]) -> dict:
+    """Interpolation table for one language: tokenized strings and plural groups."""
+    flat = _flatten(sections)
+    strings = {key: tokenize(value) for key, value in sorted(flat.items()) if placeholders(value)}
+    return {
+        "format": INTERPOLATIONS_FORMAT,
+        "strings": strings,
+        "plurals": _plural_groups(flat),
+    }
+
+
+def validate(sources: Dict[str, Dict[str, dict]]) -> List[str]:
+    """Keys whose placeholder names differ from the reference language (``{lang: sections}``)."""
+    if REFERENCE_LANGUAGE not in sources:
+        return []
+    reference = _flatten(sources[REFERENCE_LANGUAGE])
+    issues = []
+    for lang in sorted(sources):
+        if lang == REFERENCE_LANGUAGE:
+            continue
+        for key, value in sorted(_flatten(sources[lang]).items()):
+            expected = reference.get(key)
+            # Keys missing in English are parity issues, not placeholder ones
+            if expected is None:
+                continue
+            found, wanted = placeholders(value), placeholders(expected)
+            if found != wanted:
+                issues.append(f"{lang}: {key} uses {sorted(found)}, en uses {sorted(wanted)}")
+    return issues
@@ -0,0 +1,271 @@
+"""
+Incremental inverted index of translation key usage in the source tree.
+
+audit-translations.cjs re-reads every .ts/.tsx file and runs its regexes on
+each run. This index is persisted under .cache/i18n and only rescans files
+whose size/mtime changed *and* whose content hash differs, so queries such
+as "who uses vin_scanner_hub.scan" or "which keys are missing in es" answer
+in milliseconds after the first build.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .common import CACHE_DIR, LANGUAGES, REPO_ROOT, TRANSLATIONS_DIR, namespace_dir, write_text_atomic
+from .source_scan import SRC_DIR, DEFAULT_NAMESPACE, iter_source_files, key_namespace, scan_text
+
+INDEX_PATH = CACHE_DIR / "key-index.json"
+INDEX_FORMAT = 2
+
+
+@dataclass
+class FileEntry:
+    mtime_ns: int
+    size: int
+    sha1: str
+    keys: List[Tuple[str, int]] = field(default_factory=list)
+    dynamic: List[Tuple[str, int]] = field(default_factory=list)
+    hook_namespaces: List[str] = field(default_factory=list)
+    literals: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RefreshStats:
+    scanned: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+class KeyIndex:
+    """key -> [(file, line)] over the whole source tree, refreshed incrementally."""
+
+    def __init__(self, files: Optional[Dict[str, FileEntry]] = None, roots: Iterable[Path] = (SRC_DIR,)):
+        self.files: Dict[str, FileEntry] = files or {}
+        self.roots = list(roots)
+        self._inverted: Optional[Dict[str, List[Tuple[str, int]]]] = None
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, index_path: Path = INDEX_PATH, roots: Iterable[Path] = (SRC_DIR,)) -> "KeyIndex":
+        files = {}
+        if index_path.exists():
+            try:
+                payload = json.loads(index_path.read_text(encoding="utf-8"))
+                if payload.get("format") == INDEX_FORMAT:
+                    for path, entry in payload["files"].items():
+                        files[path] = FileEntry(
+                            mtime_ns=entry["mtime_ns"],
+                            size=entry["size"],
+                            sha1=entry["sha1"],
+                            keys=[tuple(k) for k in entry["keys"]],
+                            dynamic=[tuple(d) for d in entry["dynamic"]],
+                            hook_namespaces=entry["hook_namespaces"],
+                            literals=entry["literals"],
+                        )
+            except (ValueError, KeyError, TypeError):
+                files = {}
+        return cls(files, roots)
+
+    def save(self, index_path: Path = INDEX_PATH) -> None:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": INDEX_FORMAT,
+            "files": {
+                path: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "sha1": entry.sha1,
+                    "keys": entry.keys,
+                    "dynamic": entry.dynamic,
+                    "hook_namespaces": entry.hook_namespaces,
+                    "literals": entry.literals,
+                }
+                for path, entry in sorted(self.files.items())
+            },
+        }
+        write_text_atomic(index_path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+    # -- maintenance -------------------------------------------------------
+
+    def refresh(self) -> RefreshStats:
+        """Rescan only files that were added or whose content changed."""
+        stats = RefreshStats()
+        seen = set()
+        for file_path in iter_source_files(self.roots):
+            rel_path = file_path.relative_to(REPO_ROOT).as_posix()
+            seen.add(rel_path)
+            stat = file_path.stat()
+            entry = self.files.get(rel_path)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                stats.unchanged += 1
+                continue
+
+            raw = file_path.read_bytes()
+            sha1 = hashlib.sha1(raw).hexdigest()
+            if entry and entry.sha1 == sha1:
+                # Touched but not edited (checkout, formatter no-op)
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                stats.unchanged += 1
+                continue
+
+            usage = scan_text(raw.decode("utf-8", errors="replace"), rel_path)
+            self.files[rel_path] = FileEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha1=sha1,
+                keys=usage.keys,
+                dynamic=usage.dynamic,
+                hook_namespaces=usage.hook_namespaces,
+                literals=usage.literals,
+            )
+            stats.scanned += 1
+
+        for rel_path in set(self.files) - seen:
+            del self.files[rel_path]
+            stats.removed += 1
+
+        if stats.scanned or stats.removed:
+            self._inverted = None
+        return stats
+
+    # -- queries -----------------------------------------------------------
+
+    @property
+    def inverted(self) -> Dict[str, List[Tuple[str, int]]]:
+        if self._inverted is None:
+            inverted: Dict[str, List[Tuple[str, int]]] = {}
+            for path, entry in self.files.items():
+                for key, line in entry.keys:
+                    inverted.setdefault(key, []).append((path, line))
+            for locations in inverted.values():
+                locations.sort()
+            self._inverted = inverted
+        return self._inverted
+
+    def who_uses(self, key: str) -> List[Tuple[str, int]]:
+        """
+        Static usages of ``key``. A trailing ``.*`` matches the whole subtree
+        (``vin_scanner_hub.*``). Dynamic lookups whose static prefix covers the
+        key are included with the prefix shown, e.g. ``common.status.${...}``.
+        """
+        if key.endswith(".*"):
+            prefix = key[:-1]
+            hits = [loc for k, locs in self.inverted.items() if k.startswith(prefix) for loc in locs]
+        else:
+            hits = list(self.inverted.get(key, []))
+        return sorted(set(hits))
+
+    def dynamic_matches(self, key: str) -> List[Tuple[str, int, str]]:
+        """Dynamic lookups (t(`prefix.${x}`)) that could resolve to ``key``."""
+        return sorted(
+            (path, line, prefix)
+            for path, entry in self.files.items()
+            for prefix, line in entry.dynamic
+            if prefix and key.startswith(prefix)
+        )
+
+    def used_keys(self) -> Set[str]:
+        return set(self.inverted)
+
+    def literals(self) -> Set[str]:
+        """Every dotted string literal in the tree (keys that may reach t() indirectly)."""
+        return {literal for entry in self.files.values() for literal in entry.literals}
+
+    def _resolve(self, key: str, default: str, known_namespaces: Set[str]) -> Tuple[str, str]:
+        namespace = key_namespace(key, known_namespaces)
+        return (namespace, key[len(namespace) + 1:]) if namespace else (default, key)
+
+    def lookups(self, known_namespaces: Set[str]) -> Dict[Tuple[str, str], List[Tuple[str, int]]]:
+        """
+        Static lookups resolved to ``(namespace, key path)``. Unprefixed keys
+        resolve to the file's first useTranslation namespace (or 'common').
+        """
+        resolved: Dict[Tuple[str, str], List[Tuple[str, int]]] = {}
+        for path, entry in self.files.items():
+            default = next((n for n in entry.hook_namespaces if n in known_namespaces), DEFAULT_NAMESPACE)
+            for key, line in entry.keys:
+                target = self._resolve(key, default, known_namespaces)
+                resolved.setdefault(target, []).append((path, line))
+        return resolved
+
+    def dynamic_lookups(self, known_namespaces: Set[str]) -> Set[str]:
+        """Dynamic lookup prefixes resolved to ``namespace.prefix`` (a bare prefix covers the namespace)."""
+        resolved = set()
+        for entry in self.files.values():
+            default = next((n for n in entry.hook_namespaces if n in known_namespaces), DEFAULT_NAMESPACE)
+            for prefix, _ in entry.dynamic:
+                namespace, path = self._resolve(prefix, default, known_namespaces)
+                resolved.add(f"{namespace}.{path}")
+        return resolved
+
+
+def namespace_names(base_dir: Path = TRANSLATIONS_DIR) -> Set[str]:
+    """Namespace names from the split file names - cheap, no JSON is parsed."""
+    return {path.stem for lang in LANGUAGES for path in namespace_dir(lang, base_dir).glob("*.json")}
+
+
+def has_key(sections: dict, namespace: str, key_path: str) -> bool:
+    """Nested lookup like hasNestedKey() in audit-translations.cjs (flat dotted keys also count)."""
+    current = sections.get(namespace)
+    if isinstance(current, dict) and key_path in current:
+        return True
+    for part in key_path.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return False
+        current = current[part]
+    return True
+
+
+def missing_keys(index: KeyIndex, sections: dict) -> Dict[str, List[Tuple[str, int]]]:
+    """Keys the source looks up that ``sections`` ({namespace: value}) does not define."""
+    missing = {}
+    for (namespace, key_path), locations in index.lookups(set(sections)).items():
+        if has_key(sections, namespace, key_path):
+            continue
+        # Unprefixed keys also fall back to 'common' (fallbackNS)
+        if namespace != DEFAULT_NAMESPACE and "." not in key_path and has_key(sections, DEFAULT_NAMESPACE, key_path):
+            continue
+        missing[f"{namespace}.{key_path}"] = sorted(locations)
+    return dict(sorted(missing.items()))
+
+
+def unused_patch_keys(index: KeyIndex, patch_sets) -> Dict[str, List[str]]:
+    """
+    Keys in the patch sets that no source file looks up, per patch set name.
+    Keys covered by a dynamic lookup prefix count as used.
+    """
+    known = namespace_names() | {s for p in patch_sets for sections in p.translations.values() for s in sections}
+    static = {f"{namespace}.{path}" for namespace, path in index.lookups(known)}
+    prefixes = tuple(index.dynamic_lookups(known))
+
+    unused = {}
+    for patch_set in patch_sets:
+        keys = set()
+        for sections in patch_set.translations.values():
+            for section, values in sections.items():
+                keys.update(_leaf_keys(values, section))
+        missing = sorted(k for k in keys if k not in static and not k.startswith(prefixes))
+        if missing:
+            unused[patch_set.name] = missing
+    return unused
+
+
+def _leaf_keys(value, prefix: str) -> Iterable[str]:
+    if not isinstance(value, dict):
+        yield prefix
+        return
+    for key, child in value.items():
+        yield from _leaf_keys(child, f"{prefix}.{key}")
+
+
+def load_index(refresh: bool = True, save: bool = True) -> Tuple[KeyIndex, RefreshStats]:
+    """Load the persisted index and bring it up to date."""
+    index = KeyIndex.load()
+    stats = index.refresh() if refresh else RefreshStats()
+    if save and (stats.scanned or stats.removed or not INDEX_PATH.exists()):
+        index.save()
+    return index, stats
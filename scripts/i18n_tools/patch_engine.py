@@ -0,0 +1,369 @@
+"""
+Batched translation patch engine.
+
+A patch set is a declarative ``{lang: {section: {key: value}}}`` mapping -
+the same shape as the ``TRANSLATIONS`` dict in add-vin-translations.py.
+Any number of patch sets are merged into each language file in a single
+load/merge/serialize pass, and a file is only rewritten when its canonical
+content hash actually changed.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .common import (
+    LANGUAGES,
+    TRANSLATIONS_DIR,
+    canonical_hash,
+    monolithic_path,
+    namespace_dir,
+    read_json,
+    serialize,
+    write_bytes_atomic,
+    write_text_atomic,
+)
+from .benchmark import check_file_budget
+from .parity import ParityError, check_patch_sets
+from .section_index import can_splice, load_index, save_index, splice_sections
+from .snapshots import SnapshotStore
+
+# Pending patch set files (*.json) applied by apply-translation-patches.py
+PATCH_QUEUE_DIR = Path(__file__).resolve().parent.parent / "translation-patches"
+
+
+@dataclass
+class PatchSet:
+    """One feature's worth of translation changes."""
+
+    name: str
+    translations: Dict[str, Dict[str, dict]]
+    # Sections whose keys are sorted alphabetically after merging
+    sort_sections: Sequence[str] = ()
+
+    @classmethod
+    def for_section(cls, name: str, section: str, translations: Dict[str, dict],
+                    sort: bool = False) -> "PatchSet":
+        """Build a patch set from a single-section ``{lang: {key: value}}`` dict (e.g. MISSING_KEYS)."""
+        return cls(
+            name=name,
+            translations={lang: {section: keys} for lang, keys in translations.items()},
+            sort_sections=(section,) if sort else (),
+        )
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "PatchSet":
+        """
+        Load a queued patch set. Supported layout::
+
+            {"section": "vin_scanner_hub",   # optional, for single-section sets
+             "sort": true,                   # optional
+             "translations": {"en": {...}, "es": {...}, "pt-BR": {...}}}
+        """
+        spec = read_json(file_path)
+        name = spec.get("name", file_path.stem)
+        if "section" in spec:
+            return cls.for_section(name, spec["section"], spec["translations"], spec.get("sort", False))
+        return cls(name=name, translations=spec["translations"], sort_sections=tuple(spec.get("sort_sections", ())))
+
+
+@dataclass
+class FileResult:
+    """Outcome of patching one translation file."""
+
+    lang: str
+    file_path: Path
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    created_sections: List[str] = field(default_factory=list)
+    written: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def display_name(self) -> str:
+        try:
+            return self.file_path.relative_to(TRANSLATIONS_DIR).as_posix()
+        except ValueError:
+            return self.file_path.name
+
+
+def _merge_keys(target: dict, keys: dict, prefix: str, result: FileResult) -> None:
+    """Recursively merge ``keys`` into ``target``, recording added/updated dotted keys."""
+    for key, value in keys.items():
+        full_key = f"{prefix}.{key}"
+        if isinstance(value, dict):
+            if not isinstance(target.get(key), dict):
+                if key in target:
+                    result.updated.append(full_key)
+                target[key] = {}
+            _merge_keys(target[key], value, full_key, result)
+            continue
+
+        if key not in target:
+            result.added.append(full_key)
+        elif target[key] != value:
+            result.updated.append(full_key)
+        target[key] = value
+
+
+def merge_patch_sets(data: dict, patch_sets: Iterable[PatchSet], lang: str, result: FileResult) -> dict:
+    """Merge every patch set's ``lang`` entries into ``data`` in order."""
+    for patch_set in patch_sets:
+        sections = patch_set.translations.get(lang)
+        if not sections:
+            continue
+
+        for section, keys in sections.items():
+            if section not in data:
+                data[section] = {}
+                result.created_sections.append(section)
+            _merge_keys(data[section], keys, section, result)
+
+        for section in patch_set.sort_sections:
+            if section in data:
+                data[section] = dict(sorted(data[section].items()))
+
+    return data
+
+
+def apply_to_file(file_path: Path, lang: str, patch_sets: Sequence[PatchSet],
+                  dry_run: bool = False, namespace: Optional[str] = None,
+                  budgets: Optional[dict] = None) -> FileResult:
+    """
+    Load one file, merge all patch sets, and write it back only if the content changed.
+
+    With ``namespace`` set, ``file_path`` is a split namespace file whose root
+    is the content of that one section (public/translations/{lng}/{ns}.json).
+    With ``budgets`` the file is not written if it would exceed its byte or
+    gzip budget (see benchmark.py).
+    """
+    result = FileResult(lang=lang, file_path=file_path)
+    try:
+        if namespace is None:
+            data = read_json(file_path)
+        elif file_path.exists():
+            data = {namespace: read_json(file_path)}
+        else:
+            data = {}
+
+        before = canonical_hash(data)
+        sort_sections = {s for patch_set in patch_sets for s in patch_set.sort_sections}
+        key_order = {s: list(data[s]) for s in sort_sections if isinstance(data.get(s), dict)}
+
+        merge_patch_sets(data, patch_sets, lang, result)
+
+        # Sorting only reorders keys, which the canonical hash ignores on purpose
+        reordered = any(list(data[s]) != order for s, order in key_order.items())
+        if canonical_hash(data) != before or reordered:
+            text = serialize(data if namespace is None else data[namespace])
+            if budgets and _over_budget(result, text.encode("utf-8"), budgets, namespace):
+                return result
+            if not dry_run:
+                write_text_atomic(file_path, text)
+            result.written = True
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def splice_to_file(file_path: Path, lang: str, patch_sets: Sequence[PatchSet],
+                   dry_run: bool = False, budgets: Optional[dict] = None) -> FileResult:
+    """
+    Patch only the touched sections, splicing their bytes back in place.
+
+    Uses the cached section index, so untouched sections are never decoded
+    and keep their exact bytes - small fixes produce minimal diffs. Files
+    whose sections do not each start a line (compact JSON) are rewritten
+    whole by apply_to_file() instead.
+    """
+    result = FileResult(lang=lang, file_path=file_path)
+    try:
+        index, raw = load_index(file_path)
+        if not can_splice(raw, index):
+            return apply_to_file(file_path, lang, patch_sets, dry_run=dry_run, budgets=budgets)
+
+        touched = []
+        for patch_set in patch_sets:
+            for section in patch_set.translations.get(lang, {}):
+                if section not in touched:
+                    touched.append(section)
+
+        partial = {}
+        before = {}
+        for name in touched:
+            section = index.get(name)
+            if section is None:
+                continue
+            partial[name] = json.loads(raw[section.value_start:section.value_end].decode("utf-8"))
+            before[name] = (canonical_hash(partial[name]), list(partial[name]))
+
+        merge_patch_sets(partial, patch_sets, lang, result)
+
+        updates = {
+            name: value for name, value in partial.items()
+            if name not in before or before[name] != (canonical_hash(value), list(value))
+        }
+        if updates:
+            out, new_index = splice_sections(raw, index, updates)
+            try:
+                json.loads(out.decode("utf-8-sig"))
+            except ValueError as e:
+                result.error = f"splice produced invalid JSON, file left untouched: {e}"
+                return result
+            if budgets and _over_budget(result, out, budgets, None):
+                return result
+            if not dry_run:
+                write_bytes_atomic(file_path, out)
+                stat = file_path.stat()
+                new_index.size, new_index.mtime_ns = stat.st_size, stat.st_mtime_ns
+                save_index(file_path, new_index)
+            result.written = True
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def _over_budget(result: FileResult, data: bytes, budgets: dict, namespace: Optional[str]) -> bool:
+    violations = check_file_budget(result.display_name, data, budgets, namespace)
+    if violations:
+        result.error = "over budget: " + "; ".join(violations)
+    return bool(violations)
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """One file to patch: a monolithic file (namespace=None) or a split namespace file."""
+
+    lang: str
+    namespace: Optional[str] = None
+
+    def path(self, base_dir: Path) -> Path:
+        if self.namespace is None:
+            return monolithic_path(self.lang, base_dir)
+        return namespace_dir(self.lang, base_dir) / f"{self.namespace}.json"
+
+
+def plan_units(patch_sets: Sequence[PatchSet], languages: Sequence[str],
+               namespaces: bool = False) -> List[WorkUnit]:
+    """Every file the patch sets touch, in a stable (language, namespace) order."""
+    units = []
+    for lang in languages:
+        units.append(WorkUnit(lang))
+        if namespaces:
+            sections = sorted({s for p in patch_sets for s in p.translations.get(lang, {})})
+            units.extend(WorkUnit(lang, section) for section in sections)
+    return units
+
+
+def _slice_patch_sets(patch_sets: Sequence[PatchSet], unit: WorkUnit) -> List[PatchSet]:
+    """Only the parts of each patch set a unit needs, to keep worker payloads small."""
+    sliced = []
+    for patch_set in patch_sets:
+        sections = patch_set.translations.get(unit.lang)
+        if not sections:
+            continue
+        if unit.namespace is not None:
+            if unit.namespace not in sections:
+                continue
+            sections = {unit.namespace: sections[unit.namespace]}
+        sliced.append(PatchSet(
+            name=patch_set.name,
+            translations={unit.lang: sections},
+            sort_sections=tuple(s for s in patch_set.sort_sections if s in sections),
+        ))
+    return sliced
+
+
+def _process_unit(unit: WorkUnit, patch_sets: Sequence[PatchSet], base_dir: Path,
+                  dry_run: bool, splice: bool, budgets: Optional[dict]) -> FileResult:
+    file_path = unit.path(base_dir)
+    if unit.namespace is not None:
+        return apply_to_file(file_path, unit.lang, patch_sets, dry_run=dry_run, namespace=unit.namespace,
+                             budgets=budgets)
+    if splice:
+        return splice_to_file(file_path, unit.lang, patch_sets, dry_run=dry_run, budgets=budgets)
+    return apply_to_file(file_path, unit.lang, patch_sets, dry_run=dry_run, budgets=budgets)
+
+
+def apply_patch_sets(patch_sets: Sequence[PatchSet], base_dir: Path = TRANSLATIONS_DIR,
+                     languages: Optional[Sequence[str]] = None, dry_run: bool = False,
+                     splice: bool = False, namespaces: bool = False, jobs: int = 1,
+                     guard: bool = False, snapshot: bool = False,
+                     budgets: Optional[dict] = None) -> List[FileResult]:
+    """
+    Apply all patch sets - one load/write per file.
+
+    ``namespaces`` also patches the split public/translations/{lng}/{ns}.json
+    files so they stay in sync with the monolithic ones. With ``jobs`` > 1
+    (0 = one per CPU) every (language, namespace) unit runs in a process pool;
+    results always come back in plan order, so output is deterministic.
+
+    With ``guard`` the patched keys are parity-checked across all languages
+    first, and ParityError is raised before any file is written. With
+    ``snapshot`` the translation files are recorded in the snapshot store
+    before and after the writes (see snapshots.py). Files that would exceed
+    ``budgets`` (translation-budgets.json) fail instead of being written.
+    """
+    if guard:
+        issues = check_patch_sets(patch_sets, LANGUAGES, base_dir)
+        if issues:
+            raise ParityError(issues)
+
+    if languages is None:
+        languages = [lang for lang in LANGUAGES if any(lang in p.translations for p in patch_sets)]
+
+    units = plan_units(patch_sets, languages, namespaces=namespaces)
+    work = [(unit, _slice_patch_sets(patch_sets, unit), base_dir, dry_run, splice, budgets) for unit in units]
+
+    store = SnapshotStore(base_dir=base_dir) if snapshot and not dry_run else None
+    label = ", ".join(p.name for p in patch_sets)
+    if store is not None:
+        store.capture(f"before {label}")
+
+    if jobs == 1 or len(work) <= 1:
+        results = [_process_unit(*args) for args in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            futures = [pool.submit(_process_unit, *args) for args in work]
+            results = [future.result() for future in futures]
+
+    if store is not None and any(r.written for r in results):
+        store.capture(label)
+    return results
+
+
+def load_patch_queue(queue_dir: Path = PATCH_QUEUE_DIR) -> List[PatchSet]:
+    """Load every pending ``*.json`` patch set in name order."""
+    if not queue_dir.exists():
+        return []
+    return [PatchSet.from_file(path) for path in sorted(queue_dir.glob("*.json"))]
+
+
+def print_result(result: FileResult, verbose: bool = True) -> None:
+    """Print a result in the same format the per-feature scripts used."""
+    name = result.display_name
+    if not result.ok:
+        print(f"[ERROR] Processing {name}: {result.error}")
+        return
+
+    if verbose:
+        for section in result.created_sections:
+            print(f"  + Created new section: {section}")
+        for key in result.added:
+            print(f"  + Added: {key}")
+        for key in result.updated:
+            print(f"  ~ Updated: {key}")
+
+    status = "Saved" if result.written else "Unchanged, skipped write for"
+    print(f"[OK] {status} {name}")
+    print(f"  Added: {len(result.added)} keys")
+    print(f"  Updated: {len(result.updated)} keys")
+    print()
+
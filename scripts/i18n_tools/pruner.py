@@ -0,0 +1,136 @@
+"""
+Dead-key detection and pruning for production bundles.
+
+A key is live when the source can reach it:
+
+- a static lookup of the key, or of an ancestor (returnObjects subtrees)
+- a static lookup of its plural base (``count`` -> ``count_one``, ``count_other``)
+- a dynamic lookup whose static prefix covers it (t(`common.status.${s}`))
+- a dotted string literal naming it (config arrays passed to t(item.labelKey))
+
+Unprefixed lookups count against every namespace the file's useTranslation()
+hook names plus 'common' (fallbackNS). Everything else is reported as dead,
+with the bytes it adds to the minified bundle. Pruning only ever produces
+new data - the source translation files are never modified.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .compiler import minify
+from .key_index import KeyIndex
+from .source_scan import DEFAULT_NAMESPACE, key_namespace
+
+PLURAL_SUFFIXES = ("zero", "one", "two", "few", "many", "other", "plural")
+
+
+@dataclass
+class Liveness:
+    """Fully qualified (``ns.path``) live keys and prefixes derived from the key index."""
+
+    static: Set[str] = field(default_factory=set)
+    prefixes: Tuple[str, ...] = ()
+    literals: Set[str] = field(default_factory=set)
+
+    def is_live(self, namespace: str, path: str) -> bool:
+        full_key = f"{namespace}.{path}"
+        if full_key.startswith(self.prefixes):
+            return True
+
+        base, _, suffix = path.rpartition("_")
+        candidates = [path]
+        if base and suffix in PLURAL_SUFFIXES:
+            candidates.append(base)
+
+        for candidate in candidates:
+            parts = candidate.split(".")
+            for end in range(len(parts), 0, -1):
+                ancestor = ".".join(parts[:end])
+                if f"{namespace}.{ancestor}" in self.static or f"{namespace}.{ancestor}" in self.literals:
+                    return True
+                if ancestor in self.literals:
+                    return True
+        return False
+
+
+def build_liveness(index: KeyIndex, known_namespaces: Set[str]) -> Liveness:
+    static, prefixes = set(), set()
+    for entry in index.files.values():
+        fallback = [n for n in entry.hook_namespaces if n in known_namespaces] + [DEFAULT_NAMESPACE]
+        for key, _ in entry.keys:
+            namespace = key_namespace(key, known_namespaces)
+            if namespace:
+                static.add(key)
+            else:
+                static.update(f"{n}.{key}" for n in fallback)
+        for prefix, _ in entry.dynamic:
+            namespace = key_namespace(prefix, known_namespaces) if "." in prefix else None
+            if namespace:
+                prefixes.add(prefix)
+            else:
+                prefixes.update(f"{n}.{prefix}" for n in fallback)
+    return Liveness(static=static, prefixes=tuple(sorted(prefixes)), literals=index.literals())
+
+
+@dataclass
+class NamespaceReport:
+    namespace: str
+    keys: int = 0
+    bytes: int = 0
+    dead_keys: List[Tuple[str, int]] = field(default_factory=list)  # (path, approx. bytes)
+    dead_bytes: int = 0  # exact: minified size before - after
+
+    @property
+    def dead(self) -> int:
+        return len(self.dead_keys)
+
+
+def _leaf_cost(key: str, value) -> int:
+    # '"key":value' plus the separating comma
+    return len(minify({key: value})) - 1
+
+
+def _prune(value: dict, namespace: str, prefix: str, liveness: Liveness,
+           report: NamespaceReport) -> dict:
+    kept = {}
+    for key, child in value.items():
+        path = f"{prefix}{key}"
+        if isinstance(child, dict):
+            pruned = _prune(child, namespace, f"{path}.", liveness, report)
+            if pruned:
+                kept[key] = pruned
+            continue
+        report.keys += 1
+        if liveness.is_live(namespace, path):
+            kept[key] = child
+        else:
+            report.dead_keys.append((path, _leaf_cost(key, child)))
+    return kept
+
+
+def prune_sections(sections: Dict[str, dict], liveness: Liveness) -> Tuple[Dict[str, dict], List[NamespaceReport]]:
+    """Return ``sections`` without dead keys plus a report per namespace."""
+    pruned, reports = {}, []
+    for namespace in sorted(sections):
+        value = sections[namespace]
+        report = NamespaceReport(namespace=namespace, bytes=len(minify(value)))
+        if isinstance(value, dict):
+            kept = _prune(value, namespace, "", liveness, report)
+        else:
+            kept = value
+        report.dead_bytes = report.bytes - len(minify(kept))
+        # A namespace with no live keys stays (empty) so loaders never 404 on it
+        pruned[namespace] = kept
+        reports.append(report)
+    return pruned, reports
+
+
+def prune_sources(sources: Dict[str, Dict[str, dict]], index: KeyIndex,
+                  languages: Iterable[str] = None) -> Tuple[Dict[str, Dict[str, dict]], Dict[str, List[NamespaceReport]]]:
+    """Prune every language in ``{lang: {namespace: value}}``; returns (pruned sources, reports by language)."""
+    known = {namespace for sections in sources.values() for namespace in sections}
+    liveness = build_liveness(index, known)
+    pruned, reports = {}, {}
+    for lang in languages or sources:
+        pruned[lang], reports[lang] = prune_sections(sources[lang], liveness)
+    return pruned, reports
@@ -0,0 +1,282 @@
+"""
+Static route-to-namespace analyzer.
+
+Parses the <Route> tree in src/App.tsx, follows local imports from each
+route's element components, and resolves every t('ns.key') lookup it finds
+to a namespace. The result is a per-route manifest of the namespaces a route
+can provably touch, so startup can load only what the landing route needs
+instead of PRELOAD_NAMESPACES = ALL_NAMESPACES.
+
+The analysis over-approximates on purpose: every import is followed, and
+unprefixed or dynamic keys count towards the hook namespaces and 'common'.
+Loading a few extra namespaces is cheap; missing one shows raw keys (the
+reason the hand-picked critical list was rolled back).
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .common import LANGUAGES, TRANSLATIONS_DIR, load_namespace_files, monolithic_path, read_json
+from .compiler import COMPILED_DIR, emit_namespace
+from .source_scan import (
+    SRC_DIR,
+    FileUsage,
+    file_namespaces,
+    resolve_import,
+    scan_file,
+)
+
+APP_ENTRY = SRC_DIR / "App.tsx"
+MAIN_ENTRY = SRC_DIR / "main.tsx"
+ROUTES_MANIFEST_NAME = "routes.json"
+
+_DEFAULT_IMPORT = re.compile(r"""import\s+(\w+)\s*(?:,\s*\{([^}]*)\})?\s+from\s+['"]([^'"]+)['"]""")
+_NAMED_IMPORT = re.compile(r"""import\s*\{([^}]*)\}\s*from\s+['"]([^'"]+)['"]""")
+_ROUTE_TOKEN = re.compile(r"<Route\b|</Route>")
+_COMPONENT = re.compile(r"<([A-Z]\w*)")
+_ATTR_NAME = re.compile(r"[\w-]+")
+_JSX_COMMENT = re.compile(r"\{/\*.*?\*/\}", re.S)
+
+
+@dataclass
+class RouteInfo:
+    path: str
+    components: List[str] = field(default_factory=list)  # own + inherited from layouts
+
+
+def known_namespaces(base_dir: Path = TRANSLATIONS_DIR) -> Set[str]:
+    names = set()
+    for lang in LANGUAGES:
+        names |= set(load_namespace_files(lang, base_dir))
+        if monolithic_path(lang, base_dir).exists():
+            names |= set(read_json(monolithic_path(lang, base_dir)))
+    return names
+
+
+def _component_imports(text: str) -> Dict[str, str]:
+    """Identifier -> import specifier for the imports in a file."""
+    imports = {}
+    for default, named, specifier in _DEFAULT_IMPORT.findall(text):
+        imports[default] = specifier
+        for name in named.split(","):
+            name = name.strip().split(" as ")[-1].strip()
+            if name:
+                imports[name] = specifier
+    for named, specifier in _NAMED_IMPORT.findall(text):
+        for name in named.split(","):
+            name = name.strip().split(" as ")[-1].strip()
+            if name:
+                imports[name] = specifier
+    return imports
+
+
+def _read_tag(text: str, pos: int):
+    """Parse JSX attributes from ``pos`` to the end of the tag; returns (attrs, end, self_closing)."""
+    attrs = {}
+    length = len(text)
+    while pos < length:
+        while pos < length and text[pos].isspace():
+            pos += 1
+        if text.startswith("/>", pos):
+            return attrs, pos + 2, True
+        if text[pos] == ">":
+            return attrs, pos + 1, False
+
+        name_match = _ATTR_NAME.match(text, pos)
+        if not name_match:
+            pos += 1
+            continue
+        name = name_match.group()
+        pos = name_match.end()
+        if not text.startswith("=", pos):
+            attrs[name] = True
+            continue
+        pos += 1
+        if text[pos] in "\"'":
+            end = text.index(text[pos], pos + 1)
+            attrs[name] = text[pos + 1:end]
+            pos = end + 1
+        elif text[pos] == "{":
+            depth = 0
+            start = pos
+            while pos < length:
+                char = text[pos]
+                if char in "\"'`":
+                    pos = text.index(char, pos + 1)
+                elif char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                pos += 1
+            attrs[name] = text[start + 1:pos]
+            pos += 1
+    return attrs, pos, True
+
+
+def _join(parent: str, path: Optional[str]) -> str:
+    if path is None:
+        return parent
+    if path.startswith("/"):
+        return path
+    return parent.rstrip("/") + "/" + path
+
+
+def parse_routes(text: str, parent: str = "", inherited: Optional[List[str]] = None) -> List[RouteInfo]:
+    """Flatten a JSX <Route> tree (including <Routes> nested inside elements) into RouteInfo entries."""
+    text = _JSX_COMMENT.sub("", text)
+    inherited = inherited or []
+    routes = []
+    stack = [(parent or "/", inherited)]
+    pos = 0
+    while True:
+        match = _ROUTE_TOKEN.search(text, pos)
+        if not match:
+            break
+        if match.group() == "</Route>":
+            if len(stack) > 1:
+                stack.pop()
+            pos = match.end()
+            continue
+
+        attrs, pos, self_closing = _read_tag(text, match.end())
+        parent_path, parent_components = stack[-1]
+        path = _join(parent_path, attrs.get("path") if isinstance(attrs.get("path"), str) else None)
+        element = attrs.get("element") if isinstance(attrs.get("element"), str) else ""
+
+        # Routes nested inside the element (e.g. stock/*) inherit this route's wrappers
+        nested_start = element.find("<Routes")
+        own_markup = element[:nested_start] if nested_start != -1 else element
+        own = [name for name in _COMPONENT.findall(own_markup) if name not in ("Routes", "Route")]
+        components = parent_components + [name for name in own if name not in parent_components]
+
+        if element:
+            routes.append(RouteInfo(path=path, components=components))
+        if nested_start != -1:
+            routes.extend(parse_routes(element[nested_start:], path.rstrip("*").rstrip("/") or "/", components))
+        if not self_closing:
+            stack.append((path, components))
+
+    return routes
+
+
+class ImportGraph:
+    """Memoized file scans and transitive local-import closure."""
+
+    def __init__(self):
+        self.usages: Dict[Path, FileUsage] = {}
+        self.edges: Dict[Path, List[Path]] = {}
+
+    def usage(self, file_path: Path) -> FileUsage:
+        if file_path not in self.usages:
+            usage = scan_file(file_path)
+            self.usages[file_path] = usage
+            self.edges[file_path] = [
+                resolved for resolved in (resolve_import(spec, file_path) for spec in usage.imports)
+                if resolved is not None and resolved.suffix in (".ts", ".tsx")
+            ]
+        return self.usages[file_path]
+
+    def closure(self, roots: List[Path], exclude: Set[Path] = frozenset()) -> Set[Path]:
+        seen = set()
+        pending = [root for root in roots if root not in exclude]
+        while pending:
+            file_path = pending.pop()
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            self.usage(file_path)
+            pending.extend(child for child in self.edges[file_path] if child not in seen and child not in exclude)
+        return seen
+
+
+def _namespaces_for(files: Set[Path], graph: ImportGraph, known: Set[str]):
+    namespaces, unresolved = set(), 0
+    for file_path in files:
+        found, dynamic = file_namespaces(graph.usage(file_path), known)
+        namespaces |= found
+        unresolved += dynamic
+    return namespaces, unresolved
+
+
+def analyze_routes(app_entry: Path = APP_ENTRY, main_entry: Path = MAIN_ENTRY,
+                   base_dir: Path = TRANSLATIONS_DIR) -> dict:
+    """
+    Build the route manifest::
+
+        {"shell": [...namespaces every route needs...],
+         "routes": {"/sales": {"namespaces": [...], "components": [...],
+                               "files": 412, "unresolved": 0}}}
+    """
+    known = known_namespaces(base_dir)
+    graph = ImportGraph()
+    app_text = app_entry.read_text(encoding="utf-8")
+    imports = _component_imports(app_text)
+    routes = parse_routes(app_text[app_text.find("<Routes"):])
+
+    def component_file(name: str) -> Optional[Path]:
+        specifier = imports.get(name)
+        return resolve_import(specifier, app_entry) if specifier else None
+
+    route_component_files = {component_file(name) for route in routes for name in route.components}
+    route_component_files.discard(None)
+
+    # The shell is everything App/main pull in that is not a route element
+    shell_roots = [main_entry] if main_entry.exists() else []
+    shell_roots.append(app_entry.resolve())
+    shell_files = graph.closure(shell_roots, exclude=route_component_files)
+    shell_namespaces, shell_unresolved = _namespaces_for(shell_files, graph, known)
+
+    manifest = {"shell": sorted(shell_namespaces), "routes": {}}
+    for route in routes:
+        roots = [f for f in (component_file(name) for name in route.components) if f is not None]
+        files = graph.closure(roots, exclude=shell_files)
+        namespaces, unresolved = _namespaces_for(files, graph, known)
+        entry = manifest["routes"].setdefault(route.path, {
+            "namespaces": [], "components": [], "files": 0, "unresolved": 0,
+        })
+        entry["namespaces"] = sorted(set(entry["namespaces"]) | namespaces | shell_namespaces)
+        entry["components"] = sorted(set(entry["components"]) | set(route.components))
+        entry["files"] = max(entry["files"], len(files) + len(shell_files))
+        entry["unresolved"] = max(entry["unresolved"], unresolved + shell_unresolved)
+
+    manifest["routes"] = dict(sorted(manifest["routes"].items()))
+    return manifest
+
+
+def route_slug(path: str) -> str:
+    """File-system friendly name for a route path: '/admin/:id' -> 'admin__id'."""
+    slug = re.sub(r"[^\w]+", "_", path.strip("/").replace(":", "_").replace("*", "all"))
+    return slug.strip("_") or "root"
+
+
+def emit_route_bundles(manifest: dict, sources: Dict[str, Dict[str, dict]],
+                       out_dir: Path = COMPILED_DIR, precompress: bool = True) -> Dict[str, Dict[str, dict]]:
+    """
+    Write one merged ``{namespace: value}`` bundle per route and language, so a
+    route can be served with a single request. Returns ``{route: {lang: entry}}``.
+    """
+    bundles = {}
+    for route, entry in manifest["routes"].items():
+        slug = route_slug(route)
+        bundles[route] = {}
+        for lang, sections in sources.items():
+            bundle = {ns: sections[ns] for ns in entry["namespaces"] if ns in sections}
+            bundles[route][lang] = emit_namespace(lang, f"routes/{slug}", bundle, out_dir, precompress)
+    return bundles
+
+
+def remove_stale_bundles(bundles: Dict[str, Dict[str, dict]], out_dir: Path = COMPILED_DIR) -> List[str]:
+    live = {entry["file"] for by_lang in bundles.values() for entry in by_lang.values()}
+    removed = []
+    for lang_dir in sorted(out_dir.glob("*/routes")):
+        lang = lang_dir.parent.name
+        for file_path in sorted(lang_dir.iterdir()):
+            base = re.sub(r"\.(gz|br)$", "", file_path.name)
+            if f"{lang}/routes/{base}" not in live:
+                file_path.unlink()
+                removed.append(f"{lang}/routes/{file_path.name}")
+    return removed
@@ -0,0 +1,224 @@
+"""
+Trigram search over every translation key and value.
+
+Translators add keys without knowing whether "Scan History" or "Escanear"
+already exists in one of ~250 namespaces, so near-duplicates pile up. This
+keeps a persisted trigram index (pg_trgm style: lower-cased, accents folded,
+each word padded) over the merged build source of all languages under
+.cache/i18n and answers ranked fuzzy queries in a few milliseconds.
+
+The index is rebuilt whenever the size or mtime of any monolithic or split
+translation file changes; a full build takes about a second.
+"""
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .common import CACHE_DIR, LANGUAGES, TRANSLATIONS_DIR, monolithic_path, namespace_dir, write_text_atomic
+from .compiler import load_sources
+from .parity import flatten
+
+SEARCH_INDEX_PATH = CACHE_DIR / "search-index.json"
+SEARCH_INDEX_FORMAT = 1
+
+FIELDS = ("value", "key")
+DUPLICATE_THRESHOLD = 0.8
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Lower-case, strip accents, collapse punctuation (and key separators) to spaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return _NON_WORD.sub(" ", folded).strip()
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    grams = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass
+class Match:
+    lang: str
+    key: str
+    value: str
+    field: str
+    score: float       # ranking score (query coverage and similarity)
+    similarity: float  # Jaccard similarity of the trigram sets
+
+
+class SearchIndex:
+    """(lang, key, value) documents with one trigram posting list per field."""
+
+    def __init__(self, docs: Optional[List[Tuple[str, str, str]]] = None,
+                 stamps: Optional[Dict[str, List[int]]] = None):
+        self.docs: List[Tuple[str, str, str]] = docs or []
+        self.stamps: Dict[str, List[int]] = stamps or {}
+        self.postings: Dict[str, Dict[str, List[int]]] = {name: {} for name in FIELDS}
+        self.sizes: Dict[str, List[int]] = {name: [] for name in FIELDS}
+
+    # -- building ----------------------------------------------------------
+
+    @classmethod
+    def build(cls, languages: Sequence[str] = LANGUAGES, base_dir: Path = TRANSLATIONS_DIR) -> "SearchIndex":
+        docs = []
+        for lang, sections in load_sources(languages, base_dir).items():
+            flat = flatten(sections)
+            docs.extend((lang, key, value) for key, value in zip(flat.keys, flat.values) if isinstance(value, str))
+        index = cls(docs, source_stamps(languages, base_dir))
+        index._index_docs()
+        return index
+
+    def _index_docs(self) -> None:
+        for name in FIELDS:
+            postings: Dict[str, List[int]] = {}
+            sizes = []
+            for doc_id, (_, key, value) in enumerate(self.docs):
+                grams = trigrams(value if name == "value" else key)
+                sizes.append(len(grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(doc_id)
+            self.postings[name] = postings
+            self.sizes[name] = sizes
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, index_path: Path = SEARCH_INDEX_PATH) -> Optional["SearchIndex"]:
+        if not index_path.exists():
+            return None
+        try:
+            payload = json.loads(index_path.read_text(encoding="utf-8"))
+            if payload.get("format") != SEARCH_INDEX_FORMAT:
+                return None
+            index = cls([tuple(doc) for doc in payload["docs"]], payload["stamps"])
+            index.postings = payload["postings"]
+            index.sizes = payload["sizes"]
+        except (ValueError, KeyError, TypeError):
+            return None
+        return index
+
+    def save(self, index_path: Path = SEARCH_INDEX_PATH) -> None:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": SEARCH_INDEX_FORMAT,
+            "stamps": self.stamps,
+            "docs": self.docs,
+            "postings": self.postings,
+            "sizes": self.sizes,
+        }
+        write_text_atomic(index_path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+    # -- queries -----------------------------------------------------------
+
+    def _candidates(self, grams: FrozenSet[str], field: str) -> Counter:
+        shared: Counter = Counter()
+        postings = self.postings[field]
+        for gram in grams:
+            shared.update(postings.get(gram, ()))
+        return shared
+
+    def search(self, query: str, languages: Optional[Iterable[str]] = None,
+               fields: Sequence[str] = FIELDS, limit: int = 20, min_score: float = 0.3) -> List[Match]:
+        """
+        Ranked fuzzy matches. The score averages how much of the query a
+        document contains with the overall similarity, so "scan history"
+        ranks "Scan History" first but still finds "View scan history".
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        wanted = set(languages) if languages else None
+        best: Dict[int, Match] = {}
+        for field in fields:
+            sizes = self.sizes[field]
+            for doc_id, shared in self._candidates(grams, field).items():
+                lang, key, value = self.docs[doc_id]
+                if wanted is not None and lang not in wanted:
+                    continue
+                similarity = shared / (len(grams) + sizes[doc_id] - shared)
+                score = (shared / len(grams) + similarity) / 2
+                if score < min_score or (doc_id in best and best[doc_id].score >= score):
+                    continue
+                best[doc_id] = Match(lang, key, value, field, round(score, 3), round(similarity, 3))
+        return sorted(best.values(), key=lambda m: (-m.score, m.lang, m.key))[:limit]
+
+    def duplicates(self, value: str, lang: Optional[str] = None,
+                   threshold: float = DUPLICATE_THRESHOLD) -> List[Match]:
+        """Existing values (in ``lang``, or any language) whose similarity to ``value`` is at least ``threshold``."""
+        grams = trigrams(value)
+        if not grams:
+            return []
+        target = normalize(value)
+        sizes = self.sizes["value"]
+        matches = []
+        for doc_id, shared in self._candidates(grams, "value").items():
+            doc_lang, key, existing = self.docs[doc_id]
+            if lang is not None and doc_lang != lang:
+                continue
+            similarity = 1.0 if normalize(existing) == target else shared / (len(grams) + sizes[doc_id] - shared)
+            if similarity >= threshold:
+                matches.append(Match(doc_lang, key, existing, "value", round(similarity, 3), round(similarity, 3)))
+        return sorted(matches, key=lambda m: (-m.similarity, m.lang, m.key))
+
+
+def source_stamps(languages: Sequence[str] = LANGUAGES, base_dir: Path = TRANSLATIONS_DIR) -> Dict[str, List[int]]:
+    """``{relative path: [mtime_ns, size]}`` for every file the index is built from."""
+    stamps = {}
+    for lang in languages:
+        paths = [monolithic_path(lang, base_dir), *sorted(namespace_dir(lang, base_dir).glob("*.json"))]
+        for file_path in paths:
+            if file_path.exists():
+                stat = file_path.stat()
+                stamps[file_path.relative_to(base_dir).as_posix()] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+
+def load_search_index(rebuild: bool = False, save: bool = True) -> Tuple[SearchIndex, bool]:
+    """Persisted index, rebuilt when a translation file changed. Returns ``(index, rebuilt)``."""
+    index = None if rebuild else SearchIndex.load()
+    if index is not None and index.stamps == source_stamps():
+        return index, False
+    index = SearchIndex.build()
+    if save:
+        index.save()
+    return index, True
+
+
+def _leaf_values(value, prefix: str) -> Iterable[Tuple[str, str]]:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield from _leaf_values(child, f"{prefix}.{key}")
+    elif isinstance(value, str):
+        yield prefix, value
+
+
+def duplicate_patch_values(index: SearchIndex, patch_sets,
+                           threshold: float = DUPLICATE_THRESHOLD) -> Dict[str, List[Tuple[str, str, str, List[Match]]]]:
+    """
+    New values in the patch sets that (nearly) duplicate an existing value in
+    the same language, per patch set name: ``[(lang, key, value, matches)]``.
+    A key matching its own current value (an update) is not reported.
+    """
+    found = {}
+    for patch_set in patch_sets:
+        entries = []
+        for lang, sections in patch_set.translations.items():
+            for section, values in sections.items():
+                for key, value in _leaf_values(values, section):
+                    matches = [m for m in index.duplicates(value, lang, threshold) if m.key != key]
+                    if matches:
+                        entries.append((lang, key, value, matches))
+        if entries:
+            found[patch_set.name] = entries
+    return found
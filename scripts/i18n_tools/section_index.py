@@ -0,0 +1,245 @@
+"""
+Byte-offset index of the top-level sections in a monolithic translation file.
+
+Changing one section such as ``vin_scanner_hub`` should not require decoding
+and re-serializing all 80 sections of en.json. The index records where each
+section's value starts and ends, is cached under .cache/i18n keyed by file
+size and mtime, and lets the patch engine splice a single section's bytes
+back into the file. Untouched sections are never decoded and their bytes
+(and formatting) are left exactly as they were.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .common import CACHE_DIR, write_text_atomic
+
+INDEX_CACHE_DIR = CACHE_DIR / "section-index"
+INDEX_FORMAT = 1
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass
+class Section:
+    name: str
+    key_start: int    # offset of the opening quote of the key
+    value_start: int  # offset of the first byte of the value
+    value_end: int    # offset one past the last byte of the value
+
+
+@dataclass
+class SectionIndex:
+    size: int
+    mtime_ns: int
+    root_end: int  # offset of the root object's closing brace
+    newline: str
+    sections: List[Section] = field(default_factory=list)
+
+    def get(self, name: str) -> Optional[Section]:
+        for section in self.sections:
+            if section.name == name:
+                return section
+        return None
+
+
+class SectionIndexError(ValueError):
+    """Raised when a file is not a JSON object the index can describe."""
+
+
+def build_index(raw: bytes, size: int = 0, mtime_ns: int = 0) -> SectionIndex:
+    """
+    Scan the root object once and record the byte span of every section.
+
+    The scan leans on the C JSON scanner to find where each value ends, then
+    converts character offsets to byte offsets one section at a time.
+    """
+    bom = 3 if raw.startswith(b"\xef\xbb\xbf") else 0
+    text = raw[bom:].decode("utf-8")
+
+    pos = _WHITESPACE.match(text, 0).end()
+    if text[pos:pos + 1] != "{":
+        raise SectionIndexError("Translation file is not a JSON object")
+
+    newline = "\r\n" if "\r\n" in text[:4096] else "\n"
+    sections = []
+    byte_pos, char_pos = bom, 0
+
+    def to_bytes(offset: int) -> int:
+        nonlocal byte_pos, char_pos
+        byte_pos += len(text[char_pos:offset].encode("utf-8"))
+        char_pos = offset
+        return byte_pos
+
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    while text[pos:pos + 1] != "}":
+        if text[pos:pos + 1] != '"':
+            raise SectionIndexError(f"Expected a section name at character {pos}")
+        key_start = pos
+        name, pos = json.decoder.scanstring(text, pos + 1)
+
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos:pos + 1] != ":":
+            raise SectionIndexError(f"Expected ':' after {name!r} at character {pos}")
+        value_start = _WHITESPACE.match(text, pos + 1).end()
+        try:
+            _, value_end = _DECODER.raw_decode(text, value_start)
+        except json.JSONDecodeError as e:
+            raise SectionIndexError(f"Invalid value for section {name!r}: {e}") from e
+
+        sections.append(Section(name, to_bytes(key_start), to_bytes(value_start), to_bytes(value_end)))
+
+        pos = _WHITESPACE.match(text, value_end).end()
+        if text[pos:pos + 1] == ",":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+
+    if pos >= len(text):
+        raise SectionIndexError("Translation file ends before the root object is closed")
+
+    return SectionIndex(size=size, mtime_ns=mtime_ns, root_end=to_bytes(pos), newline=newline, sections=sections)
+
+
+def _cache_path(file_path: Path) -> Path:
+    return INDEX_CACHE_DIR / f"{file_path.parent.name}__{file_path.name}.idx.json"
+
+
+def save_index(file_path: Path, index: SectionIndex) -> None:
+    INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": INDEX_FORMAT,
+        "size": index.size,
+        "mtime_ns": index.mtime_ns,
+        "root_end": index.root_end,
+        "newline": index.newline,
+        "sections": [[s.name, s.key_start, s.value_start, s.value_end] for s in index.sections],
+    }
+    write_text_atomic(_cache_path(file_path), json.dumps(payload, ensure_ascii=False))
+
+
+def load_index(file_path: Path, raw: Optional[bytes] = None) -> Tuple[SectionIndex, bytes]:
+    """Return the section index and raw bytes, rebuilding the cached index if the file changed."""
+    stat = file_path.stat()
+    if raw is None:
+        raw = file_path.read_bytes()
+
+    cache_path = _cache_path(file_path)
+    if cache_path.exists():
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            if (payload["format"] == INDEX_FORMAT and payload["size"] == stat.st_size
+                    and payload["mtime_ns"] == stat.st_mtime_ns):
+                index = SectionIndex(
+                    size=payload["size"],
+                    mtime_ns=payload["mtime_ns"],
+                    root_end=payload["root_end"],
+                    newline=payload["newline"],
+                    sections=[Section(*entry) for entry in payload["sections"]],
+                )
+                # Cheap sanity check that the cached offsets still line up
+                first = index.sections[0] if index.sections else None
+                if first is None or raw[first.key_start:first.key_start + 1] == b'"':
+                    return index, raw
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    index = build_index(raw, stat.st_size, stat.st_mtime_ns)
+    save_index(file_path, index)
+    return index, raw
+
+
+def read_section(file_path: Path, name: str):
+    """Decode a single section without touching the rest of the file."""
+    index, raw = load_index(file_path)
+    section = index.get(name)
+    if section is None:
+        raise KeyError(name)
+    return json.loads(raw[section.value_start:section.value_end].decode("utf-8"))
+
+
+def _line_indent(raw: bytes, offset: int) -> str:
+    """Leading whitespace of the line holding ``offset``."""
+    line_start = raw.rfind(b"\n", 0, offset) + 1
+    line = raw[line_start:offset].decode("utf-8")
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+def can_splice(raw: bytes, index: SectionIndex) -> bool:
+    """
+    Whether every section key starts its own line, as in files written by
+    serialize(). Compact or minified JSON has other content before a key, so
+    there is no line indent to reuse and the file must be rewritten whole.
+    """
+    for section in index.sections:
+        line_start = raw.rfind(b"\n", 0, section.key_start) + 1
+        prefix = raw[line_start:section.key_start].lstrip(b"\xef\xbb\xbf")
+        if prefix.strip(b" \t\r"):
+            return False
+    return True
+
+
+def encode_section(value, indent: str, newline: str) -> bytes:
+    """Encode a section value so it sits at ``indent`` inside the root object."""
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    text = text.replace("\n", newline + indent)
+    return text.encode("utf-8")
+
+
+def splice_sections(raw: bytes, index: SectionIndex,
+                    updates: Dict[str, object]) -> Tuple[bytes, SectionIndex]:
+    """
+    Return ``raw`` with each section in ``updates`` replaced by its new value,
+    plus the shifted index for the new bytes.
+
+    Sections not yet in the file are appended after the last section in the
+    order they appear in ``updates``. Only for files where can_splice() holds.
+    """
+    if not index.sections:
+        # Nothing to splice against - an empty root is cheap to rebuild
+        text = json.dumps(updates, ensure_ascii=False, indent=2) + index.newline
+        out = text.replace("\n", index.newline).encode("utf-8")
+        return out, build_index(out)
+
+    newline = index.newline
+    chunks = []
+    sections = []
+    cursor = 0
+    delta = 0
+    for section in index.sections:
+        if section.name in updates:
+            data = encode_section(updates[section.name], _line_indent(raw, section.key_start), newline)
+            chunks.append(raw[cursor:section.value_start])
+            chunks.append(data)
+            cursor = section.value_end
+            sections.append(Section(section.name, section.key_start + delta, section.value_start + delta,
+                                    section.value_start + delta + len(data)))
+            delta += len(data) - (section.value_end - section.value_start)
+        else:
+            sections.append(Section(section.name, section.key_start + delta,
+                                    section.value_start + delta, section.value_end + delta))
+
+    last_end = index.sections[-1].value_end
+    chunks.append(raw[cursor:last_end])
+    position = last_end + delta
+    indent = _line_indent(raw, index.sections[0].key_start)
+    for name, value in updates.items():
+        if index.get(name) is not None:
+            continue
+        prefix = f",{newline}{indent}".encode("utf-8")
+        key = f"{json.dumps(name, ensure_ascii=False)}: ".encode("utf-8")
+        data = encode_section(value, indent, newline)
+        key_start = position + len(prefix)
+        value_start = key_start + len(key)
+        sections.append(Section(name, key_start, value_start, value_start + len(data)))
+        chunks.extend((prefix, key, data))
+        position = value_start + len(data)
+        delta = position - last_end
+
+    chunks.append(raw[last_end:])
+    out = b"".join(chunks)
+    new_index = SectionIndex(size=len(out), mtime_ns=0, root_end=index.root_end + delta,
+                             newline=newline, sections=sections)
+    return out, new_index
@@ -0,0 +1,232 @@
+"""
+Content-addressed snapshot store for the translation files.
+
+Instead of another en.json.backupN next to the real file, every patch run
+records a snapshot under .cache/i18n/snapshots::
+
+    objects/ab/cdef...   zlib-compressed blobs, named by sha256 of the content
+    log.jsonl            one snapshot per line: {id, time, label, files}
+
+A monolithic file is stored as a small tree: the glue bytes between sections
+(keys, whitespace) inline, and one blob per section value. Snapshots that
+only differ in vin_scanner_hub therefore share the other 79 section blobs,
+so a backup costs roughly the size of the sections that changed. Split
+namespace files are stored as one blob each (unchanged namespaces are shared
+the same way). Files are restored byte for byte.
+"""
+
+import hashlib
+import json
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .common import CACHE_DIR, LANGUAGES, TRANSLATIONS_DIR, monolithic_path, namespace_dir, write_bytes_atomic
+from .section_index import SectionIndexError, build_index
+
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+TREE_FORMAT = 1
+
+# Backups the old scripts left next to the monolithic files
+BACKUP_SUFFIXES = (".backup", ".backup2")
+BACKUP_MONOLITHIC_DIR = "_backup_monolithic"
+
+
+@dataclass
+class Snapshot:
+    id: str
+    time: str
+    label: str
+    files: Dict[str, str] = field(default_factory=dict)  # path relative to the translations dir -> tree hash
+
+
+class SnapshotStore:
+    """Append-only snapshot log over a content-addressed object store."""
+
+    def __init__(self, root: Path = SNAPSHOT_DIR, base_dir: Path = TRANSLATIONS_DIR):
+        self.root = root
+        self.base_dir = base_dir
+        self.objects_dir = root / "objects"
+        self.log_path = root / "log.jsonl"
+        self.stat_cache_path = root / "stat-cache.json"
+        self._stat_cache: Optional[Dict[str, list]] = None
+
+    # -- objects -----------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(object_path, zlib.compress(data, 6))
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+
+    def put_file(self, raw: bytes, sectioned: bool) -> str:
+        """Store a file as a tree of glue strings and blob hashes; returns the tree hash."""
+        parts: List[str] = []
+        index = None
+        if sectioned:
+            try:
+                index = build_index(raw)
+            except (SectionIndexError, ValueError):
+                index = None
+
+        if index is None:
+            parts = ["", self.put(raw), ""]
+        else:
+            pos = 0
+            for section in index.sections:
+                parts.append(raw[pos:section.value_start].decode("utf-8"))
+                parts.append(self.put(raw[section.value_start:section.value_end]))
+                pos = section.value_end
+            parts.append(raw[pos:].decode("utf-8"))
+
+        tree = {"format": TREE_FORMAT, "size": len(raw), "parts": parts}
+        return self.put(json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def read_file(self, tree_hash: str) -> bytes:
+        tree = json.loads(self.get(tree_hash))
+        chunks = []
+        for i, part in enumerate(tree["parts"]):
+            chunks.append(part.encode("utf-8") if i % 2 == 0 else self.get(part))
+        return b"".join(chunks)
+
+    # -- tracked files -----------------------------------------------------
+
+    def tracked_files(self) -> List[Path]:
+        files = []
+        for lang in LANGUAGES:
+            if monolithic_path(lang, self.base_dir).exists():
+                files.append(monolithic_path(lang, self.base_dir))
+            files.extend(sorted(namespace_dir(lang, self.base_dir).glob("*.json")))
+        return files
+
+    def _relative(self, file_path: Path) -> str:
+        return file_path.relative_to(self.base_dir).as_posix()
+
+    def _load_stat_cache(self) -> Dict[str, list]:
+        if self._stat_cache is None:
+            try:
+                self._stat_cache = json.loads(self.stat_cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._stat_cache = {}
+        return self._stat_cache
+
+    def file_tree(self, file_path: Path) -> str:
+        """Tree hash for a file, reusing the last one if size and mtime are unchanged."""
+        cache = self._load_stat_cache()
+        rel_path = self._relative(file_path)
+        stat = file_path.stat()
+        cached = cache.get(rel_path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns and \
+                self._object_path(cached[2]).exists():
+            return cached[2]
+        tree_hash = self.put_file(file_path.read_bytes(), sectioned="/" not in rel_path)
+        cache[rel_path] = [stat.st_size, stat.st_mtime_ns, tree_hash]
+        return tree_hash
+
+    def _save_stat_cache(self) -> None:
+        if self._stat_cache is not None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(self.stat_cache_path, json.dumps(self._stat_cache).encode("utf-8"))
+
+    # -- snapshots ---------------------------------------------------------
+
+    def history(self) -> List[Snapshot]:
+        if not self.log_path.exists():
+            return []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            return [Snapshot(**json.loads(line)) for line in f if line.strip()]
+
+    def _append(self, label: str, files: Dict[str, str], time: Optional[str] = None) -> Snapshot:
+        time = time or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        record = {"time": time, "label": label, "files": files}
+        snapshot_id = hashlib.sha256(json.dumps(record, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        snapshot = Snapshot(id=snapshot_id, **record)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(snapshot), ensure_ascii=False, sort_keys=True) + "\n")
+        return snapshot
+
+    def capture(self, label: str) -> Optional[Snapshot]:
+        """Snapshot every tracked file; returns None if nothing changed since the last full snapshot."""
+        files = {self._relative(path): self.file_tree(path) for path in self.tracked_files()}
+        self._save_stat_cache()
+        previous = next((s for s in reversed(self.history()) if not s.label.startswith("import:")), None)
+        if previous is not None and previous.files == files:
+            return None
+        return self._append(label, files)
+
+    def resolve(self, snapshot_id: str) -> Snapshot:
+        matches = [s for s in self.history() if s.id.startswith(snapshot_id)]
+        if len(matches) != 1:
+            raise KeyError(f"{'Ambiguous' if matches else 'Unknown'} snapshot id: {snapshot_id}")
+        return matches[0]
+
+    def rollback(self, snapshot_id: str, paths: Sequence[str] = (), dry_run: bool = False) -> List[str]:
+        """
+        Restore the files recorded in a snapshot (optionally only ``paths``).
+        The current state is captured first, so a rollback can itself be undone.
+        Returns the relative paths that were (or would be) rewritten.
+        """
+        target = self.resolve(snapshot_id)
+        if not dry_run:
+            self.capture(f"before rollback to {target.id}")
+
+        changed = []
+        for rel_path, tree_hash in sorted(target.files.items()):
+            if paths and rel_path not in paths:
+                continue
+            file_path = self.base_dir / rel_path
+            if file_path.exists() and self.file_tree(file_path) == tree_hash:
+                continue
+            changed.append(rel_path)
+            if not dry_run:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                write_bytes_atomic(file_path, self.read_file(tree_hash))
+        self._save_stat_cache()
+        return changed
+
+    def import_backups(self) -> List[Snapshot]:
+        """
+        Record the legacy *.json.backup* files and _backup_monolithic/ as
+        snapshots (oldest first). Already imported backups are skipped.
+        """
+        groups: Dict[str, List[Tuple[str, Path]]] = {}
+        for lang in LANGUAGES:
+            for suffix in BACKUP_SUFFIXES:
+                backup = self.base_dir / f"{lang}.json{suffix}"
+                if backup.exists():
+                    groups.setdefault(f"import: *.json{suffix}", []).append((f"{lang}.json", backup))
+            backup = self.base_dir / BACKUP_MONOLITHIC_DIR / f"{lang}.json"
+            if backup.exists():
+                groups.setdefault(f"import: {BACKUP_MONOLITHIC_DIR}/", []).append((f"{lang}.json", backup))
+
+        existing = {s.label for s in self.history()}
+        ordered = sorted(groups.items(), key=lambda item: max(path.stat().st_mtime_ns for _, path in item[1]))
+        imported = []
+        for label, entries in ordered:
+            if label in existing:
+                continue
+            files = {rel_path: self.put_file(path.read_bytes(), sectioned=True) for rel_path, path in entries}
+            mtime = max(path.stat().st_mtime for _, path in entries)
+            time = datetime.fromtimestamp(mtime, timezone.utc).isoformat(timespec="seconds")
+            imported.append(self._append(label, files, time))
+        return imported
+
+    def usage(self) -> Tuple[int, int]:
+        """(number of objects, compressed bytes on disk)."""
+        count = size = 0
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob("*/*"):
+                count += 1
+                size += object_path.stat().st_size
+        return count, size
@@ -0,0 +1,194 @@
+"""
+Lightweight scanner for translation usage and imports in the TypeScript source.
+
+This is deliberately regex based (like scripts/audit-translations.cjs) so it
+runs without node_modules. It extracts, per file:
+
+- static keys:   t('vin_scanner_hub.scan'), i18n.t("..."), i18nKey="..."
+- dynamic keys:  t(`common.status.${order.status}`) -> prefix "common.status."
+- hook namespaces: useTranslation('ns') / useTranslation(['a', 'b'])
+- dotted string literals: 'nav.dashboard' in config arrays later passed to t(item.key)
+- local imports (static, re-exports and dynamic import())
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .common import REPO_ROOT
+
+SRC_DIR = REPO_ROOT / "src"
+SOURCE_EXTENSIONS = (".ts", ".tsx")
+RESOLVE_SUFFIXES = ("", ".ts", ".tsx", ".js", ".jsx", "/index.ts", "/index.tsx", "/index.js")
+SKIP_DIRS = {"node_modules", "dist", "build", "__tests__", "tests"}
+
+# Matches the default namespace config in src/lib/i18n.ts
+DEFAULT_NAMESPACE = "common"
+
+# Starts with the literal "t(" so the regex engine can skip ahead quickly; the
+# character before the match is checked in Python (t( but not set( or foo.t().
+# Groups: 2 = static key in quotes, 3 = template text, 4 = "${" when dynamic
+_T_CALL = re.compile(r"""t\(\s*(?:(['"])([^'"\n]+)\1|`([^`$\n]*)(\$\{|`))""")
+_I18N_KEY_ATTR = re.compile(r"""i18nKey=\{?\s*['"]([^'"\n]+)['"]""")
+_HOOK = re.compile(r"""useTranslation\(\s*(\[[^\]]*\]|['"][^'"]+['"])""")
+_HOOK_NAMES = re.compile(r"""['"]([^'"]+)['"]""")
+_DOTTED_LITERAL = re.compile(r"""['"`]([A-Za-z_][\w-]*(?:\.[\w-]+)+)['"`]""")
+# "from '...'" covers imports and re-exports; "import '...'" and "import('...')"
+# cover side-effect and dynamic imports
+_IMPORT = re.compile(r"""(?:from|import)\s*\(?\s*['"]([^'"\n]+)['"]""")
+
+
+@dataclass
+class FileUsage:
+    """Translation usage and local imports found in one source file."""
+
+    path: str  # repo-relative, forward slashes
+    keys: List[Tuple[str, int]] = field(default_factory=list)       # (key, line)
+    dynamic: List[Tuple[str, int]] = field(default_factory=list)    # (static prefix, line)
+    hook_namespaces: List[str] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)                # raw specifiers
+    literals: List[str] = field(default_factory=list)               # dotted strings, possible indirect keys
+
+
+def _line_starts(text: str) -> List[int]:
+    starts = [0]
+    index = text.find("\n")
+    while index != -1:
+        starts.append(index + 1)
+        index = text.find("\n", index + 1)
+    return starts
+
+
+def _line_of(starts: List[int], offset: int) -> int:
+    # Binary search - files can have thousands of lines and hundreds of keys
+    lo, hi = 0, len(starts) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if starts[mid] <= offset:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo + 1
+
+
+def _is_translate_call(text: str, start: int) -> bool:
+    """True for t( and i18n.t( but not set(, foo.t( or $t(."""
+    before = text[start - 1:start]
+    if not before:
+        return True
+    if before == ".":
+        return text.endswith("i18n", 0, start - 1)
+    return not (before.isalnum() or before in "_$")
+
+
+def scan_text(text: str, rel_path: str) -> FileUsage:
+    usage = FileUsage(path=rel_path)
+    starts = _line_starts(text)
+
+    for match in _T_CALL.finditer(text):
+        start = match.start()
+        if not _is_translate_call(text, start):
+            continue
+        if match.group(2) is not None:
+            usage.keys.append((match.group(2), _line_of(starts, start)))
+        elif match.group(4) == "${":
+            usage.dynamic.append((match.group(3), _line_of(starts, start)))
+        else:
+            usage.keys.append((match.group(3), _line_of(starts, start)))
+    for match in _I18N_KEY_ATTR.finditer(text):
+        usage.keys.append((match.group(1), _line_of(starts, match.start())))
+
+    for match in _HOOK.finditer(text):
+        for name in _HOOK_NAMES.findall(match.group(1)):
+            if name not in usage.hook_namespaces:
+                usage.hook_namespaces.append(name)
+
+    usage.literals = sorted(set(_DOTTED_LITERAL.findall(text)))
+
+    for match in _IMPORT.finditer(text):
+        specifier = match.group(1)
+        if specifier not in usage.imports:
+            usage.imports.append(specifier)
+
+    return usage
+
+
+def scan_file(file_path: Path) -> FileUsage:
+    text = file_path.read_text(encoding="utf-8", errors="replace")
+    return scan_text(text, relative(file_path))
+
+
+def relative(file_path: Path) -> str:
+    return file_path.resolve().relative_to(REPO_ROOT).as_posix()
+
+
+def iter_source_files(directories: Iterable[Path]) -> Iterable[Path]:
+    """All .ts/.tsx files under the given directories (tests and build output skipped)."""
+    for directory in directories:
+        if not directory.is_dir():
+            continue
+        for file_path in sorted(directory.rglob("*")):
+            if file_path.suffix not in SOURCE_EXTENSIONS or not file_path.is_file():
+                continue
+            if SKIP_DIRS.intersection(file_path.relative_to(directory).parts[:-1]):
+                continue
+            yield file_path
+
+
+def resolve_import(specifier: str, importer: Path) -> Optional[Path]:
+    """Resolve a local import specifier (``@/`` alias or relative) to a file, or None."""
+    if specifier.startswith("@/"):
+        base = SRC_DIR / specifier[2:]
+    elif specifier.startswith("."):
+        base = importer.parent / specifier
+    else:
+        return None
+
+    for suffix in RESOLVE_SUFFIXES:
+        candidate = Path(f"{base}{suffix}")
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def key_namespace(key: str, known_namespaces: Set[str]) -> Optional[str]:
+    """Namespace a ``ns.key`` lookup resolves to (nsSeparator is '.'), or None if unprefixed."""
+    head, sep, _ = key.partition(".")
+    if sep and head in known_namespaces:
+        return head
+    return None
+
+
+def file_namespaces(usage: FileUsage, known_namespaces: Set[str]) -> Tuple[Set[str], int]:
+    """
+    Namespaces a file's lookups can hit, plus the number of lookups whose
+    namespace could not be determined statically.
+    """
+    namespaces = set()
+    unresolved = 0
+    fallback = set(n for n in usage.hook_namespaces if n in known_namespaces) | {DEFAULT_NAMESPACE}
+
+    for key, _ in usage.keys:
+        namespace = key_namespace(key, known_namespaces)
+        if namespace:
+            namespaces.add(namespace)
+        else:
+            # Unprefixed keys go to the hook's namespaces, then fallbackNS
+            namespaces |= fallback
+
+    for prefix, _ in usage.dynamic:
+        namespace = key_namespace(prefix, known_namespaces) if "." in prefix else None
+        if namespace:
+            namespaces.add(namespace)
+        else:
+            namespaces |= fallback
+            unresolved += 1
+
+    if usage.hook_namespaces:
+        namespaces |= fallback
+    return namespaces, unresolved
+
+
+def scan_tree(directories: Iterable[Path]) -> Dict[str, FileUsage]:
+    return {relative(path): scan_file(path) for path in iter_source_files(directories)}
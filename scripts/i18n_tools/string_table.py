@@ -0,0 +1,95 @@
+"""
+Shared string table for compiled translations.
+
+The same values ("Status", "Pending", "Upload Image", ...) appear in many
+namespaces. In string-table mode the compiler interns every value whose
+repetition costs more than a table slot into one per-language array and
+replaces each occurrence with its integer index::
+
+    en/_strings.<hash>.json   ["Status", "Pending", ...]
+    en/orders.<hash>.json     {"status": 0, "title": "Orders", ...}
+
+Translation leaves are always strings, so an integer leaf is unambiguous.
+Indices are assigned by descending frequency so the most common values get
+the shortest references. Source files are never affected.
+"""
+
+import json
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+STRING_TABLE_NAMESPACE = "_strings"
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _leaves(value) -> Iterable[str]:
+    if isinstance(value, dict):
+        for child in value.values():
+            yield from _leaves(child)
+    elif isinstance(value, str):
+        yield value
+    else:
+        raise ValueError(f"String table mode needs string leaves, found {type(value).__name__}: {value!r}")
+
+
+def build_string_table(sections: Dict[str, dict]) -> List[str]:
+    """Values worth interning for one language, most frequent first."""
+    counts = Counter(value for section in sections.values() for value in _leaves(section))
+    candidates = sorted((s for s, n in counts.items() if n > 1), key=lambda s: (-counts[s], s))
+
+    table = []
+    for value in candidates:
+        encoded = len(_dumps(value))
+        reference = len(str(len(table)))
+        # Inline: n copies. Interned: one copy + comma in the table + n references
+        if counts[value] * encoded > encoded + 1 + counts[value] * reference:
+            table.append(value)
+    return table
+
+
+def encode(value, lookup: Dict[str, int]):
+    if isinstance(value, dict):
+        return {key: encode(child, lookup) for key, child in value.items()}
+    return lookup.get(value, value)
+
+
+def decode(value, table: List[str]):
+    """Inverse of encode(); what the loader does after fetching a namespace."""
+    if isinstance(value, dict):
+        return {key: decode(child, table) for key, child in value.items()}
+    if isinstance(value, int):
+        return table[value]
+    return value
+
+
+def encode_sections(sections: Dict[str, dict]) -> Tuple[List[str], Dict[str, dict]]:
+    """Return ``(table, {namespace: compact value})`` for one language."""
+    table = build_string_table(sections)
+    lookup = {value: index for index, value in enumerate(table)}
+    return table, {namespace: encode(value, lookup) for namespace, value in sections.items()}
+
+
+@dataclass
+class Savings:
+    namespace: str
+    plain: int    # minified bytes without the table
+    compact: int  # minified bytes with references
+
+    @property
+    def saved(self) -> int:
+        return self.plain - self.compact
+
+
+def measure_savings(sections: Dict[str, dict]) -> Tuple[List[Savings], int]:
+    """Per-namespace savings and the size of the table every namespace shares."""
+    table, compact = encode_sections(sections)
+    savings = [
+        Savings(namespace, len(_dumps(sections[namespace]).encode("utf-8")),
+                len(_dumps(compact[namespace]).encode("utf-8")))
+        for namespace in sorted(sections)
+    ]
+    return savings, len(_dumps(table).encode("utf-8"))
@@ -0,0 +1,376 @@
+"""
+Watch-mode incremental translation builds.
+
+A long-running daemon that watches the monolithic {lng}.json files and the
+patch queue, and on every edit re-derives only what changed:
+
+1. The edited file is re-indexed (section_index, no full decode) and each
+   section's bytes are hashed; only sections whose hash changed are decoded.
+2. The structural diff of each changed section (old vs new) is applied to the
+   split {lng}/{ns}.json file, so keys that only exist in the split file are
+   kept and only the actual edit propagates. A section deleted from the
+   monolithic file takes its keys out of the split file (which is removed
+   once empty, and never created); a namespace with nothing left is dropped
+   from the manifest.
+3. That namespace is re-emitted into _compiled/ (English edits also re-emit
+   es/pt-BR, whose fallback-filled content may change) and the manifest is
+   rewritten.
+
+Saving a patch definition applies it (spliced, split files included), which
+in turn shows up as a monolithic edit. File events come from inotify through
+ctypes on Linux, with a stat-polling fallback everywhere else.
+"""
+
+import copy
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .common import (
+    LANGUAGES,
+    TRANSLATIONS_DIR,
+    fill_missing,
+    namespace_dir,
+    read_json,
+    serialize,
+    write_text_atomic,
+)
+from .compiler import (
+    COMPILED_DIR,
+    compile_translations,
+    emit_namespace,
+    load_sources,
+    remove_stale,
+    write_manifest,
+)
+from .benchmark import load_budgets
+from .deltas import apply_delta, diff
+from .fallback import FALLBACK_CHAINS, resolve_fallbacks, resolve_language
+from .patch_engine import PATCH_QUEUE_DIR, PatchSet, apply_patch_sets
+from .section_index import build_index
+
+# Events arriving within this window are handled as one batch (editors
+# often write, then rename, then touch)
+DEBOUNCE_SECONDS = 0.02
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Directory watches through inotify(7), called via ctypes."""
+
+    def __init__(self, directories: Iterable[Path]):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, Path] = {}
+        # Completed writes only: a plain save closes the file, an atomic one renames it
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self.watches[wd] = directory
+
+    def _read(self) -> Set[Path]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            pos = 0
+            while pos < len(data):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(data, pos)
+                name = data[pos + _EVENT_HEADER.size:pos + _EVENT_HEADER.size + length].rstrip(b"\0")
+                pos += _EVENT_HEADER.size + length
+                if name and wd in self.watches:
+                    changed.add(self.watches[wd] / os.fsdecode(name))
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until something changes (or ``timeout``), then drain a debounced batch."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = self._read()
+        while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+            changed |= self._read()
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback: compares (mtime, size) of the watched files."""
+
+    def __init__(self, directories: Iterable[Path], interval: float = 0.25):
+        self.directories = list(directories)
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        state = {}
+        for directory in self.directories:
+            for file_path in directory.glob("*.json"):
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                state[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {path for path, stamp in state.items() if self._state.get(path) != stamp}
+            self._state = state
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(directories: Iterable[Path], poll: bool = False):
+    directories = list(directories)
+    if not poll:
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories)
+
+
+@dataclass
+class Rebuild:
+    """What one batch of file events changed."""
+
+    trigger: Path
+    sections: List[Tuple[str, str]] = field(default_factory=list)  # (lang, namespace) edited
+    synced: List[str] = field(default_factory=list)                # split files rewritten
+    emitted: List[str] = field(default_factory=list)               # compiled files written
+    dropped: List[str] = field(default_factory=list)               # namespaces taken out of the manifest
+    patched: List[str] = field(default_factory=list)               # patch sets applied
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+
+def _section_hashes(raw: bytes) -> Dict[str, Tuple[str, bytes]]:
+    index = build_index(raw)
+    return {
+        section.name: (hashlib.sha1(raw[section.value_start:section.value_end]).hexdigest(),
+                       raw[section.value_start:section.value_end])
+        for section in index.sections
+    }
+
+
+def _drop_keys(target: dict, source: dict) -> None:
+    """Remove the keys of ``source`` from ``target`` (recursively), pruning objects left empty."""
+    for key, value in source.items():
+        if key not in target:
+            continue
+        if isinstance(target[key], dict) and isinstance(value, dict):
+            _drop_keys(target[key], value)
+            if target[key]:
+                continue
+        del target[key]
+
+
+class TranslationDaemon:
+    """Keeps the split files and _compiled/ in step with the monolithic files."""
+
+    def __init__(self, base_dir: Path = TRANSLATIONS_DIR, out_dir: Path = COMPILED_DIR,
+                 queue_dir: Path = PATCH_QUEUE_DIR, precompress: bool = False):
+        self.base_dir = base_dir
+        self.out_dir = out_dir
+        self.queue_dir = queue_dir
+        self.precompress = precompress
+        self.sections: Dict[str, Dict[str, Tuple[str, bytes]]] = {}  # lang -> section -> (hash, bytes)
+        self.sources: Dict[str, Dict[str, dict]] = {}                 # unresolved build source
+        self.manifest: dict = {}
+
+    def watched_directories(self) -> List[Path]:
+        directories = [self.base_dir]
+        if self.queue_dir.is_dir():
+            directories.append(self.queue_dir)
+        return directories
+
+    def start(self) -> dict:
+        """Index the monolithic files and do one full build to start from a consistent state."""
+        for lang in LANGUAGES:
+            self.sections[lang] = _section_hashes((self.base_dir / f"{lang}.json").read_bytes())
+        self.sources = load_sources(LANGUAGES, self.base_dir)
+        resolved, reports = resolve_fallbacks(self.sources, self.base_dir)
+        summary = compile_translations(LANGUAGES, self.base_dir, self.out_dir, self.precompress,
+                                       sources=resolved,
+                                       fallbacks={lang: FALLBACK_CHAINS[lang] for lang in reports})
+        self.manifest = summary["manifest"]
+        return summary
+
+    def handle(self, paths: Iterable[Path]) -> List[Rebuild]:
+        rebuilds = []
+        for path in sorted(paths):
+            if path.suffix != ".json" or path.name.startswith("."):
+                continue
+            started = time.perf_counter()
+            if path.parent == self.queue_dir:
+                rebuild = self._apply_patch(path)
+            elif path.parent == self.base_dir and path.stem in LANGUAGES:
+                rebuild = self._rebuild_language(path)
+            else:
+                continue
+            rebuild.elapsed_ms = (time.perf_counter() - started) * 1000
+            rebuilds.append(rebuild)
+        return rebuilds
+
+    def _apply_patch(self, path: Path) -> Rebuild:
+        rebuild = Rebuild(trigger=path)
+        if not path.exists():
+            return rebuild
+        try:
+            patch_set = PatchSet.from_file(path)
+            results = apply_patch_sets([patch_set], self.base_dir, splice=True, namespaces=True,
+                                       guard=True, snapshot=True, budgets=load_budgets())
+        except (OSError, ValueError, KeyError) as e:
+            rebuild.error = str(e)
+            return rebuild
+        errors = [f"{r.display_name}: {r.error}" for r in results if not r.ok]
+        rebuild.error = "; ".join(errors) or None
+        rebuild.patched.append(patch_set.name)
+        return rebuild
+
+    def _rebuild_language(self, path: Path) -> Rebuild:
+        lang = path.stem
+        rebuild = Rebuild(trigger=path)
+        try:
+            current = _section_hashes(path.read_bytes())
+        except (OSError, ValueError) as e:
+            # Usually a half-saved file; the next save triggers another event
+            rebuild.error = str(e)
+            return rebuild
+
+        previous = self.sections.get(lang, {})
+        changed = [name for name, (digest, _) in current.items() if previous.get(name, ("",))[0] != digest]
+        removed = [name for name in previous if name not in current]
+        self.sections[lang] = current
+
+        for name in changed:
+            old = json.loads(previous[name][1]) if name in previous else {}
+            new = json.loads(current[name][1])
+            if old == new:
+                continue  # reformatted, not edited
+            rebuild.sections.append((lang, name))
+            self._sync_namespace(lang, name, old, new, rebuild)
+        for name in removed:
+            rebuild.sections.append((lang, name))
+            self._remove_namespace(lang, name, json.loads(previous[name][1]), rebuild)
+
+        namespaces = {name for _, name in rebuild.sections}
+        if namespaces:
+            self._emit(lang, namespaces, rebuild)
+        return rebuild
+
+    def _sync_namespace(self, lang: str, namespace: str, old, new, rebuild: Rebuild) -> None:
+        """Apply the section's edit to the split file and the in-memory build source."""
+        split_path = namespace_dir(lang, self.base_dir) / f"{namespace}.json"
+        current = read_json(split_path) if split_path.exists() else None
+
+        if isinstance(current, dict) and isinstance(old, dict) and isinstance(new, dict):
+            # Only the edit propagates; keys that exist only in the split file stay
+            sets, deletes = diff(old, new)
+            delta = {"set": [[list(p), v] for p, v in sets], "delete": [list(p) for p in deletes]}
+            value = apply_delta(copy.deepcopy(current), delta)
+        else:
+            value = new
+
+        if value != current:
+            split_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(split_path, serialize(value))
+            rebuild.synced.append(f"{lang}/{namespace}.json")
+
+        # Same "merged" rule as compiler.load_source: split file + monolithic-only keys
+        source = copy.deepcopy(value)
+        if isinstance(source, dict) and isinstance(new, dict):
+            fill_missing(source, new)
+        self.sources[lang][namespace] = source
+
+    def _remove_namespace(self, lang: str, namespace: str, old, rebuild: Rebuild) -> None:
+        """Take a deleted section's keys out of the split file and the build source."""
+        split_path = namespace_dir(lang, self.base_dir) / f"{namespace}.json"
+        current = read_json(split_path) if split_path.exists() else None
+
+        if isinstance(current, dict) and isinstance(old, dict):
+            # Keys that exist only in the split file stay
+            value = copy.deepcopy(current)
+            _drop_keys(value, old)
+        else:
+            value = None if current == old else current
+
+        if value != current:
+            if value:
+                write_text_atomic(split_path, serialize(value))
+            else:
+                split_path.unlink()
+            rebuild.synced.append(f"{lang}/{namespace}.json")
+
+        if value:
+            self.sources[lang][namespace] = value
+        else:
+            self.sources[lang].pop(namespace, None)
+
+    def _emit(self, lang: str, namespaces: Set[str], rebuild: Rebuild) -> None:
+        # English edits can change what es/pt-BR inherit through the fallback chain
+        targets = [lang] + [l for l, chain in FALLBACK_CHAINS.items() if lang in chain]
+        for target in targets:
+            chain = FALLBACK_CHAINS.get(target, ())
+            for namespace in sorted(namespaces):
+                own = {namespace: self.sources[target][namespace]} if namespace in self.sources[target] else {}
+                fallbacks = [{namespace: self.sources[f][namespace]} for f in chain if namespace in self.sources[f]]
+                resolved, _ = resolve_language(own, fallbacks)
+                languages = self.manifest.setdefault("languages", {}).setdefault(target, {})
+                if namespace not in resolved:
+                    # Removed everywhere in the chain: the loader must not request it anymore
+                    if languages.pop(namespace, None) is not None:
+                        rebuild.dropped.append(f"{target}/{namespace}")
+                    continue
+                entry = emit_namespace(target, namespace, resolved[namespace], self.out_dir, self.precompress)
+                if languages.get(namespace, {}).get("file") != entry["file"]:
+                    languages[namespace] = entry
+                    rebuild.emitted.append(entry["file"])
+
+        if rebuild.emitted or rebuild.dropped:
+            write_manifest(self.manifest, self.out_dir)
+            remove_stale(self.manifest, self.out_dir)
+
+    def run(self, watcher, on_rebuild=None, stop_after: Optional[int] = None) -> None:
+        """Event loop; ``on_rebuild`` is called with each Rebuild (used for logging)."""
+        handled = 0
+        while stop_after is None or handled < stop_after:
+            changed = watcher.wait()
+            for rebuild in self.handle(changed):
+                handled += 1
+                if on_rebuild is not None:
+                    on_rebuild(rebuild)
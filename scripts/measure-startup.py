@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Cold vs warm vs stale-cache startup timings of the web app
+
+Runs a probe flow (initial-load by default) in each cache state and prints
+the step timings and translation loading side by side:
+
+  cold   fresh browser context - nothing cached (what loading-performance
+         .spec.ts measures)
+  warm   primed persistent profile: HTTP cache, service worker
+         translations-cache and the i18n sessionStorage cache all fresh
+  stale  primed profile whose i18n sessionStorage entries are past
+         CACHE_DURATION_MS, so the app refetches
+
+Primed profiles live in .cache/probes/profiles/ and are reused across runs
+and invocations until the app build changes (--reprime forces it).
+
+Usage:
+  python scripts/measure-startup.py
+  python scripts/measure-startup.py --runs 10 --state warm --state stale
+  python scripts/measure-startup.py --flow role-notifications-modal --reprime
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import replace
+
+from probe_tools.flows import FLOWS
+from probe_tools.load import percentile
+from probe_tools.profiles import CACHE_STATES
+from probe_tools.runner import BASE_URL, OUTPUT_DIR, ProbeConfig, run_probes
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cold/warm/stale-cache startup timings")
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="initial-load")
+    parser.add_argument("--state", action="append", dest="states", choices=CACHE_STATES,
+                        help="Cache state to measure (repeatable, default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per cache state")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Runs in flight at once (1 keeps timings free of contention)")
+    parser.add_argument("--reprime", action="store_true", help="Re-prime the pooled profiles first")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=int, default=15000, help="Per-action timeout in ms")
+    return parser.parse_args()
+
+
+def summarize(results) -> dict:
+    """Median/p90 per step plus translation loading, over the successful runs."""
+    ok = [r for r in results if r.ok]
+    steps = {}
+    for result in ok:
+        for step in result.steps:
+            steps.setdefault(step.name, []).append(step.elapsed_ms)
+    translations = [
+        [entry for step in r.steps if step.trace for entry in step.trace["translations"]] for r in ok
+    ]
+    primes = [r.data["profile"]["prime_ms"] for r in results
+              if r.data.get("profile", {}).get("primed")]
+    return {
+        "runs": len(results),
+        "failed": len(results) - len(ok),
+        "errors": sorted({r.error for r in results if r.error}),
+        "steps": {
+            name: {"median_ms": statistics.median(values), "p90_ms": percentile(sorted(values), 90)}
+            for name, values in steps.items()
+        },
+        "total_ms": statistics.median(r.elapsed_ms for r in ok) if ok else None,
+        "translation_files": statistics.median(len(t) for t in translations) if ok else None,
+        "translation_cached": statistics.median(sum(e["cached"] for e in t) for t in translations) if ok else None,
+        "translation_kb": statistics.median(
+            sum(e["transfer_size"] for e in t) / 1024 for t in translations
+        ) if ok else None,
+        "prime_ms": primes,
+    }
+
+
+def print_table(summaries: dict) -> None:
+    states = list(summaries)
+    print(f"{'':<30}" + "".join(f"{state:>18}" for state in states))
+
+    def row(label, values):
+        print(f"{label:<30}" + "".join(f"{value:>18}" for value in values))
+
+    step_names = list(dict.fromkeys(name for s in summaries.values() for name in s["steps"]))
+    for name in step_names:
+        row(name, [
+            f"{s['steps'][name]['median_ms']:.0f} / {s['steps'][name]['p90_ms']:.0f} ms" if name in s["steps"] else "-"
+            for s in summaries.values()
+        ])
+    row("total (median)", [f"{s['total_ms']:.0f} ms" if s["total_ms"] is not None else "-" for s in summaries.values()])
+    row("translation files", [
+        f"{s['translation_files']:.0f} ({s['translation_cached']:.0f} cached)" if s["translation_files"] is not None else "-"
+        for s in summaries.values()
+    ])
+    row("translation transfer", [
+        f"{s['translation_kb']:.1f} KB" if s["translation_kb"] is not None else "-" for s in summaries.values()
+    ])
+    row("failed runs", [f"{s['failed']}/{s['runs']}" for s in summaries.values()])
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    states = args.states or list(CACHE_STATES)
+    # Tracing supplies the per-request translation timings and cache hits
+    config = ProbeConfig(base_url=args.base_url, headless=not args.headed, concurrency=args.concurrency,
+                         timeout_ms=args.timeout, trace=True, screenshots=False, reprime=args.reprime)
+
+    print("=" * 60)
+    print(f"Startup Timings: {args.flow} x {args.runs}")
+    print("=" * 60)
+    print()
+
+    summaries = {}
+    for state in states:
+        try:
+            results = run_probes([(args.flow, FLOWS[args.flow])] * args.runs, replace(config, cache_state=state))
+        except (RuntimeError, ValueError) as e:
+            print(f"[ERROR] {state}: {e}")
+            return 1
+        summaries[state] = summarize(results)
+        status = "[OK]" if not summaries[state]["failed"] else "[WARN]"
+        primed = summaries[state]["prime_ms"]
+        note = f", primed {len(primed)} profile(s) in {sum(primed):.0f} ms" if primed else ""
+        print(f"{status} {state}: {args.runs} run(s){note}")
+        for error in summaries[state]["errors"]:
+            print(f"  ! {error}")
+
+    print()
+    print("step: median / p90")
+    print_table(summaries)
+    print()
+
+    out_path = OUTPUT_DIR / "startup" / f"{time.strftime('%Y%m%d-%H%M%S')}-{args.flow}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps({"flow": args.flow, "states": summaries}, indent=2) + "\n", encoding="utf-8")
+
+    failed = sum(s["failed"] for s in summaries.values())
+    print("=" * 60)
+    print(f"COMPLETE: {sum(s['runs'] for s in summaries.values())} runs, {failed} failed")
+    print(f"Report: {out_path}")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
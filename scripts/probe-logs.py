@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Query console logs captured by the browser probes
+
+Reads .cache/probes/<run>/console.jsonl (written by run-probes.py and the
+probe scripts) and filters it by tag, message type, text or sequence number.
+
+Usage:
+  python scripts/probe-logs.py role-notifications-modal               # tag summary
+  python scripts/probe-logs.py role-notifications-modal --tag DealerRoles
+  python scripts/probe-logs.py role-notifications-modal --type error --type pageerror
+  python scripts/probe-logs.py path/to/console.jsonl --contains "events enabled"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from probe_tools.console import read_jsonl
+from probe_tools.runner import OUTPUT_DIR
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Query captured probe console logs")
+    parser.add_argument("run", help="Run name (as printed by run-probes.py) or a console.jsonl path")
+    parser.add_argument("--tag", action="append", dest="tags", help="Only records with this [Tag] (repeatable)")
+    parser.add_argument("--type", action="append", dest="types",
+                        help="Only this message type: log, warning, error, pageerror... (repeatable)")
+    parser.add_argument("--contains", help="Only records whose text contains this")
+    parser.add_argument("--since", type=int, default=0, help="Only records after this sequence number")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    file_path = Path(args.run)
+    if not file_path.is_file():
+        file_path = OUTPUT_DIR / args.run / "console.jsonl"
+    if not file_path.is_file():
+        print(f"[ERROR] No console log found for {args.run} ({file_path})")
+        return 1
+
+    capture = read_jsonl(file_path)
+
+    if not (args.tags or args.types or args.contains or args.since):
+        print(f"{len(capture.buffer)} record(s) in {file_path}")
+        for tag, count in capture.tag_counts().most_common():
+            print(f"  {count:>6}  [{tag}]")
+        return 0
+
+    records = capture.records(args.tags, args.types, args.since, args.contains)
+    for record in records:
+        print(f"#{record.seq:<6} {record.elapsed_ms:>9.0f} ms  {record.format()}")
+    print()
+    print(f"{len(records)} record(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
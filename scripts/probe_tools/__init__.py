@@ -0,0 +1,18 @@
+"""
+Python browser probes for the web app (Playwright, async).
+
+The ad-hoc probe scripts (test-modal-simple.py, test-notifications-modal.py)
+and scripts/run-probes.py describe flows as async functions and run them
+through the same runner: concurrent isolated browser contexts, event-driven
+waits instead of fixed sleeps, and per-step timings.
+"""
+
+from .runner import ProbeConfig, ProbeResult, run_probes
+from .flows import FLOWS
+
+__all__ = [
+    "FLOWS",
+    "ProbeConfig",
+    "ProbeResult",
+    "run_probes",
+]
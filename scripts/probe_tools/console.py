@@ -0,0 +1,193 @@
+"""
+Console capture for probes.
+
+Every console message is parsed once into a ConsoleRecord: its ``[Tag]``
+prefixes (``[RoleNotificationsModal]``, ``[DealerRoles]``...) are extracted
+and indexed, so filtering by tag afterwards never re-scans message text.
+Records live in a bounded ring buffer (old records are evicted together with
+their index entries) and are streamed to JSONL by a background thread, so a
+probe against a chatty page neither grows without bound nor blocks on I/O.
+"""
+
+import json
+import queue
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CAPACITY = 5000
+
+# "[Tag]" tokens near the start of a message, after an optional emoji/prefix
+_TAG = re.compile(r"\[([A-Za-z][\w.:/-]{0,63})\]")
+_TAG_WINDOW = 160
+
+
+def parse_tags(text: str) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(_TAG.findall(text[:_TAG_WINDOW])))
+
+
+def tag_names(tags: Iterable[str]) -> List[str]:
+    """Tags as indexed: ``"[DealerRoles]"`` and ``"DealerRoles"`` both mean ``DealerRoles``."""
+    return [tag.strip("[]") for tag in tags]
+
+
+@dataclass
+class ConsoleRecord:
+    seq: int
+    time: float        # epoch seconds
+    elapsed_ms: float  # since the capture started
+    type: str
+    text: str
+    tags: Tuple[str, ...] = ()
+    location: str = ""
+
+    def format(self) -> str:
+        return f"{self.type.upper()}: {self.text}"
+
+
+class JsonlWriter:
+    """Appends dicts to a JSONL file from a background thread."""
+
+    def __init__(self, file_path: Path):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file_path = file_path
+        self._queue: "queue.SimpleQueue[Optional[dict]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=f"jsonl:{file_path.name}", daemon=True)
+        self._thread.start()
+
+    def write(self, item: dict) -> None:
+        self._queue.put(item)
+
+    def _run(self) -> None:
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            while True:
+                item = self._queue.get()
+                # Drain whatever queued up meanwhile and write it as one batch
+                batch = [item]
+                while item is not None:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                lines = [json.dumps(i, ensure_ascii=False) for i in batch if i is not None]
+                if lines:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                if batch[-1] is None:
+                    return
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+
+class ConsoleCapture:
+    """
+    Bounded, tag-indexed console log. ``tags`` restricts capture to messages
+    carrying at least one of them (None keeps everything).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, tags: Optional[Iterable[str]] = None,
+                 jsonl_path: Optional[Path] = None):
+        self.capacity = capacity
+        self.tags = frozenset(tag_names(tags)) if tags else None
+        self.buffer: Deque[ConsoleRecord] = deque()
+        self.index: Dict[str, Deque[ConsoleRecord]] = {}
+        self.evicted = 0
+        self.filtered = 0
+        self._seq = 0
+        self._started = time.time()
+        self._writer = JsonlWriter(jsonl_path) if jsonl_path else None
+
+    def attach(self, page) -> None:
+        page.on("console", self.on_console)
+        page.on("pageerror", self.on_page_error)
+
+    def on_console(self, msg) -> None:
+        location = msg.location or {}
+        url = location.get("url", "")
+        self.add(msg.type, msg.text, f"{url}:{location.get('lineNumber', 0)}" if url else "")
+
+    def on_page_error(self, error) -> None:
+        self.add("pageerror", str(error))
+
+    def add(self, type_: str, text: str, location: str = "") -> Optional[ConsoleRecord]:
+        tags = parse_tags(text) if "[" in text else ()
+        if self.tags is not None and not self.tags.intersection(tags):
+            self.filtered += 1
+            return None
+
+        now = time.time()
+        self._seq += 1
+        record = ConsoleRecord(self._seq, now, (now - self._started) * 1000, type_, text, tags, location)
+        self._append(record)
+        if self._writer is not None:
+            self._writer.write(asdict(record))
+        return record
+
+    def _append(self, record: ConsoleRecord) -> None:
+        if len(self.buffer) >= self.capacity:
+            self._evict()
+        self.buffer.append(record)
+        for tag in record.tags:
+            self.index.setdefault(tag, deque()).append(record)
+
+    def _evict(self) -> None:
+        oldest = self.buffer.popleft()
+        # Index deques are in capture order, so the oldest record is always at the left
+        for tag in oldest.tags:
+            entries = self.index[tag]
+            entries.popleft()
+            if not entries:
+                del self.index[tag]
+        self.evicted += 1
+
+    # -- queries -----------------------------------------------------------
+
+    def mark(self) -> int:
+        """Sequence number of the latest record; pass as ``since`` to get only what follows."""
+        return self._seq
+
+    def records(self, tags: Optional[Iterable[str]] = None, types: Optional[Iterable[str]] = None,
+                since: int = 0, contains: Optional[str] = None) -> List[ConsoleRecord]:
+        if tags:
+            merged: Dict[int, ConsoleRecord] = {}
+            for tag in tag_names(tags):
+                merged.update((r.seq, r) for r in self.index.get(tag, ()))
+            candidates: Iterable[ConsoleRecord] = (merged[seq] for seq in sorted(merged))
+        else:
+            candidates = self.buffer
+        wanted_types = set(types) if types else None
+        return [
+            r for r in candidates
+            if r.seq > since
+            and (wanted_types is None or r.type in wanted_types)
+            and (contains is None or contains in r.text)
+        ]
+
+    def tag_counts(self) -> Counter:
+        return Counter({tag: len(entries) for tag, entries in self.index.items()})
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def read_jsonl(file_path: Path, capacity: int = DEFAULT_CAPACITY * 20) -> ConsoleCapture:
+    """Load a streamed capture back for querying after the run."""
+    capture = ConsoleCapture(capacity=capacity)
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            record = ConsoleRecord(**{**item, "tags": tuple(item["tags"])})
+            capture._append(record)
+            capture._seq = record.seq
+    return capture
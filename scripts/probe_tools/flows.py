@@ -0,0 +1,145 @@
+"""
+Probe flows for the sign-in > Administration > Roles > notification settings path.
+
+Each flow is an async function taking a Probe; FLOWS maps the names used on
+the command line (scripts/run-probes.py --flow) to them. SOAK_TARGETS maps
+names for scripts/run-soak.py to a (setup, cycle) pair of such functions.
+"""
+
+from typing import Dict, Tuple
+
+from .locate import Target
+from .runner import Flow, Probe
+
+# [Tag]s of the debug logs emitted by the role notification settings UI
+LOG_TAGS = ("RoleNotificationsModal", "useRoleNotificationEvents", "DealerRoles")
+
+ADMIN_LINK = Target("admin-link", (
+    'a:has-text("Administration")',
+    "text=Administration",
+    '[href*="admin"]',
+))
+ADMIN_LINK_TIMEOUT_MS = 6000
+ROLE_NAME = "Detail Manager"
+NOTIFICATION_BUTTON = 'button[title*="Notification" i]'
+# The bell button on the card of the role named {role}
+ROLE_NOTIFICATION_BUTTON = Target("role-notification-button", (
+    f'h3:text-is("{{role}}") >> xpath=ancestor::div[contains(@class, "rounded-lg")][1] >> {NOTIFICATION_BUTTON}',
+    f'{NOTIFICATION_BUTTON}:right-of(:text-is("{{role}}"))',
+    # Nearest ancestor of the role name that holds a notification button
+    "text={role} >> xpath=ancestor::*[.//button[contains(translate(@title, "
+    "'NOTIFICATION', 'notification'), 'notification')]][1] >> " + NOTIFICATION_BUTTON,
+))
+DIALOG = '[role="dialog"]'
+AUTH_PATH = "/auth"
+EVENT_STATS = "text=/\\d+ of \\d+ events enabled/"
+
+
+async def login(probe: Probe) -> None:
+    """Sign in through the /auth form with the configured credentials."""
+    if probe.config.credentials is None:
+        raise RuntimeError("This flow signs in: set PROBE_EMAIL and PROBE_PASSWORD")
+    email, password = probe.config.credentials
+    page = probe.page
+    await probe.goto(AUTH_PATH)
+    await page.fill('input[type="email"]', email)
+    await page.fill('input[type="password"]', password)
+    await page.click('button[type="submit"]')
+    await page.wait_for_url(lambda url: AUTH_PATH not in url)
+    await probe.settle()
+
+
+async def open_administration(probe: Probe) -> None:
+    """Click the Administration link, else navigate directly."""
+    link = await probe.locate(ADMIN_LINK, timeout_ms=ADMIN_LINK_TIMEOUT_MS)
+    probe.result.data["admin_selector"] = probe.result.data["selectors"][ADMIN_LINK.name]["selector"]
+    if link is not None:
+        await link.click()
+    else:
+        await probe.goto("/admin")
+    await probe.settle()
+
+
+async def open_role_notifications(probe: Probe, role: str = ROLE_NAME) -> None:
+    """Click the bell button on ``role``'s card and wait for the dialog to load."""
+    page = probe.page
+    button = await probe.locate(ROLE_NOTIFICATION_BUTTON, role=role)
+    if button is None:
+        raise RuntimeError(f"No notification button found for role {role!r}")
+    await button.click()
+    await page.locator(DIALOG).wait_for(state="visible")
+    await probe.settle()
+
+
+async def close_dialog(probe: Probe) -> None:
+    """Dismiss the open dialog with Escape and wait until it is gone."""
+    await probe.page.keyboard.press("Escape")
+    await probe.page.locator(DIALOG).wait_for(state="hidden")
+
+
+async def role_notifications_modal(probe: Probe) -> None:
+    """Load the app, open Administration, open Detail Manager's notification settings."""
+    async with probe.step("initial-load"):
+        await probe.goto("/")
+        await probe.settle()
+    await probe.screenshot("01-initial-page")
+
+    async with probe.step("open-administration"):
+        await open_administration(probe)
+    probe.result.data["url"] = probe.page.url
+    await probe.screenshot("02-admin-page")
+
+    async with probe.step("open-notifications-modal"):
+        since = probe.console.mark()
+        await open_role_notifications(probe)
+    probe.result.logs = probe.console.records(tags=LOG_TAGS, since=since)
+    await probe.screenshot("03-modal-open")
+
+    stats = await probe.page.locator(EVENT_STATS).all_text_contents()
+    probe.result.data["event_stats"] = stats
+
+
+async def login_role_notifications(probe: Probe) -> None:
+    """One dealership user's session: sign in, open Administration, open the notifications modal."""
+    async with probe.step("login"):
+        await login(probe)
+
+    async with probe.step("open-administration"):
+        await open_administration(probe)
+
+    async with probe.step("open-notifications-modal"):
+        await open_role_notifications(probe)
+
+
+async def initial_load(probe: Probe) -> None:
+    """First load of the app only."""
+    async with probe.step("initial-load"):
+        await probe.goto("/")
+        await probe.settle()
+
+
+FLOWS: Dict[str, Flow] = {
+    "initial-load": initial_load,
+    "login-role-notifications": login_role_notifications,
+    "role-notifications-modal": role_notifications_modal,
+}
+
+
+async def administration_setup(probe: Probe) -> None:
+    """Sign in when credentials are configured, then open Administration."""
+    if probe.config.credentials is not None:
+        await login(probe)
+    else:
+        await probe.goto("/")
+        await probe.settle()
+    await open_administration(probe)
+
+
+async def role_notifications_cycle(probe: Probe) -> None:
+    await open_role_notifications(probe)
+    await close_dialog(probe)
+
+
+SOAK_TARGETS: Dict[str, Tuple[Flow, Flow]] = {
+    "role-notifications-modal": (administration_setup, role_notifications_cycle),
+}
@@ -0,0 +1,150 @@
+"""
+Multi-session load generation.
+
+Runs a probe flow as N concurrent headless sessions (one browser context
+each), spread over worker processes so the browser and the Python side of
+the harness do not become the bottleneck. Every worker drives one browser
+with its share of the sessions through the normal runner; the step timings
+come back to the parent, which reports latency percentiles, error rates and
+throughput per step.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence
+
+from .runner import ProbeConfig, run_probes_async
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class Sample:
+    step: str
+    elapsed_ms: float
+    ok: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class StepStats:
+    name: str
+    count: int
+    errors: int
+    percentiles: Dict[int, float]
+    max_ms: float
+    throughput: float  # successful steps per second over the whole run
+    top_errors: List[str] = field(default_factory=list)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+@dataclass
+class LoadReport:
+    flow: str
+    sessions: int
+    iterations: int
+    processes: int
+    wall_s: float
+    steps: List[StepStats]
+    session_stats: StepStats
+
+    def to_dict(self) -> dict:
+        def stats(s: StepStats) -> dict:
+            return {
+                "name": s.name, "count": s.count, "errors": s.errors,
+                "error_rate": round(s.error_rate, 4),
+                "percentiles": {f"p{p}": round(v, 1) for p, v in s.percentiles.items()},
+                "max_ms": round(s.max_ms, 1), "throughput": round(s.throughput, 2),
+                "top_errors": s.top_errors,
+            }
+        return {
+            "flow": self.flow, "sessions": self.sessions, "iterations": self.iterations,
+            "processes": self.processes, "wall_s": round(self.wall_s, 2),
+            "session": stats(self.session_stats), "steps": [stats(s) for s in self.steps],
+        }
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def split_sessions(sessions: int, processes: int) -> List[int]:
+    processes = max(1, min(processes, sessions))
+    return [sessions // processes + (1 if i < sessions % processes else 0) for i in range(processes)]
+
+
+def _worker(flow_name: str, sessions: int, iterations: int, config: ProbeConfig) -> List[List[Sample]]:
+    """Run in a worker process: ``sessions`` concurrent contexts, ``iterations`` flows each."""
+    from .flows import FLOWS
+
+    flow = FLOWS[flow_name]
+    config = replace(config, concurrency=sessions)
+    results = asyncio.run(run_probes_async([(flow_name, flow)] * (sessions * iterations), config))
+    runs = []
+    for result in results:
+        samples = [Sample(step.name, step.elapsed_ms, step.ok, step.error) for step in result.steps]
+        samples.append(Sample("(session)", result.elapsed_ms, result.ok, result.error))
+        runs.append(samples)
+    return runs
+
+
+def _stats(name: str, samples: List[Sample], wall_s: float) -> StepStats:
+    timings = sorted(s.elapsed_ms for s in samples if s.ok)
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if not sample.ok:
+            message = (sample.error or "unknown").splitlines()[0][:120]
+            errors[message] = errors.get(message, 0) + 1
+    return StepStats(
+        name=name,
+        count=len(samples),
+        errors=sum(errors.values()),
+        percentiles={p: percentile(timings, p) for p in PERCENTILES},
+        max_ms=timings[-1] if timings else 0.0,
+        throughput=len(timings) / wall_s if wall_s else 0.0,
+        top_errors=[f"{count}x {message}" for message, count in sorted(errors.items(), key=lambda e: -e[1])[:3]],
+    )
+
+
+def run_load(flow_name: str, sessions: int, iterations: int = 1, processes: Optional[int] = None,
+             config: Optional[ProbeConfig] = None) -> LoadReport:
+    """Run ``sessions`` concurrent sessions of a flow, ``iterations`` times each."""
+    config = replace(config or ProbeConfig(), headless=True, screenshots=False, stream_console=False)
+    shares = split_sessions(sessions, processes or os.cpu_count() or 1)
+
+    started = time.perf_counter()
+    # Playwright drives its own subprocesses and event loop; fresh interpreters are the safe choice
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shares), mp_context=context) as pool:
+        futures = [pool.submit(_worker, flow_name, share, iterations, config) for share in shares]
+        runs = [run for future in futures for run in future.result()]
+    wall_s = time.perf_counter() - started
+
+    by_step: Dict[str, List[Sample]] = {}
+    for samples in runs:
+        for sample in samples:
+            by_step.setdefault(sample.step, []).append(sample)
+    session_samples = by_step.pop("(session)", [])
+
+    return LoadReport(
+        flow=flow_name,
+        sessions=sessions,
+        iterations=iterations,
+        processes=len(shares),
+        wall_s=wall_s,
+        # Steps in flow order (dicts keep first-seen order)
+        steps=[_stats(name, samples, wall_s) for name, samples in by_step.items()],
+        session_stats=_stats("(session)", session_samples, wall_s),
+    )
@@ -0,0 +1,151 @@
+"""
+Selector resolution for probe navigation.
+
+A Target names something a flow needs to find ("admin-link") and lists
+candidate selectors for it, most specific first. Instead of trying them one
+after another - each miss costing a full timeout - all candidates wait in
+parallel and the first one visible wins (on a tie, the earlier candidate).
+
+The winner is remembered per page (URL path, ids collapsed) and app build in
+.cache/probes/selectors.json, and later runs wait on it alone for up to
+CACHED_GRACE_MS before racing the rest. Candidates may contain ``{name}``
+placeholders filled from ``resolve(**params)``; the cache stores the
+template, so one entry serves every role name and the like.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+CACHE_FORMAT = 1
+CACHED_GRACE_MS = 3000
+
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    candidates: Tuple[str, ...]
+
+
+@dataclass
+class Resolution:
+    target: str
+    selector: Optional[str]  # the template that won, None if nothing showed up
+    cached: bool             # resolved by the remembered selector alone
+    elapsed_ms: float
+
+
+def page_key(url: str) -> str:
+    """URL path with numeric and UUID segments collapsed to ``:id``."""
+    segments = [":id" if _ID_SEGMENT.match(s) else s for s in urlsplit(url).path.split("/") if s]
+    return "/" + "/".join(segments)
+
+
+class SelectorCache:
+    """Winning selector template per ``<page> <target>`` for one app build."""
+
+    def __init__(self, file_path: Optional[Path], build: str):
+        self.file_path = file_path
+        self.build = build
+        self.entries: Dict[str, str] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, file_path: Path, build: str) -> "SelectorCache":
+        cache = cls(file_path, build)
+        cache.entries = cls._read(file_path, build)
+        return cache
+
+    @staticmethod
+    def _read(file_path: Path, build: str) -> Dict[str, str]:
+        if not file_path.exists():
+            return {}
+        try:
+            payload = json.loads(file_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            # Damaged file: the cache only saves time, so start over
+            return {}
+        # A different build may have moved things around: start over
+        if payload.get("format") != CACHE_FORMAT or payload.get("build") != build:
+            return {}
+        return payload["entries"]
+
+    def get(self, page: str, target: str) -> Optional[str]:
+        return self.entries.get(f"{page} {target}")
+
+    def put(self, page: str, target: str, selector: str) -> None:
+        key = f"{page} {target}"
+        if self.entries.get(key) != selector:
+            self.entries[key] = selector
+            self.dirty = True
+
+    def save(self) -> None:
+        if self.file_path is None or not self.dirty:
+            return
+        # Other processes (load test workers) may have learned entries meanwhile
+        entries = {**self._read(self.file_path, self.build), **self.entries}
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": CACHE_FORMAT, "build": self.build, "entries": dict(sorted(entries.items()))}
+        # Temp file per process + rename: concurrent readers never see half a file
+        tmp_path = self.file_path.with_name(f".{self.file_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.file_path)
+        self.dirty = False
+
+
+async def first_visible(page, selectors: Sequence[str], timeout_ms: float) -> Optional[int]:
+    """Index of the first selector to become visible within ``timeout_ms``, or None."""
+    if not selectors or timeout_ms <= 0:
+        return None
+    tasks = {
+        asyncio.ensure_future(page.locator(selector).first.wait_for(state="visible", timeout=timeout_ms)): i
+        for i, selector in enumerate(selectors)
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winners = [tasks[task] for task in done if task.exception() is None]
+            if winners:
+                return min(winners)
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def resolve(page, cache: Optional[SelectorCache], target: Target, timeout_ms: float,
+                  **params) -> Tuple[Optional[object], Resolution]:
+    """``(locator, resolution)`` for ``target`` on ``page``; the locator is None on a miss."""
+    started = time.perf_counter()
+    key = page_key(page.url)
+    cached = cache.get(key, target.name) if cache is not None else None
+    if cached is not None and cached not in target.candidates:
+        cached = None  # the flow changed its candidates since
+
+    winner = None
+    hit = False
+    if cached is not None:
+        grace = min(CACHED_GRACE_MS, timeout_ms)
+        if await first_visible(page, [cached.format(**params)], grace) is not None:
+            winner, hit = cached, True
+        else:
+            timeout_ms -= grace
+    if winner is None:
+        index = await first_visible(page, [c.format(**params) for c in target.candidates], timeout_ms)
+        winner = target.candidates[index] if index is not None else None
+
+    if winner is not None and cache is not None:
+        cache.put(key, target.name, winner)
+    resolution = Resolution(target.name, winner, hit, (time.perf_counter() - started) * 1000)
+    locator = page.locator(winner.format(**params)).first if winner is not None else None
+    return locator, resolution
@@ -0,0 +1,209 @@
+"""
+Pooled persistent browser profiles for cold, warm and stale-cache starts.
+
+Probes normally get a fresh browser context, so they only ever see a cold
+start. For ``warm`` and ``stale`` runs the runner leases a persistent
+Chromium profile (.cache/probes/profiles/<state>-<n>/) from a pool instead.
+A profile is primed once - the app is loaded, the service worker installed
+and the page reloaded under its control, so the HTTP cache and the
+``translations-cache`` Cache Storage are filled - and then reused by every
+run of the invocation and by later invocations, until the app build
+(public/version.json) or the base URL changes.
+
+sessionStorage does not survive a new tab, so the ``i18n_translations_cache_*``
+entries (TRANSLATION_CACHE_KEY in src/lib/i18n.ts) seen while priming are
+kept in the profile manifest and put back before any page script runs,
+re-stamped per state:
+
+- ``warm``: timestamp "now", as on a reload within the cache window;
+- ``stale``: older than CACHE_DURATION_MS, so the app discards and refetches
+  them, as for a user returning after the window.
+
+Cookies and localStorage persist in the profile between runs. A profile
+directory can only be open in one browser at a time, so concurrent
+invocations need different ``root`` directories.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+CACHE_STATES = ("cold", "warm", "stale")
+POOLED_STATES = ("warm", "stale")
+PROFILE_FORMAT = 1
+MANIFEST_FILE = "probe-profile.json"
+
+# Mirrors src/lib/i18n.ts
+STORAGE_PREFIX = "i18n_translations_cache_"
+CACHE_DURATION_MS = 5 * 60 * 1000
+STALE_MARGIN_MS = 60 * 1000
+
+SERVICE_WORKER_TIMEOUT_MS = 10000
+
+_READ_STORAGE = """
+prefix => Object.fromEntries(
+  Object.keys(sessionStorage).filter(k => k.startsWith(prefix)).map(k => [k, sessionStorage.getItem(k)])
+)
+"""
+
+_SERVICE_WORKER_READY = """
+ms => !('serviceWorker' in navigator) ? false : Promise.race([
+  navigator.serviceWorker.ready.then(() => true),
+  new Promise(resolve => setTimeout(() => resolve(false), ms)),
+])
+"""
+
+_CACHE_CONTENTS = """
+async () => {
+  if (!('caches' in window)) return {};
+  const contents = {};
+  for (const name of await caches.keys()) contents[name] = (await (await caches.open(name)).keys()).length;
+  return contents;
+}
+"""
+
+# Formatted with the entries and the timestamp offset; runs before the app on every new document
+_RESTORE_STORAGE = """
+(([entries, offset]) => {
+  try {
+    for (const [key, value] of Object.entries(entries)) {
+      if (sessionStorage.getItem(key) !== null) continue;
+      const cached = JSON.parse(value);
+      cached.timestamp = Date.now() - offset;
+      sessionStorage.setItem(key, JSON.stringify(cached));
+    }
+  } catch (e) {}
+})(%s);
+"""
+
+
+def app_build(repo_root: Path) -> str:
+    """Build id of the app under test: version.json version + commit, else package.json version."""
+    version_file = repo_root / "public" / "version.json"
+    if version_file.exists():
+        info = json.loads(version_file.read_text(encoding="utf-8"))
+        return "+".join(str(info[k]) for k in ("version", "gitCommit") if info.get(k))
+    package = json.loads((repo_root / "package.json").read_text(encoding="utf-8"))
+    return str(package.get("version", "unknown"))
+
+
+def restore_script(entries: Dict[str, str], state: str) -> str:
+    offset = CACHE_DURATION_MS + STALE_MARGIN_MS if state == "stale" else 0
+    return _RESTORE_STORAGE % json.dumps([entries, offset])
+
+
+@dataclass
+class ProfileSlot:
+    state: str
+    path: Path
+    context: Any = None
+    manifest: Dict[str, Any] = field(default_factory=dict)
+    # True while the run that triggered priming holds the slot
+    primed_this_lease: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+class ProfilePool:
+    """
+    Up to ``size`` persistent contexts primed to ``state``; ``lease()`` hands
+    one to a single run at a time. Contexts are opened (and primed if needed)
+    on first lease and closed by ``close()``.
+    """
+
+    def __init__(self, playwright, root: Path, state: str, size: int, base_url: str, build: str,
+                 launch_options: Optional[dict] = None, init_scripts: Optional[List[str]] = None,
+                 reprime: bool = False):
+        if state not in POOLED_STATES:
+            raise ValueError(f"Cache state {state!r} is not pooled (choose from {', '.join(POOLED_STATES)})")
+        self.playwright = playwright
+        self.state = state
+        self.base_url = base_url
+        self.build = build
+        self.launch_options = launch_options or {}
+        self.init_scripts = init_scripts or []
+        self.reprime = reprime
+        self.slots = [ProfileSlot(state, root / f"{state}-{i + 1}") for i in range(max(1, size))]
+        self._free: "asyncio.Queue[ProfileSlot]" = asyncio.Queue()
+        for slot in self.slots:
+            self._free.put_nowait(slot)
+
+    def _is_primed(self, manifest: Dict[str, Any]) -> bool:
+        return (
+            not self.reprime
+            and manifest.get("format") == PROFILE_FORMAT
+            and manifest.get("build") == self.build
+            and manifest.get("base_url") == self.base_url
+        )
+
+    async def _open(self, slot: ProfileSlot) -> None:
+        slot.path.mkdir(parents=True, exist_ok=True)
+        slot.context = await self.playwright.chromium.launch_persistent_context(
+            str(slot.path), **self.launch_options
+        )
+        manifest_path = slot.path / MANIFEST_FILE
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        if not self._is_primed(manifest):
+            started = time.perf_counter()
+            manifest = await self._prime(slot.context)
+            manifest["prime_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            slot.primed_this_lease = True
+            manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+        slot.manifest = manifest
+
+        await slot.context.add_init_script(restore_script(manifest["session_storage"], self.state))
+        for script in self.init_scripts:
+            await slot.context.add_init_script(script)
+
+    async def _prime(self, context) -> Dict[str, Any]:
+        page = await context.new_page()
+        try:
+            await page.goto(self.base_url, wait_until="networkidle")
+            service_worker = await page.evaluate(_SERVICE_WORKER_READY, SERVICE_WORKER_TIMEOUT_MS)
+            if service_worker:
+                # The first load only installs the worker; the reload goes through it and fills its caches
+                await page.reload(wait_until="networkidle")
+            storage = await page.evaluate(_READ_STORAGE, STORAGE_PREFIX)
+            caches = await page.evaluate(_CACHE_CONTENTS)
+        finally:
+            await page.close()
+        return {
+            "format": PROFILE_FORMAT,
+            "build": self.build,
+            "base_url": self.base_url,
+            "primed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "service_worker": service_worker,
+            "caches": caches,
+            "session_storage": storage,
+        }
+
+    @contextlib.asynccontextmanager
+    async def lease(self) -> AsyncIterator[ProfileSlot]:
+        slot = await self._free.get()
+        try:
+            if slot.context is None:
+                try:
+                    await self._open(slot)
+                except Exception as e:
+                    if slot.context is not None:
+                        with contextlib.suppress(Exception):
+                            await slot.context.close()
+                        slot.context = None
+                    raise RuntimeError(f"Could not open profile {slot.name} (is the app running?): {e}") from e
+            yield slot
+        finally:
+            slot.primed_this_lease = False
+            self._free.put_nowait(slot)
+
+    async def close(self) -> None:
+        for slot in self.slots:
+            if slot.context is not None:
+                with contextlib.suppress(Exception):
+                    await slot.context.close()
+                slot.context = None
@@ -0,0 +1,227 @@
+"""
+Record and replay of backend traffic.
+
+In record mode every backend request a probe makes (Supabase REST/auth/
+storage/functions, anything under /api/ and other origins than the app
+itself) is forwarded, and the response is stored in a replay archive. In
+replay mode the same requests are answered from the archive by an in-process
+route handler, so probes run without a live backend, get the same data every
+time, and do not pay network variance. App assets from the dev server are
+never recorded.
+
+Archive layout (under .cache/probes/replay/<name>/, which holds session
+tokens and real data - keep it out of git)::
+
+    index.json         exchanges keyed by method + normalized URL + body hash
+    bodies/<sha256>    zlib-compressed response bodies, stored once
+
+Identical requests that got different responses are replayed in recorded
+order (the last one repeats). A request that misses falls back to the last
+response for the same method and path, then to the live network or - with
+``strict`` - to a 504.
+
+Latency profiles add a deterministic delay per response: ``recorded`` uses
+the latency seen while recording, the others a seeded base + jitter.
+WebSocket traffic (Supabase realtime) is not covered.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+ARCHIVE_FORMAT = 1
+MODES = ("record", "replay")
+
+# name -> (base ms, jitter ms); "recorded" replays the latency seen while recording
+LATENCY_PROFILES: Dict[str, Optional[Tuple[float, float]]] = {
+    "none": None,
+    "recorded": None,
+    "lan": (5, 2),
+    "broadband": (40, 15),
+    "3g": (300, 120),
+}
+
+# Re-computed by the browser for the fulfilled body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+_VOLATILE_PARAMS = {"_", "t", "timestamp", "cachebust"}
+
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _VOLATILE_PARAMS)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def request_keys(method: str, url: str, body: Optional[bytes]) -> Tuple[str, str]:
+    """``(exact key, loose key)``: the loose one ignores query and body."""
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+    parts = urlsplit(url)
+    return f"{method} {_normalize_url(url)} {digest}", f"{method} {parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def is_backend(url: str, base_url: str) -> bool:
+    parts, app = urlsplit(url), urlsplit(base_url)
+    if parts.scheme not in ("http", "https"):
+        return False
+    if parts.netloc != app.netloc:
+        return True
+    return parts.path.startswith(("/api/", "/functions/", "/rest/", "/auth/"))
+
+
+@dataclass
+class Exchange:
+    method: str
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: str          # sha256 of the body blob
+    latency_ms: float
+
+
+class ReplayArchive:
+    """Exchanges by request key, with content-addressed bodies."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.exchanges: Dict[str, List[Exchange]] = {}
+        self.loose: Dict[str, str] = {}  # loose key -> latest exact key
+
+    @classmethod
+    def load(cls, root: Path) -> "ReplayArchive":
+        archive = cls(root)
+        index_path = root / "index.json"
+        if not index_path.exists():
+            raise FileNotFoundError(f"No replay archive at {root} (record one with --record)")
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+        if payload.get("format") != ARCHIVE_FORMAT:
+            raise ValueError(f"{index_path}: unsupported archive format {payload.get('format')}")
+        archive.exchanges = {key: [Exchange(**e) for e in entries] for key, entries in payload["exchanges"].items()}
+        archive.loose = payload["loose"]
+        return archive
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": ARCHIVE_FORMAT,
+            "exchanges": {key: [asdict(e) for e in entries] for key, entries in sorted(self.exchanges.items())},
+            "loose": dict(sorted(self.loose.items())),
+        }
+        (self.root / "index.json").write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+
+    def put_body(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.root / "bodies" / digest
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            blob.write_bytes(zlib.compress(data, 6))
+        return digest
+
+    def get_body(self, digest: str) -> bytes:
+        return zlib.decompress((self.root / "bodies" / digest).read_bytes())
+
+    def add(self, keys: Tuple[str, str], exchange: Exchange) -> None:
+        exact, loose = keys
+        self.exchanges.setdefault(exact, []).append(exchange)
+        self.loose[loose] = exact
+
+    @property
+    def size(self) -> int:
+        return sum(len(entries) for entries in self.exchanges.values())
+
+
+class BackendRecorder:
+    """Route handler that forwards backend requests and stores the responses."""
+
+    def __init__(self, archive: ReplayArchive, base_url: str):
+        self.archive = archive
+        self.base_url = base_url
+        self.recorded = 0
+
+    async def handle(self, route) -> None:
+        request = route.request
+        if not is_backend(request.url, self.base_url):
+            await route.continue_()
+            return
+        started = time.perf_counter()
+        response = await route.fetch()
+        body = await response.body()
+        latency_ms = (time.perf_counter() - started) * 1000
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        self.archive.add(
+            request_keys(request.method, request.url, request.post_data_buffer),
+            Exchange(request.method, request.url, response.status, headers, self.archive.put_body(body),
+                     round(latency_ms, 1)),
+        )
+        self.recorded += 1
+        await route.fulfill(status=response.status, headers=headers, body=body)
+
+
+class BackendReplayer:
+    """Route handler answering backend requests from an archive (one per browser context)."""
+
+    def __init__(self, archive: ReplayArchive, base_url: str, latency: str = "none",
+                 strict: bool = False, seed: int = 0):
+        if latency not in LATENCY_PROFILES:
+            raise ValueError(f"Unknown latency profile {latency!r} (choose from {', '.join(LATENCY_PROFILES)})")
+        self.archive = archive
+        self.base_url = base_url
+        self.latency = latency
+        self.strict = strict
+        self.random = random.Random(seed)
+        self.cursors: Dict[str, int] = {}
+        self.hits = 0
+        self.loose_hits = 0
+        self.misses: List[str] = []
+
+    def lookup(self, method: str, url: str, body: Optional[bytes]) -> Optional[Exchange]:
+        exact, loose = request_keys(method, url, body)
+        if exact not in self.archive.exchanges:
+            exact = self.archive.loose.get(loose)
+            if exact is None:
+                return None
+            self.loose_hits += 1
+        else:
+            self.hits += 1
+        entries = self.archive.exchanges[exact]
+        position = self.cursors.get(exact, 0)
+        self.cursors[exact] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def delay_ms(self, exchange: Exchange) -> float:
+        if self.latency == "recorded":
+            return exchange.latency_ms
+        profile = LATENCY_PROFILES[self.latency]
+        if profile is None:
+            return 0.0
+        base, jitter = profile
+        return max(0.0, base + self.random.uniform(-jitter, jitter))
+
+    async def handle(self, route) -> None:
+        request = route.request
+        if not is_backend(request.url, self.base_url):
+            await route.continue_()
+            return
+        exchange = self.lookup(request.method, request.url, request.post_data_buffer)
+        if exchange is None:
+            self.misses.append(f"{request.method} {request.url}")
+            if self.strict:
+                await route.fulfill(status=504, body=b"not in replay archive")
+            else:
+                await route.continue_()
+            return
+        delay = self.delay_ms(exchange)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        await route.fulfill(status=exchange.status, headers=exchange.headers,
+                            body=self.archive.get_body(exchange.body))
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "loose_hits": self.loose_hits, "misses": len(self.misses),
+                "missed": self.misses[:10]}
@@ -0,0 +1,332 @@
+"""
+Async probe runner.
+
+A flow is ``async def flow(probe: Probe)``. Each run gets its own browser
+context (separate storage, cookies and service workers) on one shared
+browser, and up to ``concurrency`` runs are in flight at once, so ten probes
+take about as long as the slowest one instead of the sum of all of them.
+
+Waits are event-driven: navigation waits for network idle, steps wait for
+the element or dialog they need. ``Probe.settle()`` is the replacement for
+the old ``time.sleep(2)`` calls - network idle plus two animation frames.
+
+Console output goes through a ConsoleCapture per run (see console.py) and is
+streamed to .cache/probes/<run>/console.jsonl. With ``trace`` on, each step
+also records a performance trace (see trace.py). ``backend`` records backend
+traffic to a replay archive or serves it from one (see replay.py).
+Screenshots are written and diffed against baselines off the flow's path
+(see screenshots.py). ``cache_state`` "warm" or "stale" runs on pooled,
+primed persistent profiles instead of fresh contexts (see profiles.py).
+``Probe.locate()`` races candidate selectors and remembers the winner per
+page and app build (see locate.py).
+"""
+
+import asyncio
+import contextlib
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .console import DEFAULT_CAPACITY, ConsoleCapture, ConsoleRecord
+from .locate import SelectorCache, Target, resolve
+from .profiles import CACHE_STATES, POOLED_STATES, ProfilePool, app_build
+from .replay import BackendRecorder, BackendReplayer, ReplayArchive
+from .screenshots import ScreenshotPipeline, ScreenshotResult
+from .trace import OBSERVER_SCRIPT, Tracer
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SCREENSHOTS_DIR = REPO_ROOT / "screenshots"
+BASELINE_DIR = SCREENSHOTS_DIR / "baselines"
+OUTPUT_DIR = REPO_ROOT / ".cache" / "probes"
+REPLAY_DIR = OUTPUT_DIR / "replay"
+PROFILE_DIR = OUTPUT_DIR / "profiles"
+SELECTOR_CACHE = OUTPUT_DIR / "selectors.json"
+
+BASE_URL = "http://localhost:8080"
+VIEWPORT = {"width": 1920, "height": 1080}
+
+_NEXT_FRAMES = "() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))"
+
+
+@dataclass
+class ProbeConfig:
+    base_url: str = BASE_URL
+    headless: bool = True
+    viewport: Dict[str, int] = field(default_factory=lambda: dict(VIEWPORT))
+    concurrency: int = 4
+    timeout_ms: int = 15000
+    screenshot_dir: Path = SCREENSHOTS_DIR
+    baseline_dir: Path = BASELINE_DIR
+    update_baselines: bool = False
+    screenshot_workers: int = 2
+    output_dir: Path = OUTPUT_DIR
+    # Only capture console messages with one of these [Tag]s (None: everything)
+    log_tags: Optional[Sequence[str]] = None
+    log_capacity: int = DEFAULT_CAPACITY
+    # Per-step navigation/resource timing, long tasks and CDP metrics
+    trace: bool = False
+    # Load runs turn these off: hundreds of sessions writing PNGs and JSONL would measure the disk
+    screenshots: bool = True
+    stream_console: bool = True
+    # (email, password) for flows that sign in (PROBE_EMAIL / PROBE_PASSWORD in the CLIs)
+    credentials: Optional[Tuple[str, str]] = None
+    # "record" or "replay" backend traffic (None: live backend)
+    backend: Optional[str] = None
+    replay_archive: Path = REPLAY_DIR / "default"
+    latency_profile: str = "none"
+    replay_strict: bool = False
+    # "cold" (fresh context, the default), "warm" or "stale" (pooled persistent profiles)
+    cache_state: str = "cold"
+    profile_dir: Path = PROFILE_DIR
+    reprime: bool = False
+    # Learned selector per page/target (None: race every time, remember nothing)
+    selector_cache: Optional[Path] = SELECTOR_CACHE
+
+
+@dataclass
+class StepResult:
+    name: str
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+    trace: Optional[dict] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one flow run: step timings plus whatever the flow recorded in ``data``."""
+
+    name: str
+    flow: str
+    steps: List[StepResult] = field(default_factory=list)
+    data: dict = field(default_factory=dict)
+    logs: List[ConsoleRecord] = field(default_factory=list)
+    console_log: Optional[Path] = None
+    screenshots: List[Path] = field(default_factory=list)
+    visual: List[ScreenshotResult] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Probe:
+    """What a flow sees: the page, the config and its own result."""
+
+    def __init__(self, name: str, flow: str, context, page, config: ProbeConfig):
+        self.name = name
+        self.context = context
+        self.page = page
+        self.config = config
+        self.result = ProbeResult(name=name, flow=flow)
+        self.tracer: Optional[Tracer] = None
+        self.pipeline: Optional[ScreenshotPipeline] = None
+        self.selectors: Optional[SelectorCache] = None
+
+        console_log = config.output_dir / name / "console.jsonl" if config.stream_console else None
+        if console_log is not None and console_log.exists():
+            console_log.unlink()
+        self.console = ConsoleCapture(config.log_capacity, config.log_tags, console_log)
+        self.console.attach(page)
+        self.result.console_log = console_log
+
+    @contextlib.asynccontextmanager
+    async def step(self, name: str):
+        """Time a block as one named step; an exception marks the step (and the probe) failed."""
+        step = StepResult(name)
+        mark = await self.tracer.begin() if self.tracer else None
+        started = time.perf_counter()
+        try:
+            yield step
+        except Exception as e:
+            step.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            step.elapsed_ms = (time.perf_counter() - started) * 1000
+            self.result.steps.append(step)
+            if mark is not None:
+                with contextlib.suppress(Exception):
+                    step.trace = await self.tracer.end(mark)
+
+    async def locate(self, target: Target, timeout_ms: Optional[float] = None, **params):
+        """Locator for the first of ``target``'s candidates to show up, or None if none did."""
+        locator, resolution = await resolve(self.page, self.selectors, target,
+                                            timeout_ms if timeout_ms is not None else self.config.timeout_ms,
+                                            **params)
+        self.result.data.setdefault("selectors", {})[target.name] = {
+            "selector": resolution.selector,
+            "cached": resolution.cached,
+            "ms": round(resolution.elapsed_ms),
+        }
+        return locator
+
+    def url(self, path: str = "/") -> str:
+        return self.config.base_url.rstrip("/") + "/" + path.lstrip("/")
+
+    async def goto(self, path: str = "/") -> None:
+        await self.page.goto(self.url(path), wait_until="networkidle")
+
+    async def settle(self) -> None:
+        """Wait until the network is idle and the next frame has been painted."""
+        await self.page.wait_for_load_state("networkidle")
+        await self.page.evaluate(_NEXT_FRAMES)
+
+    async def screenshot(self, name: str, full_page: bool = False) -> Optional[Path]:
+        """Capture a frame; writing and the baseline diff happen on the pipeline's threads."""
+        if not self.config.screenshots or self.pipeline is None:
+            return None
+        data = await self.page.screenshot(full_page=full_page, type="png")
+        file_path = self.pipeline.submit(self.name, self.result.flow, name, data)
+        self.result.screenshots.append(file_path)
+        return file_path
+
+
+Flow = Callable[[Probe], Awaitable[None]]
+
+
+@contextlib.asynccontextmanager
+async def _lease_context(browser, pool: Optional[ProfilePool], config: ProbeConfig):
+    """A fresh context for cold runs, a pooled primed profile otherwise (left open for the next run)."""
+    if pool is None:
+        context = await browser.new_context(viewport=config.viewport)
+        if config.trace:
+            await context.add_init_script(OBSERVER_SCRIPT)
+        try:
+            yield context, None
+        finally:
+            await context.close()
+    else:
+        async with pool.lease() as slot:
+            yield slot.context, slot
+
+
+async def _run_one(browser, name: str, flow_name: str, flow: Flow, config: ProbeConfig,
+                   semaphore: asyncio.Semaphore, archive: Optional[ReplayArchive],
+                   pipeline: Optional[ScreenshotPipeline], pool: Optional[ProfilePool],
+                   selectors: Optional[SelectorCache]) -> ProbeResult:
+    async with semaphore, _lease_context(browser, pool, config) as (context, slot):
+        context.set_default_timeout(config.timeout_ms)
+        backend = None
+        if config.backend == "record":
+            backend = BackendRecorder(archive, config.base_url)
+        elif config.backend == "replay":
+            # Own cursors and seed per run, so concurrent runs replay identically
+            backend = BackendReplayer(archive, config.base_url, config.latency_profile,
+                                      config.replay_strict, seed=zlib.crc32(name.encode()))
+        if backend is not None:
+            await context.route("**/*", backend.handle)
+        page = await context.new_page()
+        probe = Probe(name, flow_name, context, page, config)
+        probe.pipeline = pipeline
+        probe.selectors = selectors
+        if slot is not None:
+            probe.result.data["profile"] = {"name": slot.name, "primed": slot.primed_this_lease,
+                                            "prime_ms": slot.manifest.get("prime_ms")}
+        if config.trace:
+            probe.tracer = await Tracer.create(context, page)
+        started = time.perf_counter()
+        try:
+            await flow(probe)
+        except Exception as e:
+            probe.result.error = f"{type(e).__name__}: {e}"
+            with contextlib.suppress(Exception):
+                await probe.screenshot("error-state", full_page=True)
+        finally:
+            probe.result.elapsed_ms = (time.perf_counter() - started) * 1000
+            if isinstance(backend, BackendReplayer):
+                probe.result.data["backend"] = backend.stats()
+            elif isinstance(backend, BackendRecorder):
+                probe.result.data["backend"] = {"recorded": backend.recorded}
+            # Pooled contexts outlive the run: drop its page and route, keep the caches
+            with contextlib.suppress(Exception):
+                await page.close()
+            if backend is not None:
+                with contextlib.suppress(Exception):
+                    await context.unroute("**/*", backend.handle)
+            probe.console.close()
+        return probe.result
+
+
+def probe_names(flows: Sequence[Tuple[str, Flow]]) -> List[str]:
+    """Unique run names: the flow name, with ``-2``, ``-3``... for repeats."""
+    seen: Dict[str, int] = {}
+    names = []
+    for flow_name, _ in flows:
+        seen[flow_name] = seen.get(flow_name, 0) + 1
+        names.append(flow_name if seen[flow_name] == 1 else f"{flow_name}-{seen[flow_name]}")
+    return names
+
+
+async def run_probes_async(flows: Sequence[Tuple[str, Flow]], config: ProbeConfig) -> List[ProbeResult]:
+    if async_playwright is None:
+        raise RuntimeError("playwright is not installed (pip install playwright && playwright install chromium)")
+    semaphore = asyncio.Semaphore(max(1, config.concurrency))
+    archive = None
+    if config.backend == "record":
+        archive = ReplayArchive(config.replay_archive)
+    elif config.backend == "replay":
+        archive = ReplayArchive.load(config.replay_archive)
+    elif config.backend is not None:
+        raise ValueError(f"Unknown backend mode {config.backend!r}")
+    if config.cache_state not in CACHE_STATES:
+        raise ValueError(f"Unknown cache state {config.cache_state!r} (choose from {', '.join(CACHE_STATES)})")
+    build = app_build(REPO_ROOT)
+    selectors = SelectorCache.load(config.selector_cache, build) if config.selector_cache else None
+    pipeline = None
+    if config.screenshots:
+        pipeline = ScreenshotPipeline(config.screenshot_dir, config.baseline_dir,
+                                      config.screenshot_workers, config.update_baselines)
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=config.headless)
+        except Exception as e:
+            raise RuntimeError(f"Could not launch Chromium (playwright install chromium?): {e}") from e
+        pool = None
+        if config.cache_state in POOLED_STATES:
+            pool = ProfilePool(
+                playwright, config.profile_dir, config.cache_state,
+                size=min(config.concurrency, len(flows)), base_url=config.base_url,
+                build=build,
+                launch_options={"headless": config.headless, "viewport": config.viewport},
+                init_scripts=[OBSERVER_SCRIPT] if config.trace else None,
+                reprime=config.reprime,
+            )
+        try:
+            results = list(await asyncio.gather(*(
+                _run_one(browser, name, flow_name, flow, config, semaphore, archive, pipeline, pool, selectors)
+                for name, (flow_name, flow) in zip(probe_names(flows), flows)
+            )))
+        finally:
+            if pool is not None:
+                await pool.close()
+            await browser.close()
+            if config.backend == "record":
+                archive.save()
+            if selectors is not None:
+                selectors.save()
+            visual = await asyncio.to_thread(pipeline.close) if pipeline is not None else []
+
+    by_probe: Dict[str, List[ScreenshotResult]] = {}
+    for frame in visual:
+        by_probe.setdefault(frame.probe, []).append(frame)
+    for result in results:
+        result.visual = by_probe.get(result.name, [])
+    return results
+
+
+def run_probes(flows: Sequence[Tuple[str, Flow]], config: Optional[ProbeConfig] = None) -> List[ProbeResult]:
+    """Run ``[(flow name, flow)]`` concurrently and return the results in the same order."""
+    return asyncio.run(run_probes_async(flows, config or ProbeConfig()))
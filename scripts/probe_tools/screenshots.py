@@ -0,0 +1,232 @@
+"""
+Screenshot pipeline: capture in the flow, everything else in a thread pool.
+
+``Probe.screenshot()`` only waits for the browser to hand over the PNG bytes.
+Hashing, writing, deduplication and the visual diff run on worker threads
+while the flow carries on:
+
+- identical frames (same bytes) are written once; later ones resolve to the
+  first file (``submit()`` returns it) instead of adding another copy to
+  screenshots/, and any stale file at their own path is removed. Work on one
+  path runs in submission order, so a name captured twice ends up holding
+  the later frame;
+- each frame is compared with its baseline, screenshots/baselines/<flow>/
+  <name>.png, by a NumPy perceptual diff: luma of both frames, a 3x3 blur to
+  absorb anti-aliasing, then the fraction of pixels that moved more than a
+  threshold, per region. Regions and their tolerances come from
+  screenshots/baselines/regions.json::
+
+      {"*": [{"name": "clock", "box": [1700, 0, 220, 64], "tolerance": 1.0}],
+       "role-notifications-modal/03-modal-open": [{"name": "stats", "box": [...], "tolerance": 0.02}]}
+
+  Pixels outside every listed region form the "page" region, with
+  DEFAULT_TOLERANCE. Changed frames get a <name>.diff.png next to them.
+
+NumPy and Pillow are optional: without them frames are still written and
+deduplicated, but not diffed.
+"""
+
+import hashlib
+import io
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_TOLERANCE = 0.001   # fraction of changed pixels allowed in the "page" region
+PIXEL_THRESHOLD = 12.0      # luma difference (0-255) for a pixel to count as changed
+REGIONS_FILE = "regions.json"
+
+
+@dataclass
+class Region:
+    name: str
+    box: Tuple[int, int, int, int]  # x, y, width, height
+    tolerance: float = DEFAULT_TOLERANCE
+
+
+@dataclass
+class ScreenshotResult:
+    probe: str
+    name: str
+    path: Path
+    digest: str
+    duplicate_of: Optional[Path] = None
+    # new (no baseline), match, changed, size-mismatch, error, or unchecked (no numpy/Pillow)
+    status: str = "unchecked"
+    regions: Dict[str, float] = field(default_factory=dict)  # region -> changed fraction
+    failed_regions: List[str] = field(default_factory=list)
+
+    @property
+    def regressed(self) -> bool:
+        return self.status in ("changed", "size-mismatch", "error")
+
+
+def diff_available() -> bool:
+    return np is not None and Image is not None
+
+
+def load_regions(baseline_dir: Path) -> Dict[str, List[Region]]:
+    regions_path = baseline_dir / REGIONS_FILE
+    if not regions_path.exists():
+        return {}
+    spec = json.loads(regions_path.read_text(encoding="utf-8"))
+    return {
+        key: [Region(r["name"], tuple(r["box"]), r.get("tolerance", DEFAULT_TOLERANCE)) for r in regions]
+        for key, regions in spec.items()
+    }
+
+
+def _decode(data: bytes):
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+def _luma(image):
+    rgb = image.astype(np.float32)
+    return rgb[..., 0] * 0.299 + rgb[..., 1] * 0.587 + rgb[..., 2] * 0.114
+
+
+def _blur(plane):
+    padded = np.pad(plane, 1, mode="edge")
+    h, w = plane.shape
+    return sum(padded[dy:dy + h, dx:dx + w] for dy in range(3) for dx in range(3)) / 9.0
+
+
+def changed_mask(baseline, current, threshold: float = PIXEL_THRESHOLD):
+    """Boolean (H, W) mask of pixels whose blurred luma moved more than ``threshold``."""
+    return np.abs(_blur(_luma(baseline)) - _blur(_luma(current))) > threshold
+
+
+def region_fractions(mask, regions: List[Region]) -> Dict[str, float]:
+    """Changed-pixel fraction per region, plus "page" for everything outside them."""
+    outside = np.ones(mask.shape, dtype=bool)
+    fractions = {}
+    for region in regions:
+        x, y, w, h = region.box
+        window = mask[y:y + h, x:x + w]
+        fractions[region.name] = float(window.mean()) if window.size else 0.0
+        outside[y:y + h, x:x + w] = False
+    fractions["page"] = float(mask[outside].mean()) if outside.any() else 0.0
+    return fractions
+
+
+def _diff_image(current, mask) -> bytes:
+    highlighted = current.copy()
+    highlighted[mask] = (highlighted[mask] * 0.3 + np.array([255, 0, 0]) * 0.7).astype(np.uint8)
+    out = io.BytesIO()
+    Image.fromarray(highlighted).save(out, format="PNG")
+    return out.getvalue()
+
+
+class ScreenshotPipeline:
+    """Writes, deduplicates and diffs screenshots on a small thread pool."""
+
+    def __init__(self, root: Path, baseline_dir: Path, workers: int = 2, update_baselines: bool = False):
+        self.root = root
+        self.baseline_dir = baseline_dir
+        self.update_baselines = update_baselines
+        self.regions = load_regions(baseline_dir)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="screenshot")
+        self._futures: List[Tuple[str, str, Future]] = []
+        self._written: Dict[str, Path] = {}  # digest -> first file with those bytes
+        self._last: Dict[Path, Future] = {}   # path -> latest frame queued for it
+        self._lock = threading.Lock()
+
+    def path_for(self, probe: str, name: str) -> Path:
+        return self.root / probe / f"{name}.png"
+
+    def submit(self, probe: str, flow: str, name: str, data: bytes) -> Path:
+        """Queue a frame; returns the file it will be in (an earlier identical frame's, if any)."""
+        # Hashing here keeps the returned path right; it is cheap next to the capture itself
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(probe, name)
+        with self._lock:
+            # This path is about to hold new bytes: it no longer stands for what it held before
+            for stale in [d for d, p in self._written.items() if p == path and d != digest]:
+                del self._written[stale]
+            first = self._written.setdefault(digest, path)
+            # The pool runs jobs in order, so the previous frame for this path is never still queued
+            future = self._pool.submit(self._process, probe, flow, name, data, digest,
+                                       first if first != path else None, self._last.get(path))
+            self._last[path] = future
+        self._futures.append((probe, name, future))
+        return first
+
+    def _regions_for(self, flow: str, name: str) -> List[Region]:
+        return self.regions.get("*", []) + self.regions.get(f"{flow}/{name}", [])
+
+    def _process(self, probe: str, flow: str, name: str, data: bytes, digest: str,
+                 duplicate_of: Optional[Path], previous: Optional[Future]) -> ScreenshotResult:
+        path = self.path_for(probe, name)
+        result = ScreenshotResult(probe, name, duplicate_of or path, digest, duplicate_of)
+
+        if previous is not None:
+            wait([previous])
+        if duplicate_of is not None:
+            # A file left here by an earlier invocation would be mistaken for this frame
+            path.unlink(missing_ok=True)
+        elif not (path.exists() and path.read_bytes() == data):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        baseline = self.baseline_dir / flow / f"{name}.png"
+        if not baseline.exists():
+            result.status = "new"
+            if self.update_baselines:
+                baseline.parent.mkdir(parents=True, exist_ok=True)
+                baseline.write_bytes(data)
+            return result
+
+        baseline_data = baseline.read_bytes()
+        if hashlib.sha256(baseline_data).hexdigest() == digest:
+            result.status = "match"
+            return result
+        if not diff_available():
+            return result
+
+        before, after = _decode(baseline_data), _decode(data)
+        if before.shape != after.shape:
+            result.status = "size-mismatch"
+        else:
+            mask = changed_mask(before, after)
+            regions = self._regions_for(flow, name)
+            result.regions = region_fractions(mask, regions)
+            tolerances = {r.name: r.tolerance for r in regions}
+            result.failed_regions = [
+                region for region, fraction in result.regions.items()
+                if fraction > tolerances.get(region, DEFAULT_TOLERANCE)
+            ]
+            result.status = "changed" if result.failed_regions else "match"
+            if result.failed_regions:
+                diff_path = self.path_for(probe, name).with_suffix(".diff.png")
+                diff_path.parent.mkdir(parents=True, exist_ok=True)
+                diff_path.write_bytes(_diff_image(after, mask))
+
+        if self.update_baselines and result.status != "match":
+            baseline.write_bytes(data)
+        return result
+
+    def close(self) -> List[ScreenshotResult]:
+        """Wait for every queued frame and return the results in submission order."""
+        self._pool.shutdown(wait=True)
+        results = []
+        for probe, name, future in self._futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                result = ScreenshotResult(probe, name, self.path_for(probe, name), "", status="error")
+                result.failed_regions = [f"{type(e).__name__}: {e}"]
+                results.append(result)
+        return results
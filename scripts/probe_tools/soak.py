@@ -0,0 +1,239 @@
+"""
+Long-session leak sampling.
+
+Kiosks and chat screens stay open for hours; a probe of a few seconds never
+sees what builds up. A soak run does a target's setup once, then repeats its
+cycle (open and close a dialog, say) for a number of cycles or a duration
+while a background task samples the page through CDP every ``interval_s``:
+JS heap used, DOM nodes, event listeners and documents, each after a forced
+garbage collection so that what remains is what is still referenced.
+
+Samples are streamed to .cache/probes/<run>/soak.jsonl as they are taken.
+At the end every gauge is checked for monotonic growth: the samples are cut
+into windows, and a gauge is flagged when the minimum of each window is at
+least the previous one and the total rise clears its floor in LEAK_FLOORS.
+Window minima ignore the sawtooth of allocations between collections, so a
+steady climb stands out from noise.
+
+With ``snapshots`` a heap snapshot is written before the first and after the
+last cycle (start/end.heapsnapshot, loadable in DevTools), and
+``compare_snapshots`` lists the constructors that grew most in between.
+"""
+
+import asyncio
+import contextlib
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .console import JsonlWriter
+from .runner import Flow, Probe
+
+GAUGES = ("JSHeapUsedSize", "Nodes", "JSEventListeners", "Documents")
+# gauge -> (minimum absolute rise, minimum rise relative to the start) before growth is flagged
+LEAK_FLOORS: Dict[str, tuple] = {
+    "JSHeapUsedSize": (1024 * 1024, 0.05),
+    "Nodes": (100, 0.05),
+    "JSEventListeners": (20, 0.05),
+    "Documents": (1, 0.0),
+}
+WINDOWS = 5
+
+
+@dataclass
+class Sample:
+    elapsed_s: float
+    cycle: int
+    values: Dict[str, float]
+
+
+class HeapSampler:
+    """CDP Performance metrics and heap snapshots for one page."""
+
+    def __init__(self, cdp, collect_garbage: bool = True):
+        self.cdp = cdp
+        self.collect_garbage = collect_garbage
+        self.started = time.perf_counter()
+
+    @classmethod
+    async def create(cls, context, page, collect_garbage: bool = True) -> "HeapSampler":
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+        except Exception as e:
+            raise RuntimeError(f"Leak sampling needs CDP (Chromium): {e}") from e
+        return cls(cdp, collect_garbage)
+
+    async def sample(self, cycle: int) -> Sample:
+        if self.collect_garbage:
+            await self.cdp.send("HeapProfiler.collectGarbage")
+        response = await self.cdp.send("Performance.getMetrics")
+        metrics = {metric["name"]: metric["value"] for metric in response["metrics"]}
+        return Sample(round(time.perf_counter() - self.started, 2), cycle,
+                      {name: metrics.get(name, 0.0) for name in GAUGES})
+
+    async def snapshot(self, file_path: Path) -> Path:
+        """Write a heap snapshot as it streams in (they run to hundreds of MB)."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            def on_chunk(params):
+                f.write(params["chunk"])
+
+            self.cdp.on("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+            try:
+                await self.cdp.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+            finally:
+                self.cdp.remove_listener("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+        return file_path
+
+
+# -- analysis ----------------------------------------------------------------
+
+def _slope(xs: List[float], ys: List[float]) -> float:
+    """Least-squares slope of ys over xs (0 when xs do not vary)."""
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    var = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var if var else 0.0
+
+
+def analyze_gauge(samples: List[Sample], gauge: str) -> dict:
+    values = [s.values[gauge] for s in samples]
+    windows = min(WINDOWS, len(values) // 2)
+    if windows < 2:
+        return {"samples": len(values), "flagged": False, "note": "too few samples"}
+    size = len(values) / windows
+    minima = [min(values[round(i * size):round((i + 1) * size)]) for i in range(windows)]
+    rise = minima[-1] - minima[0]
+    absolute, relative = LEAK_FLOORS[gauge]
+    monotonic = all(b >= a for a, b in zip(minima, minima[1:])) and rise > 0
+    return {
+        "samples": len(values),
+        "start": values[0],
+        "end": values[-1],
+        "max": max(values),
+        "window_minima": minima,
+        "rise": rise,
+        "rise_pct": round(rise * 100 / minima[0], 2) if minima[0] else None,
+        "per_100_cycles": round(_slope([s.cycle for s in samples], values) * 100, 1),
+        "monotonic": monotonic,
+        "flagged": monotonic and rise >= max(absolute, relative * minima[0]),
+    }
+
+
+def build_soak_report(samples: List[Sample], cycle_ms: List[float], snapshots: Dict[str, str]) -> dict:
+    tenth = max(1, len(cycle_ms) // 10)
+    return {
+        "cycles": len(cycle_ms),
+        "elapsed_s": samples[-1].elapsed_s if samples else 0.0,
+        # First and last tenth of the cycles: a slowdown usually accompanies a leak
+        "cycle_ms_first": round(statistics.median(cycle_ms[:tenth]), 1) if cycle_ms else None,
+        "cycle_ms_last": round(statistics.median(cycle_ms[-tenth:]), 1) if cycle_ms else None,
+        "gauges": {gauge: analyze_gauge(samples, gauge) for gauge in GAUGES},
+        "snapshots": snapshots,
+    }
+
+
+def flagged_gauges(report: dict) -> List[str]:
+    return [gauge for gauge, result in report["gauges"].items() if result["flagged"]]
+
+
+# -- heap snapshots ------------------------------------------------------------
+
+def snapshot_summary(file_path: Path) -> dict:
+    """Object count and self size per constructor name, plus detached DOM nodes."""
+    snapshot = json.loads(file_path.read_text(encoding="utf-8"))
+    meta = snapshot["snapshot"]["meta"]
+    fields = meta["node_fields"]
+    node_types = meta["node_types"][0]
+    nodes, strings = snapshot["nodes"], snapshot["strings"]
+    width = len(fields)
+    type_at, name_at, size_at = fields.index("type"), fields.index("name"), fields.index("self_size")
+    detached_at = fields.index("detachedness") if "detachedness" in fields else None
+
+    by_name: Dict[str, List[int]] = {}
+    total = detached = 0
+    for offset in range(0, len(nodes), width):
+        size = nodes[offset + size_at]
+        total += size
+        if detached_at is not None and nodes[offset + detached_at] == 2:
+            detached += 1
+        if node_types[nodes[offset + type_at]] not in ("object", "closure", "native"):
+            continue
+        entry = by_name.setdefault(strings[nodes[offset + name_at]], [0, 0])
+        entry[0] += 1
+        entry[1] += size
+    return {"nodes": len(nodes) // width, "total_size": total, "detached": detached, "by_name": by_name}
+
+
+def compare_snapshots(before: dict, after: dict, top: int = 15) -> List[dict]:
+    """Constructors with the largest self-size growth between two summaries."""
+    rows = []
+    for name in set(before["by_name"]) | set(after["by_name"]):
+        count_before, size_before = before["by_name"].get(name, (0, 0))
+        count_after, size_after = after["by_name"].get(name, (0, 0))
+        if count_after > count_before or size_after > size_before:
+            rows.append({"name": name, "count_delta": count_after - count_before,
+                         "size_delta": size_after - size_before, "count": count_after})
+    return sorted(rows, key=lambda r: (-r["size_delta"], -r["count_delta"]))[:top]
+
+
+# -- flow --------------------------------------------------------------------
+
+def soak_flow(setup: Flow, cycle: Flow, cycles: Optional[int] = None, duration_s: Optional[float] = None,
+              interval_s: float = 5.0, snapshots: bool = False, collect_garbage: bool = True) -> Flow:
+    """A flow running ``setup`` once, then ``cycle`` until ``cycles`` or ``duration_s`` runs out."""
+    if cycles is None and duration_s is None:
+        raise ValueError("A soak run needs a cycle count or a duration")
+
+    async def flow(probe: Probe) -> None:
+        async with probe.step("setup"):
+            await setup(probe)
+
+        out_dir = probe.config.output_dir / probe.name
+        sampler = await HeapSampler.create(probe.context, probe.page, collect_garbage)
+        writer = JsonlWriter(out_dir / "soak.jsonl")
+        samples: List[Sample] = []
+        cycle_ms: List[float] = []
+        snapshot_paths: Dict[str, str] = {}
+        stop = asyncio.Event()
+
+        async def take_sample() -> None:
+            sample = await sampler.sample(len(cycle_ms))
+            samples.append(sample)
+            writer.write({"elapsed_s": sample.elapsed_s, "cycle": sample.cycle, **sample.values})
+
+        async def sample_every_interval() -> None:
+            while not stop.is_set():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), interval_s)
+                if not stop.is_set():
+                    await take_sample()
+
+        try:
+            if snapshots:
+                snapshot_paths["start"] = str(await sampler.snapshot(out_dir / "start.heapsnapshot"))
+            await take_sample()
+            deadline = time.perf_counter() + duration_s if duration_s is not None else None
+            async with probe.step("soak"):
+                sampling = asyncio.create_task(sample_every_interval())
+                try:
+                    while (cycles is None or len(cycle_ms) < cycles) and \
+                            (deadline is None or time.perf_counter() < deadline):
+                        started = time.perf_counter()
+                        await cycle(probe)
+                        cycle_ms.append((time.perf_counter() - started) * 1000)
+                finally:
+                    stop.set()
+                    await sampling
+            await take_sample()
+            if snapshots:
+                snapshot_paths["end"] = str(await sampler.snapshot(out_dir / "end.heapsnapshot"))
+        finally:
+            writer.close()
+            probe.result.data["soak"] = build_soak_report(samples, cycle_ms, snapshot_paths)
+
+    return flow
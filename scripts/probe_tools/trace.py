@@ -0,0 +1,233 @@
+"""
+Per-step performance traces for probes.
+
+With tracing on, every ``probe.step()`` records:
+
+- navigation timing, when the step loaded a new document (TTFB, DOMContent
+  Loaded, load);
+- resource timing for every /translations/... request made during the step,
+  split into language and namespace (``/translations/es/orders.json`` and
+  compiled ``/translations/_compiled/es/orders.<hash>.json`` alike);
+- long tasks (> 50 ms main-thread blocks) observed during the step;
+- Chrome DevTools Protocol Performance metrics: script/layout/style time
+  deltas and JS heap / DOM node / listener counts at the end of the step.
+
+Reports are plain JSON so runs can be stored and compared step by step.
+"""
+
+import json
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+TRACE_FORMAT = 1
+
+# Installed before any page script runs
+OBSERVER_SCRIPT = """
+(() => {
+  try { performance.setResourceTimingBufferSize(10000); } catch (e) {}
+  window.__probeLongTasks = [];
+  try {
+    new PerformanceObserver(list => {
+      for (const entry of list.getEntries()) window.__probeLongTasks.push([entry.startTime, entry.duration]);
+    }).observe({ type: 'longtask', buffered: true });
+  } catch (e) {}
+})();
+"""
+
+_COLLECT_SCRIPT = """
+([since, origin]) => {
+  const sameDocument = performance.timeOrigin === origin;
+  const from = sameDocument ? since : 0;
+  const nav = performance.getEntriesByType('navigation')[0];
+  const resources = performance.getEntriesByType('resource').filter(e => e.startTime >= from);
+  return {
+    now: performance.now(),
+    origin: performance.timeOrigin,
+    navigation: (!sameDocument && nav) ? {
+      ttfb: nav.responseStart - nav.startTime,
+      dom_content_loaded: nav.domContentLoadedEventEnd,
+      load: nav.loadEventEnd,
+      transfer_size: nav.transferSize,
+    } : null,
+    resources: resources.length,
+    translations: resources.filter(e => e.name.includes('/translations/')).map(e => ({
+      url: e.name, start: e.startTime, duration: e.duration,
+      transfer_size: e.transferSize, decoded_size: e.decodedBodySize,
+    })),
+    long_tasks: (window.__probeLongTasks || []).filter(t => t[0] >= from),
+  };
+}
+"""
+
+_MARK_SCRIPT = "() => [performance.now(), performance.timeOrigin]"
+
+_TRANSLATION_URL = re.compile(r"/translations/(?:_compiled/)?([\w-]+)/([\w-]+?)(?:\.[0-9a-f]{6,})?\.json")
+
+# CDP Performance.getMetrics names: durations (seconds, reported as deltas) and gauges (end values)
+DURATION_METRICS = ("TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration")
+COUNT_METRICS = ("LayoutCount", "RecalcStyleCount")
+GAUGE_METRICS = ("JSHeapUsedSize", "Nodes", "JSEventListeners", "Documents")
+
+
+@dataclass
+class _Mark:
+    started: float
+    page_now: float
+    origin: float
+    metrics: Dict[str, float]
+
+
+class Tracer:
+    """Collects one trace dict per step for a page."""
+
+    def __init__(self, page, cdp=None):
+        self.page = page
+        self.cdp = cdp
+
+    @classmethod
+    async def create(cls, context, page) -> "Tracer":
+        """CDP is Chromium-only; other browsers still get the Performance API data."""
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+        except Exception:
+            cdp = None
+        return cls(page, cdp)
+
+    async def metrics(self) -> Dict[str, float]:
+        if self.cdp is None:
+            return {}
+        response = await self.cdp.send("Performance.getMetrics")
+        return {metric["name"]: metric["value"] for metric in response["metrics"]}
+
+    async def begin(self) -> _Mark:
+        try:
+            page_now, origin = await self.page.evaluate(_MARK_SCRIPT)
+        except Exception:
+            page_now, origin = 0.0, 0.0
+        return _Mark(time.perf_counter(), page_now, origin, await self.metrics())
+
+    async def end(self, mark: _Mark) -> dict:
+        data = await self.page.evaluate(_COLLECT_SCRIPT, [mark.page_now, mark.origin])
+        metrics = await self.metrics()
+
+        translations = []
+        for entry in data["translations"]:
+            match = _TRANSLATION_URL.search(entry["url"])
+            translations.append({
+                "lang": match.group(1) if match else None,
+                "namespace": match.group(2) if match else None,
+                "duration_ms": round(entry["duration"], 1),
+                "transfer_size": entry["transfer_size"],
+                "decoded_size": entry["decoded_size"],
+                # transferSize 0 with a body means it came from a cache
+                "cached": entry["transfer_size"] == 0 and entry["decoded_size"] > 0,
+                "url": entry["url"],
+            })
+
+        trace = {
+            "wall_ms": round((time.perf_counter() - mark.started) * 1000, 1),
+            "navigation": data["navigation"],
+            "resources": data["resources"],
+            "translations": translations,
+            "long_tasks": len(data["long_tasks"]),
+            "long_task_ms": round(sum(duration for _, duration in data["long_tasks"]), 1),
+        }
+        if metrics:
+            trace["cdp"] = {
+                **{f"{name}_ms": round((metrics.get(name, 0) - mark.metrics.get(name, 0)) * 1000, 1)
+                   for name in DURATION_METRICS},
+                **{name: int(metrics.get(name, 0) - mark.metrics.get(name, 0)) for name in COUNT_METRICS},
+                **{name: int(metrics.get(name, 0)) for name in GAUGE_METRICS},
+            }
+        return trace
+
+
+# -- reports ---------------------------------------------------------------
+
+def build_report(results) -> dict:
+    """``{runs: {run name: {flow, ok, steps: [{name, elapsed_ms, error, trace}]}}}``."""
+    return {
+        "format": TRACE_FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "runs": {
+            result.name: {
+                "flow": result.flow,
+                "ok": result.ok,
+                "steps": [
+                    {"name": step.name, "elapsed_ms": round(step.elapsed_ms, 1),
+                     "error": step.error, "trace": step.trace}
+                    for step in result.steps
+                ],
+            }
+            for result in results
+        },
+    }
+
+
+def write_report(report: dict, file_path: Path) -> Path:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return file_path
+
+
+def load_report(file_path: Path) -> dict:
+    report = json.loads(file_path.read_text(encoding="utf-8"))
+    if report.get("format") != TRACE_FORMAT:
+        raise ValueError(f"{file_path}: unsupported trace format {report.get('format')}")
+    return report
+
+
+def step_summary(report: dict) -> Dict[Tuple[str, str], dict]:
+    """Median values per (flow, step) over every successful run of that flow."""
+    samples: Dict[Tuple[str, str], List[dict]] = {}
+    for run in report["runs"].values():
+        for step in run["steps"]:
+            if step["error"] is None:
+                samples.setdefault((run["flow"], step["name"]), []).append(step)
+
+    summary = {}
+    for key, steps in samples.items():
+        traces = [s["trace"] for s in steps if s.get("trace")]
+        summary[key] = {
+            "runs": len(steps),
+            "elapsed_ms": statistics.median(s["elapsed_ms"] for s in steps),
+            "translations": statistics.median(len(t["translations"]) for t in traces) if traces else None,
+            "translation_ms": statistics.median(
+                max((r["duration_ms"] for r in t["translations"]), default=0) for t in traces
+            ) if traces else None,
+            "long_task_ms": statistics.median(t["long_task_ms"] for t in traces) if traces else None,
+            "script_ms": statistics.median(
+                t["cdp"]["ScriptDuration_ms"] for t in traces
+            ) if traces and all("cdp" in t for t in traces) else None,
+        }
+    return summary
+
+
+def compare_reports(base: dict, new: dict) -> List[dict]:
+    """Per-step rows with base/new medians for every (flow, step) in either report."""
+    base_summary, new_summary = step_summary(base), step_summary(new)
+    rows = []
+    for key in sorted(set(base_summary) | set(new_summary)):
+        before, after = base_summary.get(key), new_summary.get(key)
+        row = {"flow": key[0], "step": key[1], "base": before, "new": after}
+        if before and after:
+            row["delta_ms"] = after["elapsed_ms"] - before["elapsed_ms"]
+            row["delta_pct"] = row["delta_ms"] * 100 / before["elapsed_ms"] if before["elapsed_ms"] else None
+        rows.append(row)
+    return rows
+
+
+def translation_table(trace: Optional[dict]) -> List[str]:
+    """Human-readable lines for the translation requests of one step."""
+    if not trace:
+        return []
+    return [
+        f"{entry['lang']}/{entry['namespace']}: {entry['duration_ms']:.0f} ms, "
+        f"{entry['decoded_size'] / 1024:.1f} KB{' (cache)' if entry['cached'] else ''}"
+        for entry in sorted(trace["translations"], key=lambda e: -e["duration_ms"])
+    ]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Report translation keys that no source file can reach
+
+Cross-references every key in the build source against the key usage index
+(static lookups, dynamic prefixes and dotted string literals in src/) and
+prints the dead keys and the minified bytes they cost per namespace. The
+translation files are never modified; use
+`compile-translations.py --prune` to emit bundles without the dead keys.
+
+Usage:
+  python scripts/prune-translation-keys.py
+  python scripts/prune-translation-keys.py --lang en --namespace vin_scanner_history --keys
+  python scripts/prune-translation-keys.py --json dead-keys.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.compiler import SOURCES, load_sources
+from i18n_tools.key_index import load_index
+from i18n_tools.pruner import prune_sources
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Dead translation key report")
+    parser.add_argument("--lang", action="append", dest="languages",
+                        help="Only report this language (repeatable)")
+    parser.add_argument("--source", choices=SOURCES, default="merged", help="Translation source")
+    parser.add_argument("--namespace", action="append", dest="namespaces",
+                        help="Only report this namespace (repeatable)")
+    parser.add_argument("--keys", action="store_true", help="List every dead key")
+    parser.add_argument("--json", type=Path, help="Also write the full report as JSON")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    languages = args.languages or list(LANGUAGES)
+
+    print("=" * 60)
+    print("Dead Translation Keys")
+    print("=" * 60)
+    print()
+
+    index, _ = load_index()
+    sources = load_sources(languages, source=args.source)
+    _, reports = prune_sources(sources, index, languages)
+
+    payload = {}
+    for lang in languages:
+        selected = [r for r in reports[lang] if not args.namespaces or r.namespace in args.namespaces]
+        total_keys = sum(r.keys for r in selected)
+        total_dead = sum(r.dead for r in selected)
+        total_bytes = sum(r.bytes for r in selected)
+        dead_bytes = sum(r.dead_bytes for r in selected)
+
+        print(f"{lang}: {total_dead}/{total_keys} keys dead, "
+              f"{dead_bytes / 1024:.1f} of {total_bytes / 1024:.1f} KB minified")
+        for report in sorted(selected, key=lambda r: r.dead_bytes, reverse=True):
+            if not report.dead:
+                continue
+            print(f"  {report.namespace:<32} {report.dead:>5}/{report.keys:<5} {report.dead_bytes:>8} bytes")
+            if args.keys:
+                for path, cost in report.dead_keys:
+                    print(f"    - {path} ({cost} bytes)")
+        print()
+
+        payload[lang] = {
+            r.namespace: {
+                "keys": r.keys,
+                "bytes": r.bytes,
+                "dead_bytes": r.dead_bytes,
+                "dead_keys": [path for path, _ in r.dead_keys],
+            }
+            for r in selected
+        }
+
+    if args.json:
+        args.json.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] Report written to {args.json}")
+
+    print("=" * 60)
+    print("COMPLETE: translation files were not modified")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Concurrent multi-session load test of the web app
+
+Runs a probe flow as N simultaneous headless sessions (isolated browser
+contexts spread over worker processes) and reports latency percentiles,
+error rate and throughput per step. Give --sessions several times to
+compare load levels side by side. The default flow signs in, so set
+PROBE_EMAIL and PROBE_PASSWORD.
+
+Usage:
+  python scripts/run-load-test.py --sessions 10
+  python scripts/run-load-test.py --sessions 10 --sessions 50 --sessions 200 --processes 8
+  python scripts/run-load-test.py --flow initial-load --sessions 50 --iterations 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from probe_tools.flows import FLOWS
+from probe_tools.load import PERCENTILES, run_load
+from probe_tools.runner import BASE_URL, OUTPUT_DIR, ProbeConfig
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Multi-session load test")
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="login-role-notifications")
+    parser.add_argument("--sessions", type=int, action="append",
+                        help="Concurrent sessions (repeatable for a sweep, default 10)")
+    parser.add_argument("--iterations", type=int, default=1, help="Flow runs per session")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=int, default=30000, help="Per-action timeout in ms")
+    return parser.parse_args()
+
+
+def print_report(report):
+    print(f"{report.sessions} sessions x {report.iterations} on {report.processes} process(es): "
+          f"{report.wall_s:.1f} s wall")
+    header = "".join(f"{'p' + str(p):>9}" for p in PERCENTILES)
+    print(f"  {'step':<28}{'count':>7}{'errors':>8}{header}{'max':>9}{'per s':>8}")
+    for stats in report.steps + [report.session_stats]:
+        values = "".join(f"{stats.percentiles[p]:>9.0f}" for p in PERCENTILES)
+        print(f"  {stats.name:<28}{stats.count:>7}{stats.error_rate * 100:>7.1f}%{values}"
+              f"{stats.max_ms:>9.0f}{stats.throughput:>8.2f}")
+        for error in stats.top_errors:
+            print(f"    ! {error}")
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    levels = args.sessions or [10]
+    email, password = os.environ.get("PROBE_EMAIL"), os.environ.get("PROBE_PASSWORD")
+    config = ProbeConfig(base_url=args.base_url, timeout_ms=args.timeout,
+                         credentials=(email, password) if email and password else None)
+
+    print("=" * 60)
+    print(f"Load Test: {args.flow}")
+    print("=" * 60)
+    print()
+
+    reports = []
+    for sessions in levels:
+        try:
+            report = run_load(args.flow, sessions, args.iterations, args.processes, config)
+        except RuntimeError as e:
+            print(f"[ERROR] {e}")
+            return 1
+        print_report(report)
+        print()
+        reports.append(report)
+
+    out_path = OUTPUT_DIR / "load" / f"{time.strftime('%Y%m%d-%H%M%S')}-{args.flow}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps([r.to_dict() for r in reports], indent=2) + "\n", encoding="utf-8")
+
+    failed = sum(r.session_stats.errors for r in reports)
+    print("=" * 60)
+    print(f"COMPLETE: {sum(r.session_stats.count for r in reports)} sessions, {failed} failed")
+    print(f"Report: {out_path}")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
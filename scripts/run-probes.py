@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Run browser probe flows against the local dev server
+
+Every run gets an isolated browser context; runs execute concurrently and
+wait on page events (network idle, visible dialogs) instead of fixed sleeps.
+Requires Playwright for Python (pip install playwright && playwright install
+chromium) and the app on http://localhost:8080 (npm run dev). Flows that
+sign in read PROBE_EMAIL and PROBE_PASSWORD.
+
+Usage:
+  python scripts/run-probes.py                                   # every flow once
+  python scripts/run-probes.py --flow role-notifications-modal --repeat 5
+  python scripts/run-probes.py --headed --concurrency 1
+  python scripts/run-probes.py --base-url http://localhost:4173
+  python scripts/run-probes.py --log-tag DealerRoles --log-tag RoleNotificationsModal
+  python scripts/run-probes.py --trace --repeat 3                # per-step performance trace
+  python scripts/run-probes.py --trace --compare .cache/probes/traces/<earlier>.json
+  python scripts/run-probes.py --record modal                    # save backend traffic
+  python scripts/run-probes.py --replay modal --latency broadband  # offline, deterministic
+  python scripts/run-probes.py --update-baselines                # accept the current screenshots
+  python scripts/run-probes.py --cache-state warm --repeat 5     # on primed persistent profiles
+
+Console output of each run is streamed to .cache/probes/<run>/console.jsonl
+(query it with scripts/probe-logs.py). Screenshots go to screenshots/<run>/
+and are diffed against screenshots/baselines/<flow>/ (needs numpy and Pillow);
+a changed frame fails the run and leaves a .diff.png next to it.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from probe_tools.flows import FLOWS
+from probe_tools.profiles import CACHE_STATES
+from probe_tools.replay import LATENCY_PROFILES
+from probe_tools.runner import BASE_URL, OUTPUT_DIR, REPLAY_DIR, ProbeConfig, run_probes
+from probe_tools.screenshots import diff_available
+from probe_tools.trace import build_report, compare_reports, load_report, translation_table, write_report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run browser probe flows")
+    parser.add_argument("--flow", action="append", dest="flows", choices=sorted(FLOWS),
+                        help="Flow to run (repeatable, default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per flow")
+    parser.add_argument("--concurrency", type=int, default=4, help="Browser contexts in flight at once")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--log-tag", action="append", dest="log_tags",
+                        help="Only capture console messages with this [Tag] (repeatable)")
+    parser.add_argument("--log-capacity", type=int, default=5000, help="Console records kept per run")
+    parser.add_argument("--trace", action="store_true",
+                        help="Record navigation/resource timing, long tasks and CDP metrics per step")
+    parser.add_argument("--trace-out", type=Path, help="Trace report path (default: .cache/probes/traces/<time>.json)")
+    parser.add_argument("--compare", type=Path, help="Compare per-step medians with an earlier trace report")
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument("--record", metavar="ARCHIVE",
+                         help="Record backend traffic to .cache/probes/replay/ARCHIVE")
+    backend.add_argument("--replay", metavar="ARCHIVE",
+                         help="Serve backend traffic from a recorded archive instead of the network")
+    parser.add_argument("--latency", choices=sorted(LATENCY_PROFILES), default="none",
+                        help="Latency profile for --replay")
+    parser.add_argument("--strict", action="store_true",
+                        help="With --replay, fail requests missing from the archive instead of going live")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="Write new and changed screenshots as the baselines")
+    parser.add_argument("--screenshot-workers", type=int, default=2,
+                        help="Threads writing and diffing screenshots")
+    parser.add_argument("--cache-state", choices=CACHE_STATES, default="cold",
+                        help="Start from a fresh context (cold) or a primed persistent profile (warm/stale)")
+    parser.add_argument("--reprime", action="store_true", help="Re-prime the warm/stale profiles first")
+    parser.add_argument("--timeout", type=int, default=15000, help="Per-action timeout in ms")
+    return parser.parse_args()
+
+
+def credentials_from_env():
+    email, password = os.environ.get("PROBE_EMAIL"), os.environ.get("PROBE_PASSWORD")
+    return (email, password) if email and password else None
+
+
+def print_result(result):
+    status = "[OK]" if result.ok else "[ERROR]"
+    print(f"{status} {result.name}: {result.elapsed_ms:.0f} ms")
+    for step in result.steps:
+        print(f"  {step.name:<28} {step.elapsed_ms:>8.0f} ms{'' if step.ok else '  ' + step.error}")
+        if step.trace:
+            trace = step.trace
+            navigation = trace["navigation"]
+            if navigation:
+                print(f"    navigation: TTFB {navigation['ttfb']:.0f} ms, "
+                      f"DOMContentLoaded {navigation['dom_content_loaded']:.0f} ms, load {navigation['load']:.0f} ms")
+            print(f"    {trace['resources']} requests, {len(trace['translations'])} translation files, "
+                  f"{trace['long_tasks']} long tasks ({trace['long_task_ms']:.0f} ms)"
+                  + (f", script {trace['cdp']['ScriptDuration_ms']:.0f} ms, "
+                     f"{trace['cdp']['Nodes']} nodes" if "cdp" in trace else ""))
+            for line in translation_table(trace):
+                print(f"      {line}")
+    for key, value in result.data.items():
+        print(f"  {key}: {value}")
+    if result.logs:
+        print(f"  {len(result.logs)} tagged console log(s):")
+        for record in result.logs:
+            print(f"    {record.format()}")
+    for frame in result.visual:
+        if frame.status == "match" and frame.duplicate_of is None:
+            continue
+        line = f"  screenshot {frame.name}: {frame.status}"
+        if frame.duplicate_of is not None:
+            line += f" (same as {frame.duplicate_of.name})"
+        if frame.failed_regions:
+            line += " - " + ", ".join(
+                f"{region} {frame.regions[region] * 100:.2f}%" if region in frame.regions else region
+                for region in frame.failed_regions
+            )
+        print(line)
+    if result.console_log:
+        print(f"  Console: {result.console_log}")
+    if result.error:
+        print(f"  ! {result.error}")
+
+
+def print_comparison(rows):
+    print(f"{'flow / step':<52} {'base':>8} {'new':>8} {'delta':>8}")
+    for row in rows:
+        label = f"{row['flow']} / {row['step']}"
+        base = f"{row['base']['elapsed_ms']:.0f}" if row["base"] else "-"
+        new = f"{row['new']['elapsed_ms']:.0f}" if row["new"] else "-"
+        delta = f"{row['delta_ms']:+.0f}" if "delta_ms" in row else ""
+        print(f"{label:<52} {base:>8} {new:>8} {delta:>8}")
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    names = args.flows or sorted(FLOWS)
+    flows = [(name, FLOWS[name]) for name in names for _ in range(args.repeat)]
+    config = ProbeConfig(base_url=args.base_url, headless=not args.headed,
+                         concurrency=args.concurrency, timeout_ms=args.timeout,
+                         log_tags=args.log_tags, log_capacity=args.log_capacity,
+                         trace=args.trace or args.compare is not None,
+                         credentials=credentials_from_env(),
+                         backend="record" if args.record else "replay" if args.replay else None,
+                         replay_archive=REPLAY_DIR / (args.record or args.replay or "default"),
+                         latency_profile=args.latency, replay_strict=args.strict,
+                         update_baselines=args.update_baselines,
+                         screenshot_workers=args.screenshot_workers,
+                         cache_state=args.cache_state, reprime=args.reprime)
+
+    print("=" * 60)
+    print("Browser Probes")
+    print("=" * 60)
+    print()
+    if not diff_available():
+        print("[WARN] numpy/Pillow not installed; screenshots are saved but not diffed against baselines")
+        print()
+
+    try:
+        results = run_probes(flows, config)
+    except (RuntimeError, FileNotFoundError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    for result in results:
+        print_result(result)
+        print()
+
+    if config.trace:
+        report = build_report(results)
+        trace_path = args.trace_out or OUTPUT_DIR / "traces" / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+        print(f"Trace report: {write_report(report, trace_path)}")
+        if args.compare:
+            print()
+            print_comparison(compare_reports(load_report(args.compare), report))
+        print()
+
+    failed = [r for r in results if not r.ok]
+    regressed = [frame for r in results for frame in r.visual if frame.regressed]
+    print("=" * 60)
+    print(f"COMPLETE: {len(results) - len(failed)} passed, {len(failed)} failed")
+    if regressed:
+        print(f"[ERROR] {len(regressed)} screenshot(s) differ from their baselines")
+    print("=" * 60)
+    return 1 if failed or regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Long-session leak check of the web app
+
+Opens a screen once, then repeats a cycle on it (open and close the role
+notifications dialog by default) for a number of cycles or minutes, sampling
+JS heap, DOM nodes and event listeners through CDP at a fixed interval.
+Gauges that grow monotonically are flagged and make the run fail. Signs in
+first when PROBE_EMAIL and PROBE_PASSWORD are set.
+
+Usage:
+  python scripts/run-soak.py --cycles 200
+  python scripts/run-soak.py --minutes 60 --interval 30
+  python scripts/run-soak.py --cycles 100 --snapshots      # heap snapshots at start and end
+  python scripts/run-soak.py --sessions 3 --minutes 30     # several kiosks at once
+
+Samples stream to .cache/probes/<run>/soak.jsonl; the report is written to
+.cache/probes/soak/.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from probe_tools.flows import SOAK_TARGETS
+from probe_tools.runner import BASE_URL, OUTPUT_DIR, ProbeConfig, run_probes
+from probe_tools.soak import GAUGES, compare_snapshots, flagged_gauges, snapshot_summary, soak_flow
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Long-session heap/DOM leak sampler")
+    parser.add_argument("--target", choices=sorted(SOAK_TARGETS), default="role-notifications-modal")
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument("--cycles", type=int, help="Cycles to run (default 100)")
+    length.add_argument("--minutes", type=float, help="Run for this long instead of a cycle count")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between samples")
+    parser.add_argument("--sessions", type=int, default=1, help="Concurrent sessions")
+    parser.add_argument("--snapshots", action="store_true", help="Heap snapshots before and after, with a diff")
+    parser.add_argument("--no-gc", action="store_true", help="Do not force garbage collection before samples")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=int, default=15000, help="Per-action timeout in ms")
+    return parser.parse_args()
+
+
+def format_value(gauge: str, value: float) -> str:
+    return f"{value / (1024 * 1024):.1f} MB" if gauge == "JSHeapUsedSize" else f"{value:.0f}"
+
+
+def print_report(name: str, report: dict) -> None:
+    print(f"{name}: {report['cycles']} cycles in {report['elapsed_s']:.0f} s, "
+          f"cycle {report['cycle_ms_first'] or 0:.0f} ms -> {report['cycle_ms_last'] or 0:.0f} ms")
+    for gauge in GAUGES:
+        result = report["gauges"][gauge]
+        if "note" in result:
+            print(f"  {gauge:<18} {result['note']}")
+            continue
+        status = "[WARN]" if result["flagged"] else "[OK]  "
+        print(f"  {status} {gauge:<18} {format_value(gauge, result['start']):>10} -> "
+              f"{format_value(gauge, result['end']):>10}  "
+              f"{'monotonic ' if result['monotonic'] else ''}rise {format_value(gauge, result['rise'])}"
+              f" ({result['rise_pct'] or 0:.1f}%), {result['per_100_cycles']:+.0f} per 100 cycles")
+
+    snapshots = report["snapshots"]
+    if "start" in snapshots and "end" in snapshots:
+        before, after = snapshot_summary(Path(snapshots["start"])), snapshot_summary(Path(snapshots["end"]))
+        print(f"  heap snapshots: {before['total_size'] / 1024 / 1024:.1f} MB -> "
+              f"{after['total_size'] / 1024 / 1024:.1f} MB, detached DOM nodes {before['detached']} -> "
+              f"{after['detached']}")
+        for row in compare_snapshots(before, after, top=10):
+            print(f"    {row['name'][:40]:<40} {row['count_delta']:+8d} objects {row['size_delta'] / 1024:+10.1f} KB")
+        print(f"  {snapshots['end']}")
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    setup, cycle = SOAK_TARGETS[args.target]
+    cycles = None if args.minutes else (args.cycles or 100)
+    flow = soak_flow(setup, cycle, cycles=cycles, duration_s=args.minutes * 60 if args.minutes else None,
+                     interval_s=args.interval, snapshots=args.snapshots, collect_garbage=not args.no_gc)
+    email, password = os.environ.get("PROBE_EMAIL"), os.environ.get("PROBE_PASSWORD")
+    config = ProbeConfig(base_url=args.base_url, headless=not args.headed, concurrency=args.sessions,
+                         timeout_ms=args.timeout, screenshots=False,
+                         credentials=(email, password) if email and password else None)
+
+    print("=" * 60)
+    print(f"Soak: {args.target}, " + (f"{args.minutes:g} min" if args.minutes else f"{cycles} cycles")
+          + f" x {args.sessions} session(s)")
+    print("=" * 60)
+    print()
+
+    try:
+        results = run_probes([(f"soak-{args.target}", flow)] * args.sessions, config)
+    except RuntimeError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    flagged = 0
+    for result in results:
+        report = result.data.get("soak")
+        if report is not None:
+            print_report(result.name, report)
+            flagged += len(flagged_gauges(report))
+        if result.error:
+            print(f"  [ERROR] {result.error}")
+        print()
+
+    out_path = OUTPUT_DIR / "soak" / f"{time.strftime('%Y%m%d-%H%M%S')}-{args.target}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps({r.name: r.data.get("soak") for r in results}, indent=2) + "\n",
+                        encoding="utf-8")
+
+    failed = [r for r in results if not r.ok]
+    print("=" * 60)
+    print(f"COMPLETE: {len(results) - len(failed)} session(s) finished, {len(failed)} failed, "
+          f"{flagged} growing gauge(s)")
+    print(f"Report: {out_path}")
+    print("=" * 60)
+    return 1 if failed or flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Fuzzy search over every translation key and value
+
+Check whether a string already exists before adding a key: the trigram index
+(.cache/i18n/search-index.json) covers keys and values of all languages and
+is rebuilt automatically when a translation file changes.
+
+Usage:
+  python scripts/search-translations.py "Scan History"
+  python scripts/search-translations.py escanear --lang es
+  python scripts/search-translations.py vin_scanner --keys
+  python scripts/search-translations.py "Upload Image" --duplicates   # near-identical values only
+  python scripts/search-translations.py --rebuild "status"
+"""
+
+import argparse
+import sys
+import time
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.search_index import DUPLICATE_THRESHOLD, load_search_index
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Search translation keys and values")
+    parser.add_argument("query")
+    parser.add_argument("--lang", action="append", dest="languages", choices=LANGUAGES,
+                        help="Only search this language (repeatable)")
+    field = parser.add_mutually_exclusive_group()
+    field.add_argument("--keys", action="store_true", help="Match keys only")
+    field.add_argument("--values", action="store_true", help="Match values only")
+    parser.add_argument("--duplicates", action="store_true",
+                        help=f"Only values at least --threshold similar (default {DUPLICATE_THRESHOLD})")
+    parser.add_argument("--threshold", type=float, default=DUPLICATE_THRESHOLD)
+    parser.add_argument("--limit", type=int, default=20, help="Maximum results")
+    parser.add_argument("--min-score", type=float, default=0.3, help="Minimum ranking score (0-1)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index even if it is current")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    started = time.perf_counter()
+    index, rebuilt = load_search_index(rebuild=args.rebuild)
+    loaded = time.perf_counter()
+
+    if args.duplicates:
+        matches = [m for lang in (args.languages or LANGUAGES)
+                   for m in index.duplicates(args.query, lang, args.threshold)][:args.limit]
+    else:
+        fields = ("key",) if args.keys else ("value",) if args.values else ("value", "key")
+        matches = index.search(args.query, args.languages, fields, args.limit, args.min_score)
+    finished = time.perf_counter()
+
+    for match in matches:
+        print(f"{match.score:.2f}  {match.lang:<5}  {match.key}")
+        print(f"       {match.value}")
+
+    print()
+    print(f"{len(matches)} match(es) in {(finished - loaded) * 1000:.1f} ms "
+          f"({len(index.docs)} values, index {'rebuilt' if rebuilt else 'loaded'} "
+          f"in {(loaded - started) * 1000:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
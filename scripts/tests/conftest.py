@@ -0,0 +1,6 @@
+"""Make scripts/ importable the way the CLI scripts see it (i18n_tools, probe_tools)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
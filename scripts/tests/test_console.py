@@ -0,0 +1,51 @@
+from probe_tools.console import ConsoleCapture, parse_tags
+from probe_tools.flows import LOG_TAGS
+
+
+def test_parse_tags_after_prefix():
+    assert parse_tags("🔔 [DealerRoles] [RoleNotificationsModal] opened") == ("DealerRoles", "RoleNotificationsModal")
+
+
+def test_records_by_flow_log_tags():
+    capture = ConsoleCapture()
+    capture.add("log", "[RoleNotificationsModal] Loaded 12 events")
+    capture.add("log", "unrelated message")
+    capture.add("warning", "[DealerRoles] Opening notifications for role")
+
+    texts = [r.text for r in capture.records(tags=LOG_TAGS)]
+    assert texts == ["[RoleNotificationsModal] Loaded 12 events", "[DealerRoles] Opening notifications for role"]
+
+
+def test_bracketed_tags_match_bare_index():
+    capture = ConsoleCapture(tags=["[DealerRoles]"])
+    capture.add("log", "[DealerRoles] kept")
+    capture.add("log", "[Other] dropped")
+    assert [r.text for r in capture.records(tags=["[DealerRoles]"])] == ["[DealerRoles] kept"]
+    assert capture.filtered == 1
+
+
+def test_since_filters_older_records():
+    capture = ConsoleCapture()
+    capture.add("log", "[A] before")
+    mark = capture.mark()
+    capture.add("log", "[A] after")
+    assert [r.text for r in capture.records(tags=["A"], since=mark)] == ["[A] after"]
+
+
+def test_ring_eviction_drops_index_entries():
+    capture = ConsoleCapture(capacity=3)
+    for i in range(5):
+        capture.add("log", f"[{'A' if i % 2 else 'B'}] message {i}")
+
+    assert [r.text for r in capture.records()] == ["[B] message 2", "[A] message 3", "[B] message 4"]
+    assert capture.evicted == 2
+    assert [r.text for r in capture.records(tags=["A"])] == ["[A] message 3"]
+    assert capture.tag_counts() == {"A": 1, "B": 2}
+
+
+def test_ring_eviction_removes_empty_tags():
+    capture = ConsoleCapture(capacity=1)
+    capture.add("log", "[Gone] first")
+    capture.add("log", "[Kept] second")
+    assert "Gone" not in capture.index
+    assert capture.records(tags=["Gone"]) == []
@@ -0,0 +1,45 @@
+import copy
+import json
+
+from i18n_tools.common import canonical_hash
+from i18n_tools.deltas import apply_delta, build_delta, diff
+
+OLD = {
+    "vin_scanner_hub": {"scan": "Scan", "title": "VIN Hub", "stats": {"today": "Today"}},
+    "quick_scan": {"legacy_title": "Quick", "keep": "Keep"},
+    "dotted": {"a.b": "dot key"},
+}
+NEW = {
+    "vin_scanner_hub": {"scan": "Escanear", "title": "VIN Hub", "stats": "Stats", "added": {"x": "X"}},
+    "quick_scan": {"keep": "Keep"},
+    "dotted": {"a.b": "changed"},
+    "orders": {"title": "Orders"},
+}
+
+
+def test_diff_is_minimal():
+    sets, deletes = diff(OLD, NEW)
+    assert sorted(sets) == sorted([
+        (("vin_scanner_hub", "scan"), "Escanear"),
+        (("vin_scanner_hub", "stats"), "Stats"),
+        (("vin_scanner_hub", "added"), {"x": "X"}),
+        (("dotted", "a.b"), "changed"),
+        (("orders",), {"title": "Orders"}),
+    ])
+    assert deletes == [("quick_scan", "legacy_title")]
+
+
+def test_delta_round_trip_through_json():
+    delta = json.loads(json.dumps(build_delta("es", "1.0.0", OLD, "1.1.0", NEW)))
+    assert delta["from_hash"] == canonical_hash(OLD)
+    assert delta["to_hash"] == canonical_hash(NEW)
+
+    result = apply_delta(copy.deepcopy(OLD), delta)
+
+    assert result == NEW
+    assert canonical_hash(result) == delta["to_hash"]
+
+
+def test_identical_versions_give_an_empty_delta():
+    delta = build_delta("en", "1.0.0", OLD, "1.0.1", copy.deepcopy(OLD))
+    assert delta["set"] == [] and delta["delete"] == []
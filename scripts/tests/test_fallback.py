@@ -0,0 +1,51 @@
+from i18n_tools.common import serialize
+from i18n_tools.compiler import compile_translations
+from i18n_tools.fallback import resolve_fallbacks, resolve_language
+
+EN = {"common": {"ok": "OK", "cancel": "Cancel", "nested": {"a": "A", "b": "B"}}, "orders": {"title": "Orders"}}
+
+
+def test_missing_keys_are_filled_and_reported():
+    es = {"common": {"ok": "Vale", "nested": {"a": "A-es"}}}
+
+    resolved, report = resolve_language(es, [EN])
+
+    assert resolved == {"common": {"ok": "Vale", "cancel": "Cancel", "nested": {"a": "A-es", "b": "B"}},
+                        "orders": {"title": "Orders"}}
+    assert report == {"common": ["cancel", "nested.b"], "orders": ["*"]}
+    assert es == {"common": {"ok": "Vale", "nested": {"a": "A-es"}}}
+
+
+def test_first_fallback_in_the_chain_wins():
+    resolved, _ = resolve_language({}, [{"s": {"k": "first"}}, {"s": {"k": "second", "j": "J"}}])
+    assert resolved == {"s": {"k": "first", "j": "J"}}
+
+
+def test_filled_values_are_copies():
+    resolved, _ = resolve_language({}, [EN])
+    resolved["common"]["nested"]["a"] = "changed"
+    assert EN["common"]["nested"]["a"] == "A"
+
+
+def test_resolve_fallbacks_loads_missing_chain_languages(tmp_path):
+    (tmp_path / "en.json").write_text(serialize(EN), encoding="utf-8")
+
+    resolved, reports = resolve_fallbacks({"es": {"common": {"ok": "Vale"}}}, tmp_path, source="monolithic")
+
+    assert resolved["es"]["orders"] == {"title": "Orders"}
+    assert reports["es"]["common"] == ["cancel", "nested"]
+    assert "en" not in resolved
+
+
+def test_manifest_lists_resolved_chains(tmp_path):
+    sources = {"en": EN, "es": {"common": {"ok": "Vale"}}}
+    resolved, reports = resolve_fallbacks(sources, tmp_path)
+
+    manifest = compile_translations(["en", "es"], tmp_path, tmp_path / "out", precompress=False,
+                                    sources=resolved, fallbacks={lang: ("en",) for lang in reports})["manifest"]
+    assert manifest["fallbacks"] == {"es": ["en"]}
+
+    # A later build without resolution (e.g. --sync-split) takes the language out again
+    manifest = compile_translations(["es"], tmp_path, tmp_path / "out", precompress=False,
+                                    sources=sources)["manifest"]
+    assert manifest["fallbacks"] == {}
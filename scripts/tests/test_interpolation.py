@@ -0,0 +1,43 @@
+from i18n_tools.interpolation import compile_interpolations, tokenize, validate
+
+
+def test_tokenize_segments():
+    assert tokenize("VIN auto-corrected ({{count}} changes)") == ["VIN auto-corrected (", ["count"], " changes)"]
+    assert tokenize("Due {{date, short}}") == ["Due ", ["date", "short"]]
+    assert tokenize("{{- name}} joined") == [["name", None, 1], " joined"]
+    assert tokenize("{{{name}}}") == ["{", ["name"], "}"]
+
+
+def test_tokenize_plain_and_unclosed():
+    assert tokenize("Plain") == ["Plain"]
+    assert tokenize("Open {{ brace") == ["Open {{ brace"]
+    assert tokenize("Empty {{}} here") == ["Empty {{}} here"]
+
+
+def test_compile_interpolations_strings_and_plurals():
+    table = compile_interpolations({
+        "orders": {
+            "count_one": "{{count}} order",
+            "count_other": "{{count}} orders",
+            "title": "Orders",
+            "item": "{{count}} item",
+            "item_plural": "{{count}} items",
+        },
+        "validation": {"at_least_one": "Pick at least one"},
+        "version": "1.0",
+    })
+
+    assert set(table["strings"]) == {"orders.count_one", "orders.count_other", "orders.item", "orders.item_plural"}
+    assert table["plurals"] == {
+        "orders.count": {"one": "orders.count_one", "other": "orders.count_other"},
+        "orders.item": {"one": "orders.item", "other": "orders.item_plural"},
+    }
+
+
+def test_validate_reports_placeholder_mismatch():
+    sources = {
+        "en": {"common": {"greeting": "Hi {{name}}", "plain": "OK"}},
+        "es": {"common": {"greeting": "Hola {{nombre}}", "plain": "OK"}},
+        "pt-BR": {"common": {"greeting": "Olá {{name}}", "extra": "{{x}}"}},
+    }
+    assert validate(sources) == ["es: common.greeting uses ['nombre'], en uses ['name']"]
@@ -0,0 +1,43 @@
+from probe_tools.locate import SelectorCache, page_key
+
+
+def test_page_key_collapses_ids():
+    assert page_key("http://localhost:8080/orders/123/edit?tab=2#top") == "/orders/:id/edit"
+    assert page_key("https://app.example/dealers/5c1f8e2a-9b3d-4e6f-8a7b-0c1d2e3f4a5b/roles") == "/dealers/:id/roles"
+    assert page_key("http://localhost:8080/") == "/"
+    assert page_key("http://localhost:8080/v2/admin") == "/v2/admin"
+
+
+def test_selector_cache_round_trip(tmp_path):
+    file_path = tmp_path / "selectors.json"
+    cache = SelectorCache.load(file_path, "1.0+abc")
+    cache.put("/admin", "admin-link", "a[href='/admin']")
+    cache.save()
+
+    assert SelectorCache.load(file_path, "1.0+abc").get("/admin", "admin-link") == "a[href='/admin']"
+    assert SelectorCache.load(file_path, "1.1+def").get("/admin", "admin-link") is None
+
+
+def test_selector_cache_save_merges_other_writers(tmp_path):
+    file_path = tmp_path / "selectors.json"
+    first, second = SelectorCache.load(file_path, "b"), SelectorCache.load(file_path, "b")
+    first.put("/a", "t", "#one")
+    first.save()
+    second.put("/b", "t", "#two")
+    second.save()
+
+    merged = SelectorCache.load(file_path, "b")
+    assert merged.get("/a", "t") == "#one" and merged.get("/b", "t") == "#two"
+
+
+def test_damaged_cache_file_reads_as_empty(tmp_path):
+    file_path = tmp_path / "selectors.json"
+    file_path.write_text('{"format": 1, "build": "b", "entr', encoding="utf-8")
+
+    cache = SelectorCache.load(file_path, "b")
+    assert cache.entries == {}
+    cache.put("/a", "t", "#one")
+    cache.save()
+
+    assert SelectorCache.load(file_path, "b").get("/a", "t") == "#one"
+    assert [p.name for p in tmp_path.iterdir()] == ["selectors.json"]
@@ -0,0 +1,51 @@
+from i18n_tools.common import serialize
+from i18n_tools.parity import ParityResult, check_patch_sets, compare, flatten, placeholders
+from i18n_tools.patch_engine import PatchSet
+
+
+def test_placeholders_forms():
+    assert placeholders("{{count}} of {{ total }}") == {"count", "total"}
+    assert placeholders("{{- name}} and {{date, short}}") == {"name", "date"}
+    assert placeholders("{{user.name}}") == {"user.name"}
+    assert placeholders("No braces") == frozenset()
+    assert placeholders(42) == frozenset()
+
+
+def test_flatten_sorts_dotted_keys():
+    flat = flatten({"b": {"y": "Y", "x": "X"}, "a": "A"})
+    assert flat.keys == ["a", "b.x", "b.y"]
+    assert flat.values == ["A", "X", "Y"]
+
+
+def test_compare_reports_missing_extra_and_placeholders():
+    reference = flatten({"common": {"ok": "OK", "count": "{{count}} items", "gone": "Gone"}})
+    target = flatten({"common": {"ok": "Vale", "count": "{{total}} elementos", "new": "Nuevo"}})
+
+    result = compare(reference, target, ParityResult(name="es.json"))
+
+    assert result.missing == ["common.gone"]
+    assert result.extra == ["common.new"]
+    assert result.placeholders == [("common.count", frozenset({"count"}), frozenset({"total"}))]
+    assert result.issues == 3 and not result.ok
+
+
+def test_placeholder_order_and_spacing_do_not_matter():
+    reference = flatten({"s": {"k": "{{a}} then {{b}}"}})
+    target = flatten({"s": {"k": "{{ b }} antes {{a}}"}})
+    assert compare(reference, target, ParityResult(name="es.json")).ok
+
+
+def test_patch_guard_checks_only_patched_keys(tmp_path):
+    for lang in ("en", "es", "pt-BR"):
+        # An existing gap elsewhere is not the patch's problem
+        data = {"common": {"ok": "OK"}, "other": {"only_en": "x"} if lang == "en" else {}}
+        (tmp_path / f"{lang}.json").write_text(serialize(data), encoding="utf-8")
+    patch = PatchSet.for_section("p", "common", {
+        "en": {"items": "{{count}} items"},
+        "es": {"items": "{{total}} elementos"},
+    })
+
+    assert check_patch_sets([patch], base_dir=tmp_path) == [
+        "common.items: missing in pt-BR",
+        "common.items: es placeholders ['total'] != ['count']",
+    ]
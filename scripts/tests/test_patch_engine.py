@@ -0,0 +1,74 @@
+from i18n_tools.common import canonical_hash, read_json, serialize
+from i18n_tools.patch_engine import FileResult, PatchSet, apply_to_file, merge_patch_sets
+
+
+def test_canonical_hash_ignores_key_order_and_whitespace():
+    assert canonical_hash({"a": 1, "b": {"c": "x", "d": "y"}}) == canonical_hash({"b": {"d": "y", "c": "x"}, "a": 1})
+    assert canonical_hash({"a": "x"}) != canonical_hash({"a": "y"})
+
+
+def test_merge_records_added_updated_and_created():
+    data = {"common": {"ok": "OK", "cancel": "Cancel"}}
+    first = PatchSet("first", {"en": {"common": {"ok": "Okay", "save": "Save"}}})
+    second = PatchSet.for_section("second", "orders", {"en": {"title": "Orders", "nested": {"a": "A"}},
+                                                        "es": {"title": "Órdenes"}})
+    result = FileResult("en", None)
+
+    merge_patch_sets(data, [first, second], "en", result)
+
+    assert data == {"common": {"ok": "Okay", "cancel": "Cancel", "save": "Save"},
+                    "orders": {"title": "Orders", "nested": {"a": "A"}}}
+    assert result.added == ["common.save", "orders.title", "orders.nested.a"]
+    assert result.updated == ["common.ok"]
+    assert result.created_sections == ["orders"]
+
+
+def test_later_patch_set_wins():
+    data = {}
+    patch_sets = [PatchSet("a", {"en": {"s": {"k": "first"}}}), PatchSet("b", {"en": {"s": {"k": "second"}}})]
+    merge_patch_sets(data, patch_sets, "en", FileResult("en", None))
+    assert data == {"s": {"k": "second"}}
+
+
+def test_apply_writes_only_on_content_change(tmp_path):
+    file_path = tmp_path / "en.json"
+    file_path.write_text(serialize({"common": {"ok": "OK"}}), encoding="utf-8")
+    unchanged = PatchSet("same", {"en": {"common": {"ok": "OK"}}})
+    changed = PatchSet("new", {"en": {"common": {"save": "Save"}}})
+
+    assert not apply_to_file(file_path, "en", [unchanged]).written
+    result = apply_to_file(file_path, "en", [changed])
+    assert result.written and result.ok
+    assert read_json(file_path) == {"common": {"ok": "OK", "save": "Save"}}
+
+
+def test_sorting_alone_rewrites_the_file(tmp_path):
+    file_path = tmp_path / "en.json"
+    file_path.write_text(serialize({"s": {"b": "B", "a": "A"}}), encoding="utf-8")
+
+    result = apply_to_file(file_path, "en", [PatchSet.for_section("sort", "s", {"en": {"a": "A"}}, sort=True)])
+
+    assert result.written
+    assert list(read_json(file_path)["s"]) == ["a", "b"]
+
+
+def test_budget_blocks_the_write(tmp_path):
+    file_path = tmp_path / "en.json"
+    original = serialize({"common": {"ok": "OK"}})
+    file_path.write_text(original, encoding="utf-8")
+
+    result = apply_to_file(file_path, "en", [PatchSet("big", {"en": {"common": {"long": "x" * 500}}})],
+                           budgets={"monolithic": {"max_bytes": 100}})
+
+    assert not result.ok and not result.written
+    assert file_path.read_text(encoding="utf-8") == original
+
+
+def test_parse_time_budget_is_not_enforced(tmp_path):
+    file_path = tmp_path / "en.json"
+    file_path.write_text(serialize({"common": {"ok": "OK"}}), encoding="utf-8")
+
+    result = apply_to_file(file_path, "en", [PatchSet("new", {"en": {"common": {"save": "Save"}}})],
+                           budgets={"monolithic": {"max_parse_ms": 0}})
+
+    assert result.ok and result.written
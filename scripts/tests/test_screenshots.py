@@ -0,0 +1,56 @@
+import hashlib
+
+from probe_tools.screenshots import ScreenshotPipeline
+
+
+def make_pipeline(tmp_path):
+    return ScreenshotPipeline(tmp_path / "shots", tmp_path / "baselines", workers=2)
+
+
+def test_duplicate_frame_resolves_to_first_file(tmp_path):
+    pipeline = make_pipeline(tmp_path)
+    first = pipeline.submit("p1", "flow", "01-open", b"frame-a")
+    second = pipeline.submit("p1", "flow", "02-again", b"frame-a")
+    results = pipeline.close()
+
+    assert first == second == pipeline.path_for("p1", "01-open")
+    assert second.read_bytes() == b"frame-a"
+    assert not pipeline.path_for("p1", "02-again").exists()
+    assert results[1].path == first
+    assert results[1].duplicate_of == first
+    assert results[0].duplicate_of is None
+
+
+def test_duplicate_frame_removes_stale_file(tmp_path):
+    pipeline = make_pipeline(tmp_path)
+    stale = pipeline.path_for("p1", "02-again")
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"from an earlier run")
+
+    pipeline.submit("p1", "flow", "01-open", b"frame-a")
+    pipeline.submit("p1", "flow", "02-again", b"frame-a")
+    pipeline.close()
+
+    assert not stale.exists()
+
+
+def test_overwritten_path_is_not_reused_for_old_bytes(tmp_path):
+    pipeline = make_pipeline(tmp_path)
+    pipeline.submit("p1", "flow", "01-open", b"frame-a")
+    pipeline.submit("p1", "flow", "01-open", b"frame-b")
+    third = pipeline.submit("p1", "flow", "02-again", b"frame-a")
+    results = pipeline.close()
+
+    assert third == pipeline.path_for("p1", "02-again")
+    assert third.read_bytes() == b"frame-a"
+    assert pipeline.path_for("p1", "01-open").read_bytes() == b"frame-b"
+    assert results[1].digest == hashlib.sha256(b"frame-b").hexdigest()
+
+
+def test_writes_to_one_path_keep_submission_order(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path / "shots", tmp_path / "baselines", workers=4)
+    for i in range(50):
+        pipeline.submit("p1", "flow", "01-open", b"frame-%d" % i + b"x" * 200000)
+    pipeline.close()
+
+    assert pipeline.path_for("p1", "01-open").read_bytes().startswith(b"frame-49x")
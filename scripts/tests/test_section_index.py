@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from i18n_tools import section_index
+from i18n_tools.common import read_json, serialize
+from i18n_tools.patch_engine import PatchSet, splice_to_file
+from i18n_tools.section_index import SectionIndexError, build_index, can_splice, splice_sections
+
+DATA = {"common": {"ok": "OK", "cancel": "Cancelar"}, "orders": {"title": "Órdenes"}, "version": "1.0"}
+
+
+def sections(index):
+    return [(s.name, s.key_start, s.value_start, s.value_end) for s in index.sections]
+
+
+def test_index_spans_decode_to_sections():
+    raw = serialize(DATA).encode("utf-8")
+    index = build_index(raw)
+    assert [s.name for s in index.sections] == list(DATA)
+    for section in index.sections:
+        assert json.loads(raw[section.value_start:section.value_end]) == DATA[section.name]
+    assert raw[index.root_end:index.root_end + 1] == b"}"
+
+
+def test_splice_round_trip_matches_full_serialize():
+    raw = serialize(DATA).encode("utf-8")
+    updates = {"orders": {"title": "Pedidos", "empty": "Sin pedidos"}, "new_section": {"x": "ü"}}
+
+    out, index = splice_sections(raw, build_index(raw), updates)
+
+    assert out == serialize({**DATA, **updates}).encode("utf-8")
+    assert sections(index) == sections(build_index(out))
+    assert index.root_end == build_index(out).root_end
+
+
+def test_splice_keeps_crlf_and_bom():
+    raw = b"\xef\xbb\xbf" + serialize(DATA).replace("\n", "\r\n").encode("utf-8")
+    out, index = splice_sections(raw, build_index(raw), {"common": {"ok": "Vale"}})
+
+    assert out.startswith(b"\xef\xbb\xbf")
+    assert b"\n" not in out.replace(b"\r\n", b"")
+    assert json.loads(out[3:])["common"] == {"ok": "Vale"}
+    assert sections(index) == sections(build_index(out))
+
+
+def test_splice_into_empty_root():
+    out, index = splice_sections(b"{}\n", build_index(b"{}\n"), {"common": {"ok": "OK"}})
+    assert json.loads(out) == {"common": {"ok": "OK"}}
+    assert [s.name for s in index.sections] == ["common"]
+
+
+def test_non_object_is_rejected():
+    with pytest.raises(SectionIndexError):
+        build_index(b"[1, 2]")
+
+
+def test_compact_file_is_not_spliceable():
+    raw = b'{"a":{"x":"1"},"b":{"y":"2"}}'
+    assert not can_splice(raw, build_index(raw))
+    assert can_splice(serialize(DATA).encode("utf-8"), build_index(serialize(DATA).encode("utf-8")))
+
+
+def test_splice_to_file_rewrites_compact_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(section_index, "INDEX_CACHE_DIR", tmp_path / "index")
+    file_path = tmp_path / "en.json"
+    file_path.write_bytes(b'{"a":{"x":"1"},"b":{"y":"2"}}')
+    patch = PatchSet("p", {"en": {"b": {"z": "3"}, "c": {"w": "4"}}})
+
+    result = splice_to_file(file_path, "en", [patch])
+
+    assert result.ok and result.written
+    assert read_json(file_path) == {"a": {"x": "1"}, "b": {"y": "2", "z": "3"}, "c": {"w": "4"}}
@@ -0,0 +1,35 @@
+from probe_tools.soak import Sample, analyze_gauge, build_soak_report, flagged_gauges
+
+
+def samples(values, gauge="Nodes"):
+    return [Sample(float(i), i, {"JSHeapUsedSize": 0.0, "Nodes": 0.0, "JSEventListeners": 0.0,
+                                 "Documents": 0.0, gauge: float(v)}) for i, v in enumerate(values)]
+
+
+def test_steady_climb_is_flagged():
+    result = analyze_gauge(samples([1000 + 50 * i for i in range(20)]), "Nodes")
+    assert result["monotonic"]
+    assert result["flagged"]
+    assert result["per_100_cycles"] == 5000.0
+
+
+def test_sawtooth_without_growth_is_not_flagged():
+    result = analyze_gauge(samples([1000, 1400, 1000, 1400] * 5), "Nodes")
+    assert result["rise"] == 0
+    assert not result["flagged"]
+
+
+def test_growth_below_floor_is_not_flagged():
+    # Monotonic, but 50 nodes is under the 100-node floor
+    result = analyze_gauge(samples([1000 + 5 * i for i in range(10)]), "Nodes")
+    assert result["monotonic"]
+    assert not result["flagged"]
+
+
+def test_too_few_samples():
+    assert analyze_gauge(samples([1, 2, 3]), "Nodes") == {"samples": 3, "flagged": False, "note": "too few samples"}
+
+
+def test_report_lists_flagged_gauges():
+    report = build_soak_report(samples([1000 + 50 * i for i in range(20)]), [10.0] * 19, {})
+    assert flagged_gauges(report) == ["Nodes"]
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from i18n_tools.string_table import build_string_table, decode, encode_sections, measure_savings
+
+SECTIONS = {
+    "orders": {"status": "Pending review", "title": "Orders", "filters": {"status": "Pending review"}},
+    "services": {"status": "Pending review", "title": "Services"},
+    "sales": {"title": "Orders", "note": "x", "other": "x"},
+}
+
+
+def test_table_holds_only_values_worth_interning():
+    table = build_string_table(SECTIONS)
+    # "Pending review" (3x) and "Orders" (2x) pay for a slot; a repeated "x" does not
+    assert table == ["Pending review", "Orders"]
+
+
+def test_encode_decode_round_trip():
+    table, compact = encode_sections(SECTIONS)
+    assert compact["orders"]["status"] == 0
+    assert compact["sales"]["note"] == "x"
+
+    restored = json.loads(json.dumps(compact))
+    assert {ns: decode(value, table) for ns, value in restored.items()} == SECTIONS
+
+
+def test_savings_per_namespace():
+    savings, table_bytes = measure_savings(SECTIONS)
+    assert [s.namespace for s in savings] == ["orders", "sales", "services"]
+    assert all(s.saved >= 0 for s in savings)
+    assert table_bytes == len(json.dumps(["Pending review", "Orders"], separators=(",", ":")))
+
+
+def test_non_string_leaves_are_rejected():
+    with pytest.raises(ValueError):
+        build_string_table({"broken": {"count": 3}})
@@ -0,0 +1,70 @@
+import json
+
+from i18n_tools.common import LANGUAGES, read_json, serialize
+from i18n_tools.watcher import TranslationDaemon
+
+
+def make_daemon(tmp_path, monolithic):
+    base = tmp_path / "translations"
+    base.mkdir()
+    for lang in LANGUAGES:
+        (base / f"{lang}.json").write_text(serialize(monolithic), encoding="utf-8")
+    daemon = TranslationDaemon(base_dir=base, out_dir=base / "_compiled", queue_dir=tmp_path / "queue")
+    daemon.start()
+    return daemon, base
+
+
+def remove_section(daemon, base, monolithic, namespace):
+    for lang in LANGUAGES:
+        edited = {k: v for k, v in monolithic.items() if k != namespace}
+        (base / f"{lang}.json").write_text(serialize(edited), encoding="utf-8")
+    return daemon.handle(base / f"{lang}.json" for lang in LANGUAGES)
+
+
+def manifest(base):
+    return json.loads((base / "_compiled" / "manifest.json").read_text(encoding="utf-8"))
+
+
+def test_removed_section_creates_no_split_file(tmp_path):
+    monolithic = {"common": {"ok": "OK"}, "legacy": {"old": "Old"}}
+    daemon, base = make_daemon(tmp_path, monolithic)
+
+    rebuilds = remove_section(daemon, base, monolithic, "legacy")
+
+    assert not (base / "en" / "legacy.json").exists()
+    assert all(r.error is None for r in rebuilds)
+    assert "legacy" not in daemon.sources["en"]
+    assert "legacy" not in manifest(base)["languages"]["en"]
+    assert "legacy" not in manifest(base)["languages"]["es"]
+    assert not list((base / "_compiled" / "en").glob("legacy.*"))
+
+
+def test_removed_section_keeps_split_only_keys(tmp_path):
+    monolithic = {"common": {"ok": "OK"}, "legacy": {"old": "Old", "nested": {"a": "A"}}}
+    daemon, base = make_daemon(tmp_path, monolithic)
+    split = base / "en" / "legacy.json"
+    split.parent.mkdir()
+    split.write_text(serialize({"old": "Old", "nested": {"a": "A", "b": "B"}, "extra": "Extra"}),
+                     encoding="utf-8")
+    daemon.start()
+
+    remove_section(daemon, base, monolithic, "legacy")
+
+    assert read_json(split) == {"nested": {"b": "B"}, "extra": "Extra"}
+    assert daemon.sources["en"]["legacy"] == {"nested": {"b": "B"}, "extra": "Extra"}
+    assert "legacy" in manifest(base)["languages"]["en"]
+
+
+def test_removed_section_deletes_emptied_split_file(tmp_path):
+    monolithic = {"common": {"ok": "OK"}, "legacy": {"old": "Old"}}
+    daemon, base = make_daemon(tmp_path, monolithic)
+    split = base / "en" / "legacy.json"
+    split.parent.mkdir()
+    split.write_text(serialize({"old": "Old"}), encoding="utf-8")
+    daemon.start()
+
+    rebuilds = remove_section(daemon, base, monolithic, "legacy")
+
+    assert not split.exists()
+    assert "legacy" not in manifest(base)["languages"]["en"]
+    assert "en/legacy" in [name for r in rebuilds for name in r.dropped]
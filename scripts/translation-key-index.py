@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Query the incremental translation key usage index
+
+The index (.cache/i18n/key-index.json) maps every t('...') / i18nKey lookup in
+src/ to its file and line. Each run only rescans files that changed since the
+last one, so queries are near-instant after the first build.
+
+Usage:
+  python scripts/translation-key-index.py who-uses vin_scanner_hub.scan
+  python scripts/translation-key-index.py who-uses 'vin_scanner_hub.*'
+  python scripts/translation-key-index.py missing es
+  python scripts/translation-key-index.py stats
+  python scripts/translation-key-index.py --rebuild stats
+"""
+
+import argparse
+import sys
+import time
+
+from i18n_tools.common import LANGUAGES
+from i18n_tools.compiler import SOURCES, load_source
+from i18n_tools.key_index import INDEX_PATH, load_index, missing_keys
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translation key usage index")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the cached index and rescan everything")
+    parser.add_argument("--no-refresh", action="store_true", help="Query the cached index without checking for changes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    who = sub.add_parser("who-uses", help="Where a key is looked up ('ns.*' for a whole subtree)")
+    who.add_argument("key")
+
+    missing = sub.add_parser("missing", help="Keys the source uses that a language does not define")
+    missing.add_argument("lang", choices=LANGUAGES)
+    missing.add_argument("--source", choices=SOURCES, default="merged", help="Translation source to check against")
+
+    sub.add_parser("stats", help="Index size and refresh timing")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    if args.rebuild and INDEX_PATH.exists():
+        INDEX_PATH.unlink()
+
+    started = time.perf_counter()
+    index, stats = load_index(refresh=not args.no_refresh)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.command == "who-uses":
+        hits = index.who_uses(args.key)
+        dynamic = [] if args.key.endswith(".*") else index.dynamic_matches(args.key)
+        for path, line in hits:
+            print(f"{path}:{line}")
+        for path, line, prefix in dynamic:
+            print(f"{path}:{line}  (dynamic: {prefix}${{...}})")
+        if not hits and not dynamic:
+            print(f"[WARN] No usages of {args.key}")
+            return 1
+        return 0
+
+    if args.command == "missing":
+        missing = missing_keys(index, load_source(args.lang, source=args.source))
+        for key, locations in missing.items():
+            path, line = locations[0]
+            more = f" (+{len(locations) - 1} more)" if len(locations) > 1 else ""
+            print(f"{key}  {path}:{line}{more}")
+        print()
+        print(f"{len(missing)} key(s) missing in {args.lang}")
+        return 1 if missing else 0
+
+    print("=" * 60)
+    print("Translation Key Index")
+    print("=" * 60)
+    print(f"Files indexed:  {len(index.files)}")
+    print(f"Distinct keys:  {len(index.inverted)}")
+    print(f"Dynamic lookups: {sum(len(e.dynamic) for e in index.files.values())}")
+    print(f"Refresh: {stats.scanned} rescanned, {stats.unchanged} unchanged, "
+          f"{stats.removed} removed in {elapsed:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
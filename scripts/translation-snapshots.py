@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Translation snapshot history and rollback
+
+Patch runs record the translation files in a content-addressed store under
+.cache/i18n/snapshots; unchanged sections are shared between snapshots, so
+each one only costs the sections that changed.
+
+Usage:
+  python scripts/translation-snapshots.py list
+  python scripts/translation-snapshots.py take "before manual edit"
+  python scripts/translation-snapshots.py rollback 3f9c2a1b --dry-run
+  python scripts/translation-snapshots.py rollback 3f9c2a1b --file es.json
+  python scripts/translation-snapshots.py import-backups   # *.json.backup*, _backup_monolithic/
+"""
+
+import argparse
+import sys
+
+from i18n_tools.snapshots import SnapshotStore
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translation snapshot store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="Show snapshot history (oldest first)")
+
+    take = sub.add_parser("take", help="Snapshot the current translation files")
+    take.add_argument("label", nargs="?", default="manual snapshot")
+
+    rollback = sub.add_parser("rollback", help="Restore files from a snapshot")
+    rollback.add_argument("snapshot_id", help="Snapshot id (any unique prefix)")
+    rollback.add_argument("--file", action="append", dest="files", default=[],
+                          help="Only restore this file, relative to public/translations (repeatable)")
+    rollback.add_argument("--dry-run", action="store_true", help="Only list the files that would change")
+
+    sub.add_parser("import-backups", help="Record the legacy .backup files as snapshots")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    store = SnapshotStore()
+
+    print("=" * 60)
+    print("Translation Snapshots")
+    print("=" * 60)
+    print()
+
+    if args.command == "list":
+        history = store.history()
+        for snapshot in history:
+            print(f"{snapshot.id}  {snapshot.time}  {len(snapshot.files):>4} files  {snapshot.label}")
+        count, size = store.usage()
+        print()
+        print(f"{len(history)} snapshots, {count} objects, {size / 1024:.1f} KB on disk")
+        return 0
+
+    if args.command == "take":
+        snapshot = store.capture(args.label)
+        if snapshot is None:
+            print("[OK] Nothing changed since the last snapshot")
+        else:
+            print(f"[OK] Snapshot {snapshot.id}: {snapshot.label}")
+        return 0
+
+    if args.command == "import-backups":
+        imported = store.import_backups()
+        for snapshot in imported:
+            print(f"[OK] Snapshot {snapshot.id}: {snapshot.label} ({', '.join(snapshot.files)})")
+        if not imported:
+            print("[OK] No new backups to import")
+        return 0
+
+    try:
+        changed = store.rollback(args.snapshot_id, args.files, dry_run=args.dry_run)
+    except KeyError as e:
+        print(f"[ERROR] {e.args[0]}")
+        return 1
+
+    for rel_path in changed:
+        print(f"  ~ {'Would restore' if args.dry_run else 'Restored'}: {rel_path}")
+    print()
+    print("=" * 60)
+    print(f"COMPLETE: {len(changed)} file(s) {'would be ' if args.dry_run else ''}restored")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Watch translation sources and rebuild incrementally
+
+Watches public/translations/{en,es,pt-BR}.json and the patch queue
+(scripts/translation-patches/). Editing a section re-syncs only that
+namespace's split file, re-emits only that namespace into _compiled/ and
+rewrites the manifest - typically well under 100 ms - so the dev server
+serves the change on the next request. Saving a patch definition applies it.
+
+Uses inotify on Linux and falls back to polling elsewhere (or with --poll).
+
+Usage:
+  python scripts/watch-translations.py
+  python scripts/watch-translations.py --poll --interval 0.5
+  python scripts/watch-translations.py --precompress
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from i18n_tools.compiler import COMPILED_DIR
+from i18n_tools.watcher import InotifyWatcher, TranslationDaemon, make_watcher
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Incremental translation watch mode")
+    parser.add_argument("--out", type=Path, default=COMPILED_DIR, help="Output directory")
+    parser.add_argument("--poll", action="store_true", help="Poll file stats instead of using inotify")
+    parser.add_argument("--interval", type=float, default=0.25, help="Polling interval in seconds")
+    parser.add_argument("--precompress", action="store_true", help="Also write .gz/.br siblings")
+    return parser.parse_args()
+
+
+def print_rebuild(rebuild):
+    stamp = time.strftime("%H:%M:%S")
+    name = rebuild.trigger.name
+    if rebuild.error:
+        print(f"[{stamp}] [ERROR] {name}: {rebuild.error}")
+        return
+    for patch_name in rebuild.patched:
+        print(f"[{stamp}] [OK] Applied patch set {patch_name} in {rebuild.elapsed_ms:.0f} ms")
+    if rebuild.sections:
+        sections = ", ".join(f"{lang}/{ns}" for lang, ns in rebuild.sections)
+        print(f"[{stamp}] [OK] {name}: {sections} -> {len(rebuild.synced)} split, "
+              f"{len(rebuild.emitted)} compiled in {rebuild.elapsed_ms:.0f} ms")
+    for namespace in rebuild.dropped:
+        print(f"[{stamp}] [OK] {namespace}: nothing left, removed from the manifest")
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    print("=" * 60)
+    print("Translation Watch Mode")
+    print("=" * 60)
+    print()
+
+    daemon = TranslationDaemon(out_dir=args.out, precompress=args.precompress)
+    started = time.perf_counter()
+    try:
+        summary = daemon.start()
+    except Exception as e:
+        print(f"[ERROR] Initial build failed: {e}")
+        return 1
+    namespaces = sum(len(entries) for entries in summary["manifest"]["languages"].values())
+    print(f"[OK] Initial build: {namespaces} namespaces in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    if args.poll:
+        watcher = make_watcher(daemon.watched_directories(), poll=True)
+        watcher.interval = args.interval
+    else:
+        watcher = make_watcher(daemon.watched_directories())
+    mode = "inotify" if isinstance(watcher, InotifyWatcher) else f"polling every {watcher.interval}s"
+    print(f"[OK] Watching {', '.join(str(d) for d in daemon.watched_directories())} ({mode})")
+    print("  Press Ctrl+C to stop")
+    print()
+
+    try:
+        daemon.run(watcher, on_rebuild=print_rebuild)
+    except KeyboardInterrupt:
+        print()
+        print("[OK] Stopped")
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
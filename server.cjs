@@ -5,6 +5,7 @@
  */
 
 const express = require('express');
+const fs = require('fs');
 const path = require('path');
 const compression = require('compression');
 
@@ -37,6 +38,36 @@ app.use('/models', (req, res, next) => {
   next();
 });
 
+// Compiled translation bundles (scripts/compile-translations.py): content-hashed,
+// so cache forever, and serve the precompressed .br/.gz siblings when accepted
+const COMPILED_TRANSLATIONS_DIR = path.join(DIST_DIR, 'translations', '_compiled');
+app.use('/translations/_compiled', (req, res, next) => {
+  if (req.path === '/manifest.json') {
+    res.set('Cache-Control', 'no-cache');
+    return next();
+  }
+  if (!req.path.endsWith('.json')) {
+    return next();
+  }
+  res.set({
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'Vary': 'Accept-Encoding'
+  });
+  const accepted = req.headers['accept-encoding'] || '';
+  for (const [encoding, suffix] of [['br', '.br'], ['gzip', '.gz']]) {
+    const file = path.join(COMPILED_TRANSLATIONS_DIR, req.path + suffix);
+    if (!file.startsWith(COMPILED_TRANSLATIONS_DIR + path.sep) || !accepted.includes(encoding) || !fs.existsSync(file)) {
+      continue;
+    }
+    res.set({
+      'Content-Type': 'application/json; charset=utf-8',
+      'Content-Encoding': encoding
+    });
+    return res.sendFile(file);
+  }
+  next();
+});
+
 // Serve static files from dist/
 app.use(express.static(DIST_DIR, {
   maxAge: '1y',
@@ -91,6 +91,9 @@ const PRELOAD_NAMESPACES = ALL_NAMESPACES; // Load all 82 on init
 // Track if initial language is being loaded
 let initialLanguageLoading: Promise<any> | null = null;
 
+// Settles once the runtime fallback languages are known (and loaded, where still needed)
+let fallbacksReady: Promise<unknown> = Promise.resolve();
+
 // 🔴 CRITICAL FIX: Retry fetch with exponential backoff
 // ✅ PERFORMANCE FIX: Enable browser cache (5 minutes) to reduce network requests
 const fetchWithRetry = async (url: string, maxRetries = 2): Promise<Response> => {
@@ -248,51 +251,10 @@ const loadLanguageMonolithic = async (language: string) => {
     if (language !== 'en') {
       console.warn(`⚠️ Attempting fallback to English...`);
       try {
-        const fallbackResponse = await fetchWithRetry(`/translations/en.json?v=${TRANSLATION_VERSION}`);
-
-        if (!fallbackResponse.ok) {
-          throw new Error(`HTTP ${fallbackResponse.status}: ${fallbackResponse.statusText}`);
-        }
-
-        const fallbackText = await fallbackResponse.text();
-
-        if (!fallbackText.trim()) {
-          throw new Error('Empty fallback response received');
-        }
-
-        let fallbackTranslations;
-        try {
-          fallbackTranslations = JSON.parse(fallbackText);
-        } catch (parseError) {
-          console.error(`JSON parse error in fallback en.json:`, parseError);
-          throw new Error(`Invalid JSON in fallback en.json: ${parseError.message}`);
-        }
-
-        // Add English as fallback resource
-        if (!i18n.hasResourceBundle('en', 'translation')) {
-          i18n.addResourceBundle('en', 'translation', fallbackTranslations);
-        }
-
-        // Cache the English fallback
-        const fallbackCacheKey = `${TRANSLATION_CACHE_KEY}_en`;
-        const fallbackCacheData: CachedTranslations = {
-          translations: fallbackTranslations,
-          timestamp: Date.now(),
-          version: TRANSLATION_VERSION
-        };
-
-        const storageAvailable = isStorageAvailable('sessionStorage');
-        if (storageAvailable) {
-          try {
-            sessionStorage.setItem(fallbackCacheKey, JSON.stringify(fallbackCacheData));
-            console.log(`💾 English fallback cached in sessionStorage`);
-          } catch (storageError) {
-            memoryCache.set(fallbackCacheKey, fallbackCacheData);
-            console.log(`💾 English fallback cached in memory`);
-          }
-        } else {
-          memoryCache.set(fallbackCacheKey, fallbackCacheData);
-          console.log(`💾 English fallback cached in memory [storage unavailable]`);
+        // Same loader (and cache) as a regular English load
+        const fallbackTranslations = await loadLanguageMonolithic('en');
+        if (!fallbackTranslations) {
+          throw new Error('English translations unavailable');
         }
 
         // Switch to English
@@ -309,6 +271,46 @@ const loadLanguageMonolithic = async (language: string) => {
   }
 };
 
+// ============================================================
+// COMPILED BUNDLES (scripts/compile-translations.py, run by prebuild)
+// ============================================================
+
+// Minified namespace files with content-hashed names, listed in _compiled/manifest.json.
+// A name changes whenever its content does, so these can be cached indefinitely.
+// Dev server or a build without the manifest: the raw {lng}/{ns}.json files are used.
+const COMPILED_BASE = '/translations/_compiled/';
+
+interface CompiledManifest {
+  languages?: Record<string, Record<string, { file: string }>>;
+  string_tables?: Record<string, unknown>;
+  fallbacks?: Record<string, string[]>;
+}
+
+const compiledManifest: Promise<CompiledManifest | null> = USE_CODE_SPLITTING && !import.meta.env.DEV
+  ? fetch(`${COMPILED_BASE}manifest.json`, { cache: 'no-cache' })
+      .then(response => (response.ok ? response.json() : null))
+      .catch(() => null)
+  : Promise.resolve(null);
+
+const namespaceUrl = async (lng: string, ns: string): Promise<string> => {
+  const manifest = await compiledManifest;
+  // String-table builds store values by index; only plain namespace files are read here
+  const entry = manifest && !manifest.string_tables?.[lng] ? manifest.languages?.[lng]?.[ns] : undefined;
+  return entry ? COMPILED_BASE + entry.file : `/translations/${lng}/${ns}.json?v=${TRANSLATION_VERSION}`;
+};
+
+// es/pt-BR bundles compiled with their English fallback already filled in (manifest "fallbacks")
+// need no runtime fallback, so English is not downloaded alongside them. The dev server, raw files
+// (string-table builds, no manifest) and --sync-split builds skip the build-time fallback and keep it.
+const COMPILED_IN_USE = USE_CODE_SPLITTING && !import.meta.env.DEV;
+let resolvedFallbacks: Record<string, string[]> | null = null; // null until the manifest is read
+
+const fallbackLanguages = (code: string): string[] => {
+  // Production builds resolve fallbacks, so assume it until the manifest says otherwise
+  if (COMPILED_IN_USE && (resolvedFallbacks === null || resolvedFallbacks[code])) return [];
+  return ['en'];
+};
+
 // ============================================================
 // INITIALIZATION: Choose strategy based on feature flag
 // ============================================================
@@ -325,16 +327,26 @@ if (USE_CODE_SPLITTING) {
     .use(initReactI18next)
     .init({
       lng: getSavedLanguage(),
-      fallbackLng: 'en',
+      fallbackLng: fallbackLanguages,
       ns: PRELOAD_NAMESPACES, // Preload these namespaces
       defaultNS: DEFAULT_NAMESPACE,
       fallbackNS: DEFAULT_NAMESPACE,
 
       backend: {
-        loadPath: '/translations/{{lng}}/{{ns}}.json?v=' + TRANSLATION_VERSION,
-        requestOptions: {
-          cache: 'no-store',
-          headers: { 'Cache-Control': 'no-cache, no-store, must-revalidate' }
+        loadPath: (lngs: string[], namespaces: string[]) => namespaceUrl(lngs[0], namespaces[0]),
+        // Hashed compiled files may use the browser cache; raw files must always be fresh
+        request: (
+          _options: unknown,
+          url: string,
+          _payload: unknown,
+          callback: (error: unknown, response: { status: number; data: string }) => void
+        ) => {
+          const init: RequestInit = url.startsWith(COMPILED_BASE)
+            ? { cache: 'default' }
+            : { cache: 'no-store', headers: { 'Cache-Control': 'no-cache, no-store, must-revalidate' } };
+          fetch(url, init)
+            .then(async response => callback(null, { status: response.status, data: await response.text() }))
+            .catch(error => callback(error, { status: 0, data: '' }));
         }
       },
 
@@ -362,6 +374,17 @@ if (USE_CODE_SPLITTING) {
     console.log(`⚡ Preloading ${PRELOAD_NAMESPACES.length} namespaces`);
   }
 
+  // A language the build did not resolve (or served from raw files) still needs English behind it
+  fallbacksReady = compiledManifest.then(manifest => {
+    resolvedFallbacks = {};
+    for (const [lng, chain] of Object.entries(manifest?.fallbacks ?? {})) {
+      if (!manifest?.string_tables?.[lng]) resolvedFallbacks[lng] = chain;
+    }
+    const lng = i18n.language || getSavedLanguage();
+    const missing = fallbackLanguages(lng).filter(code => code !== lng);
+    return missing.length ? i18n.loadLanguages(missing) : undefined;
+  });
+
 } else {
   // Only log in development
   if (import.meta.env.DEV) {
@@ -399,6 +422,7 @@ export const waitForInitialTranslations = async () => {
     const startTime = Date.now();
 
     // With Backend, i18next handles loading automatically
+    await fallbacksReady;
     await i18n.loadNamespaces(PRELOAD_NAMESPACES);
 
     // 🔴 CRITICAL FIX: Wait for resources to be actually added
@@ -451,6 +475,9 @@ export const changeLanguage = async (language: string) => {
   if (!USE_CODE_SPLITTING) {
     // Legacy system - manual loading
     await loadLanguageMonolithic(language);
+  } else {
+    // The new language's fallbacks depend on the manifest
+    await fallbacksReady;
   }
 
   // Both systems use i18n.changeLanguage
@@ -33,6 +33,26 @@ const navigationRoute = new NavigationRoute(navigationHandler, {
 });
 registerRoute(navigationRoute);
 
+// Compiled translation bundles (/translations/_compiled/<lng>/<ns>.<hash>.json) are
+// content-hashed: a cached copy can never be stale, so serve it without the network.
+// Registered first so it wins over the NetworkFirst route below; manifest.json
+// has no hash and stays NetworkFirst.
+registerRoute(
+  /\/translations\/_compiled\/.+\.[0-9a-f]{10}\.json$/,
+  new CacheFirst({
+    cacheName: 'translations-compiled',
+    plugins: [
+      new ExpirationPlugin({
+        maxEntries: 400, // ~82 namespaces x 3 languages, plus the previous release
+        maxAgeSeconds: 60 * 60 * 24 * 30,
+      }),
+      new CacheableResponsePlugin({
+        statuses: [200],
+      }),
+    ],
+  })
+);
+
 // 🔴 CRITICAL FIX: Cache translation JSON files with NetworkFirst
 // ALWAYS tries network first (fresh translations)
 // Falls back to cache only if network fails